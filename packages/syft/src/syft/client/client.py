@@ -6,6 +6,7 @@ import base64
 from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Iterator
 from enum import Enum
 from getpass import getpass
 import json
@@ -18,6 +19,7 @@ from typing import cast
 from argon2 import PasswordHasher
 from cachetools import TTLCache
 from cachetools import cached
+from pydantic import PrivateAttr
 from pydantic import field_validator
 import requests
 from requests import Response
@@ -115,6 +117,9 @@ def forward_message_to_proxy(
 
 
 API_PATH = "/api/v2"
+# routing envelope of API calls: gateways pass calls for the server in this
+# header on to it as they are, without deserializing them
+SERVER_UID_HEADER = "X-Syft-Server-Uid"
 DEFAULT_SYFT_UI_PORT = 80
 DEFAULT_SYFT_UI_ADDRESS = f"http://localhost:{DEFAULT_SYFT_UI_PORT}"
 INTERNAL_PROXY_TO_RATHOLE = "http://proxy:80/rtunnel/"
@@ -132,6 +137,24 @@ class Routes(Enum):
     STREAM = f"{API_PATH}/stream"
 
 
+class SizedStream:
+    """Chunks of a body whose size is known up front.
+
+    requests sends iterables that have a length with a Content-Length header,
+    other iterables are sent with chunked transfer encoding.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], size: int) -> None:
+        self.chunks = chunks
+        self.size = size
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+    def __len__(self) -> int:
+        return self.size
+
+
 @serializable(attrs=["proxy_target_uid", "url", "rtunnel_token"])
 class HTTPConnection(ServerConnection):
     __canonical_name__ = "HTTPConnection"
@@ -143,6 +166,8 @@ class HTTPConnection(ServerConnection):
     session_cache: Session | None = None
     headers: dict[str, str] | None = None
     rtunnel_token: str | None = None
+    # seconds to wait for the server to connect or answer, None to wait forever
+    _timeout: float | None = PrivateAttr(default=None)
 
     @field_validator("url", mode="before")
     @classmethod
@@ -156,12 +181,17 @@ class HTTPConnection(ServerConnection):
     def set_headers(self, headers: dict[str, str]) -> None:
         self.headers = headers
 
+    def set_timeout(self, timeout: float | None) -> None:
+        self._timeout = timeout
+
     def with_proxy(self, proxy_target_uid: UID) -> Self:
-        return HTTPConnection(
+        connection = HTTPConnection(
             url=self.url,
             proxy_target_uid=proxy_target_uid,
             rtunnel_token=self.rtunnel_token,
         )
+        connection.set_timeout(self._timeout)
+        return connection
 
     def stream_via(self, proxy_uid: UID, url_path: str) -> ServerURL:
         # Update the presigned url path to
@@ -211,6 +241,7 @@ class HTTPConnection(ServerConnection):
 
         response = self.session.get(
             str(url),
+            timeout=self._timeout,
             headers=self.headers,
             verify=verify_tls(),
             proxies={},
@@ -240,6 +271,7 @@ class HTTPConnection(ServerConnection):
 
         response = self.session.get(
             str(url),
+            timeout=self._timeout,
             headers=self.headers,
             verify=verify_tls(),
             proxies={},
@@ -259,9 +291,18 @@ class HTTPConnection(ServerConnection):
         return response.content
 
     def _make_put(
-        self, path: str, data: bytes | Generator, stream: bool = False
+        self,
+        path: str,
+        data: bytes | Generator,
+        stream: bool = False,
+        content_length: int | None = None,
     ) -> Response:
+        """PUT `data` to `path`. A generator is sent in chunks, unless its total
+        size is given as `content_length`."""
         url = self.url
+        body: bytes | Iterable[bytes] = data
+        if content_length is not None and not isinstance(data, bytes):
+            body = SizedStream(data, content_length)
 
         if self.rtunnel_token:
             url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
@@ -271,9 +312,10 @@ class HTTPConnection(ServerConnection):
         url = url.with_path(path)
         response = self.session.put(
             str(url),
+            timeout=self._timeout,
             verify=verify_tls(),
             proxies={},
-            data=data,
+            data=body,
             headers=self.headers,
             stream=stream,
         )
@@ -303,6 +345,7 @@ class HTTPConnection(ServerConnection):
         url = url.with_path(path)
         response = self.session.post(
             str(url),
+            timeout=self._timeout,
             headers=self.headers,
             verify=verify_tls(),
             json=json,
@@ -331,7 +374,7 @@ class HTTPConnection(ServerConnection):
     ) -> ServerMetadataJSON | SyftError:
         if self.proxy_target_uid:
             response = forward_message_to_proxy(
-                make_call=self.make_call,
+                make_call=self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="metadata",
                 credentials=credentials,
@@ -354,7 +397,7 @@ class HTTPConnection(ServerConnection):
         }
         if self.proxy_target_uid:
             obj = forward_message_to_proxy(
-                self.make_call,
+                self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="api",
                 kwargs={
@@ -382,7 +425,7 @@ class HTTPConnection(ServerConnection):
         credentials = {"email": email, "password": password}
         if self.proxy_target_uid:
             obj = forward_message_to_proxy(
-                self.make_call,
+                self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="login",
                 kwargs=credentials,
@@ -400,7 +443,7 @@ class HTTPConnection(ServerConnection):
         credentials = {"email": email}
         if self.proxy_target_uid:
             obj = forward_message_to_proxy(
-                self.make_call,
+                self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="forgot_password",
                 kwargs=credentials,
@@ -421,7 +464,7 @@ class HTTPConnection(ServerConnection):
         payload = {"token": token, "new_password": new_password}
         if self.proxy_target_uid:
             obj = forward_message_to_proxy(
-                self.make_call,
+                self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="reset_password",
                 kwargs=payload,
@@ -436,7 +479,7 @@ class HTTPConnection(ServerConnection):
         data = _serialize(new_user, to_bytes=True)
         if self.proxy_target_uid:
             response = forward_message_to_proxy(
-                self.make_call,
+                self.make_gateway_call,
                 proxy_target_uid=self.proxy_target_uid,
                 path="register",
                 kwargs={"new_user": new_user},
@@ -447,8 +490,35 @@ class HTTPConnection(ServerConnection):
         return response
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
+        headers = None
+        if self.proxy_target_uid is not None:
+            headers = {SERVER_UID_HEADER: self.proxy_target_uid.no_dash}
         msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        result = _deserialize(self.post_api_call(msg_bytes, headers), from_bytes=True)
 
+        if self.proxy_target_uid is not None and isinstance(result, SignedSyftAPICall):
+            # relative
+            from ..store.blob_storage import BlobRetrievalByURL
+            from ..store.blob_storage.seaweedfs import SeaweedFSBlobDeposit
+
+            # blobs of the server are streamed through the gateway too
+            data = result.message.data
+            if (
+                isinstance(data, BlobRetrievalByURL | SeaweedFSBlobDeposit)
+                and data.proxy_server_uid is None
+            ):
+                data.proxy_server_uid = self.proxy_target_uid
+        return result
+
+    def make_gateway_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
+        """Call the gateway answers itself for the server behind it, like login."""
+        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        return _deserialize(self.post_api_call(msg_bytes), from_bytes=True)
+
+    def post_api_call(
+        self, data: bytes, headers: dict[str, str] | None = None
+    ) -> bytes:
+        """Post a serialized API call, returns the serialized result."""
         if self.rtunnel_token:
             api_url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
             api_url = api_url.with_path(self.routes.ROUTE_API_CALL.value)
@@ -459,8 +529,9 @@ class HTTPConnection(ServerConnection):
 
         response = requests.post(  # nosec
             url=api_url,
-            data=msg_bytes,
-            headers=self.headers,
+            data=data,
+            headers={**(self.headers or {}), **(headers or {})},
+            timeout=self._timeout,
         )
 
         if response.status_code != 200:
@@ -468,8 +539,7 @@ class HTTPConnection(ServerConnection):
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
-        return result
+        return response.content
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}: {self.url}"
@@ -1104,6 +1174,7 @@ def connect(
     url: str | ServerURL = DEFAULT_SYFT_UI_ADDRESS,
     server: AbstractServer | None = None,
     port: int | None = None,
+    timeout: float | None = None,
 ) -> SyftClient:
     if server:
         connection = PythonConnection(server=server)
@@ -1112,6 +1183,7 @@ def connect(
         if isinstance(port, int | str):
             url.set_port(int(port))
         connection = HTTPConnection(url=url)
+        connection.set_timeout(timeout)
 
     client_type = connection.get_client_type()
 
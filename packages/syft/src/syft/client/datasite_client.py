@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 # stdlib
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pathlib import Path
 import re
 from string import Template
 import traceback
+from typing import Any
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -31,12 +35,14 @@ from ..service.response import SyftSuccess
 from ..service.response import SyftWarning
 from ..service.sync.diff_state import ResolvedSyncState
 from ..service.sync.sync_state import SyncState
+from ..service.sync.sync_state import SyncStateDelta
 from ..service.user.roles import Roles
 from ..service.user.user import ServiceRole
 from ..service.user.user import UserView
 from ..types.blob_storage import BlobFile
 from ..types.uid import UID
 from ..util.misc_objs import HTMLObject
+from ..util.util import InFlightBudget
 from ..util.util import get_mb_size
 from ..util.util import prompt_warning_message
 from .api import APIModule
@@ -48,6 +54,9 @@ from .protocol import SyftProtocol
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_UPLOAD_IN_FLIGHT_MB = 1024
+
 if TYPE_CHECKING:
     # relative
     from ..orchestra import ServerHandle
@@ -94,13 +103,60 @@ def add_default_uploader(
 
 @serializable(canonical_name="DatasiteClient", version=1)
 class DatasiteClient(SyftClient):
+    # all objects to sync as of the last get_sync_state, later calls only fetch changes
+    _sync_state_delta: SyncStateDelta | None = None
+
     def __repr__(self) -> str:
         return f"<DatasiteClient: {self.name}>"
 
-    def upload_dataset(self, dataset: CreateDataset) -> SyftSuccess | SyftError:
+    def _upload_asset(self, asset: CreateAsset) -> SyftSuccess | SyftError:
         # relative
         from ..types.twin_object import TwinObject
 
+        try:
+            contains_empty: bool = asset.contains_empty()
+            twin = TwinObject(
+                private_obj=ActionObject.from_obj(asset.data),
+                mock_obj=ActionObject.from_obj(asset.mock),
+                syft_server_location=self.id,
+                syft_client_verify_key=self.verify_key,
+            )
+            res = twin._save_to_blob_storage(allow_empty=contains_empty)
+            if isinstance(res, SyftError):
+                return res
+        except SyftException as se:
+            return SyftError(message=f"{se}")
+        except Exception as e:
+            tqdm.write(f"Failed to create twin for {asset.name}. {e}")
+            return SyftError(message=f"Failed to create twin. {e}")
+
+        if isinstance(res, SyftWarning):
+            logger.debug(res.message)
+        response = self.api.services.action.set(
+            twin, ignore_detached_objs=contains_empty
+        )
+        if isinstance(response, SyftError):
+            tqdm.write(f"Failed to upload asset: {asset.name}")
+            return response
+
+        asset.action_id = twin.id
+        asset.server_uid = self.id
+        return SyftSuccess(message=f"Uploaded asset {asset.name}")
+
+    def upload_dataset(
+        self,
+        dataset: CreateDataset,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        max_in_flight_mb: float = DEFAULT_UPLOAD_IN_FLIGHT_MB,
+    ) -> SyftSuccess | SyftError:
+        """Upload the assets of a dataset and then the dataset itself.
+
+        Assets are serialized and uploaded concurrently by up to `max_workers`
+        threads, while the total size of the assets being uploaded at the same
+        time is kept under `max_in_flight_mb`. If an asset fails to upload,
+        the assets already uploaded keep their `action_id` and are skipped
+        when `upload_dataset` is called again with the same dataset.
+        """
         if self.users is None:
             return SyftError(f"can't get user service for {self}")
 
@@ -132,43 +188,58 @@ class DatasiteClient(SyftClient):
             )
             prompt_warning_message(message=message, confirm=True)
 
-        with tqdm(
-            total=len(dataset.asset_list), colour="green", desc="Uploading"
-        ) as pbar:
-            for asset in dataset.asset_list:
+        # assets uploaded by a previous, failed call are skipped,
+        # so calling upload_dataset again resumes the upload
+        def is_uploaded(asset: CreateAsset) -> bool:
+            return asset.action_id is not None and asset.server_uid == self.id
+
+        pending_assets = [
+            asset for asset in dataset.asset_list if not is_uploaded(asset)
+        ]
+        budget = InFlightBudget(max_in_flight_mb)
+        errors: list[SyftError] = []
+
+        def on_done(asset: CreateAsset, asset_mb: float, pbar: tqdm) -> Callable:
+            def callback(future: Future) -> None:
+                budget.release(asset_mb)
                 try:
-                    contains_empty: bool = asset.contains_empty()
-                    twin = TwinObject(
-                        private_obj=ActionObject.from_obj(asset.data),
-                        mock_obj=ActionObject.from_obj(asset.mock),
-                        syft_server_location=self.id,
-                        syft_client_verify_key=self.verify_key,
-                    )
-                    res = twin._save_to_blob_storage(allow_empty=contains_empty)
-                    if isinstance(res, SyftError):
-                        return res
-                except SyftException as se:
-                    return SyftError(message=f"{se}")
+                    res = future.result()
                 except Exception as e:
-                    tqdm.write(f"Failed to create twin for {asset.name}. {e}")
-                    return SyftError(message=f"Failed to create twin. {e}")
+                    res = SyftError(message=f"Failed to upload {asset.name}. {e}")
+                if isinstance(res, SyftError):
+                    errors.append(res)
+                    return
+                pbar.set_description(f"Uploading: {asset.name}")
+                pbar.update(1)
 
-                if isinstance(res, SyftWarning):
-                    logger.debug(res.message)
-                response = self.api.services.action.set(
-                    twin, ignore_detached_objs=contains_empty
-                )
-                if isinstance(response, SyftError):
-                    tqdm.write(f"Failed to upload asset: {asset.name}")
-                    return response
+            return callback
 
-                asset.action_id = twin.id
-                asset.server_uid = self.id
-                dataset_size += get_mb_size(asset.data)
+        with tqdm(
+            total=len(dataset.asset_list),
+            initial=len(dataset.asset_list) - len(pending_assets),
+            colour="green",
+            desc="Uploading",
+        ) as pbar:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for asset in pending_assets:
+                    asset_mb = get_mb_size(asset.data) + get_mb_size(asset.mock)
+                    budget.acquire(asset_mb)
+                    if errors:
+                        budget.release(asset_mb)
+                        break
+                    future = executor.submit(self._upload_asset, asset)
+                    future.add_done_callback(on_done(asset, asset_mb, pbar))
+
+        if errors:
+            uploaded = sum(is_uploaded(asset) for asset in dataset.asset_list)
+            return SyftError(
+                message=f"{errors[0].message}. "
+                f"{uploaded}/{len(dataset.asset_list)} assets were uploaded, "
+                "call upload_dataset again with the same dataset to resume."
+            )
 
-                # Update the progress bar and set the dynamic description
-                pbar.set_description(f"Uploading: {asset.name}")
-                pbar.update(1)
+        for asset in dataset.asset_list:
+            dataset_size += get_mb_size(asset.data)
 
         dataset.mb_size = dataset_size
         valid = dataset.check()
@@ -190,15 +261,30 @@ class DatasiteClient(SyftClient):
             self._api.refresh_api_callback()
 
     def get_sync_state(self) -> SyncState | SyftError:
-        state: SyncState = self.api.services.sync._get_state()
-        if isinstance(state, SyftError):
+        if not self.api.services.sync.has_submodule("_get_state_changes"):
+            # servers without change logs
+            state: SyncState = self.api.services.sync._get_state()
+            if isinstance(state, SyftError):
+                return state
+            self._refresh_action_objects(state.objects)
             return state
 
-        for uid, obj in state.objects.items():
+        previous = self._sync_state_delta
+        delta: SyncStateDelta = self.api.services.sync._get_state_changes(
+            since=previous.watermark if previous is not None else None
+        )
+        if isinstance(delta, SyftError):
+            return delta
+        self._refresh_action_objects(delta.objects)
+
+        self._sync_state_delta = delta.merge(previous)
+        return self._sync_state_delta.to_state()
+
+    @staticmethod
+    def _refresh_action_objects(objects: dict[UID, Any]) -> None:
+        for uid, obj in objects.items():
             if isinstance(obj, ActionObject):
-                obj = obj.refresh_object(resolve_nested=False)
-                state.objects[uid] = obj
-        return state
+                objects[uid] = obj.refresh_object(resolve_nested=False)
 
     def apply_state(self, resolved_state: ResolvedSyncState) -> SyftSuccess | SyftError:
         if len(resolved_state.delete_objs):
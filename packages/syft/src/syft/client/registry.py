@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 # stdlib
+from collections.abc import Callable
 from concurrent import futures
 import json
 import logging
+import math
 import os
 from typing import Any
 
@@ -14,13 +16,18 @@ import requests
 
 # relative
 from ..service.metadata.server_metadata import ServerMetadataJSON
+from ..service.network.routes import HTTPServerRoute
 from ..service.network.server_peer import ServerPeer
 from ..service.network.server_peer import ServerPeerConnectionStatus
 from ..service.response import SyftException
 from ..types.server_url import ServerURL
 from ..types.syft_object import SyftObject
 from ..util.constants import DEFAULT_TIMEOUT
+from ..util.util import run_with_deadlines
+from ..util.util import verify_tls
+from .client import Routes
 from .client import SyftClient as Client
+from .registry_cache import RegistryCache
 
 logger = logging.getLogger(__name__)
 NETWORK_REGISTRY_URL = (
@@ -34,13 +41,132 @@ DATASITE_REGISTRY_URL = (
 )
 
 
+# discovery requests to different hosts run concurrently on this many threads
+DISCOVERY_WORKERS = 20
+# seconds to wait for a login and a call to a gateway, on top of the request timeout
+CLIENT_CALL_TIMEOUT = 30
+
+registry_cache = RegistryCache()
+# shared by all discovery calls, so hosts that don't answer keep a worker busy
+# instead of an abandoned pool each
+discovery_executor = futures.ThreadPoolExecutor(
+    max_workers=DISCOVERY_WORKERS, thread_name_prefix="registry-discovery"
+)
+
+
 def _get_all_networks(network_json: dict, version: str) -> list[dict]:
     return network_json.get(version, {}).get("gateways", [])
 
 
+def _server_url(server: dict) -> str:
+    return "http://" + server["host_or_ip"] + ":" + str(server["port"]) + "/"
+
+
+def load_registry_json(url: str, cache: RegistryCache | None = None) -> dict:
+    def fetch() -> dict:
+        response = requests.get(url, timeout=DEFAULT_TIMEOUT)  # nosec
+        response.raise_for_status()
+        return response.json()
+
+    cache = cache if cache is not None else registry_cache
+    return cache.get_or_fetch(url, fetch)
+
+
+def run_concurrently(
+    func: Callable[[Any], Any], items: list, timeout: float
+) -> list[Any | None]:
+    """Results of `func` for every item, computed on the shared discovery pool.
+
+    `timeout` is the time one call may take, counted from when it started. Calls
+    that failed, timed out or were still queued behind hosts that don't answer
+    result in None. Calls that timed out are left to finish on their own,
+    discovery doesn't wait for them.
+    """
+    if not items:
+        return []
+    pending = run_with_deadlines(
+        discovery_executor,
+        func,
+        items,
+        timeout=timeout,
+        max_wait=timeout * (math.ceil(len(items) / DISCOVERY_WORKERS) + 1),
+    )
+    results: list[Any | None] = []
+    for item, future in zip(items, pending):
+        if future.cancelled():
+            logger.warning(f"Skipped discovering {item}, no worker was free")
+            results.append(None)
+        elif not future.done():
+            logger.warning(f"Timed out discovering {item}")
+            results.append(None)
+        elif (e := future.exception()) is not None:
+            logger.warning(f"Failed discovering {item}: {e}")
+            results.append(None)
+        else:
+            results.append(future.result())
+    return results
+
+
+def check_network(network: dict, timeout: float = DEFAULT_TIMEOUT) -> dict | None:
+    url = _server_url(network)
+    try:
+        res = requests.get(url, timeout=timeout)  # nosec
+        online = "This is a Syft Gateway server." in res.text
+    except Exception:
+        online = False
+
+    # networks without frontend
+    if not online:
+        try:
+            ping_url = url + "api/v2/"
+            res = requests.get(ping_url, timeout=timeout)  # nosec
+            online = res.status_code == 200
+        except Exception:
+            online = False
+
+    if online:
+        version = network.get("version", None)
+        # Check if syft version was described in NetworkRegistry
+        # If it's unknown, try to update it to an available version.
+        if not version or version == "unknown":
+            # If not defined, try to ask in /syft/version endpoint (supported by 0.7.0)
+            try:
+                version_url = url + "api/v2/metadata"
+                res = requests.get(version_url, timeout=timeout)  # nosec
+                if res.status_code == 200:
+                    network["version"] = res.json()["syft_version"]
+                else:
+                    network["version"] = "unknown"
+            except Exception:
+                network["version"] = "unknown"
+        return network
+    return None
+
+
+def fetch_server_metadata(
+    peer: ServerPeer, timeout: float = DEFAULT_TIMEOUT
+) -> ServerMetadataJSON:
+    """Metadata of a server, read straight from its metadata route when it has
+    a plain HTTP route, without logging in."""
+    route = peer.pick_highest_priority_route()
+    if (
+        isinstance(route, HTTPServerRoute)
+        and route.proxy_target_uid is None
+        and route.rtunnel_token is None
+    ):
+        url = ServerURL(
+            protocol=route.protocol, host_or_ip=route.host_or_ip, port=route.port
+        ).with_path(Routes.ROUTE_METADATA.value)
+        response = requests.get(str(url), timeout=timeout, verify=verify_tls())  # nosec
+        response.raise_for_status()
+        return ServerMetadataJSON(**response.json())
+    return peer.guest_client.metadata
+
+
 class NetworkRegistry:
-    def __init__(self) -> None:
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT) -> None:
         self.all_networks: list[dict] = []
+        self.timeout = timeout
 
         try:
             network_json = self.load_network_registry_json()
@@ -62,9 +188,7 @@ class NetworkRegistry:
                 network_json: dict = json.loads(network_registry_json)
             else:
                 # Load the network registry from the NETWORK_REGISTRY_URL
-                response = requests.get(NETWORK_REGISTRY_URL, timeout=30)  # nosec
-                response.raise_for_status()  # raise an exception if the HTTP request returns an error
-                network_json = response.json()
+                network_json = load_registry_json(NETWORK_REGISTRY_URL)
 
             return network_json
 
@@ -76,50 +200,12 @@ class NetworkRegistry:
 
     @property
     def online_networks(self) -> list[dict]:
-        networks = self.all_networks
-
-        def check_network(network: dict) -> dict[Any, Any] | None:
-            url = "http://" + network["host_or_ip"] + ":" + str(network["port"]) + "/"
-            try:
-                res = requests.get(url, timeout=DEFAULT_TIMEOUT)  # nosec
-                online = "This is a Syft Gateway server." in res.text
-            except Exception:
-                online = False
-
-            # networks without frontend
-            if not online:
-                try:
-                    ping_url = url + "api/v2/"
-                    res = requests.get(ping_url, timeout=DEFAULT_TIMEOUT)  # nosec
-                    online = res.status_code == 200
-                except Exception:
-                    online = False
-
-            if online:
-                version = network.get("version", None)
-                # Check if syft version was described in NetworkRegistry
-                # If it's unknown, try to update it to an available version.
-                if not version or version == "unknown":
-                    # If not defined, try to ask in /syft/version endpoint (supported by 0.7.0)
-                    try:
-                        version_url = url + "api/v2/metadata"
-                        res = requests.get(version_url, timeout=DEFAULT_TIMEOUT)  # nosec
-                        if res.status_code == 200:
-                            network["version"] = res.json()["syft_version"]
-                        else:
-                            network["version"] = "unknown"
-                    except Exception:
-                        network["version"] = "unknown"
-                return network
-            return None
-
-        # We can use a with statement to ensure threads are cleaned up promptly
-        with futures.ThreadPoolExecutor(max_workers=20) as executor:
-            # map
-            _online_networks = list(
-                executor.map(lambda network: check_network(network), networks)
-            )
-
+        # the requests to a network are made one after another
+        _online_networks = run_concurrently(
+            lambda network: check_network(network, self.timeout),
+            self.all_networks,
+            timeout=3 * self.timeout,
+        )
         return [network for network in _online_networks if network is not None]
 
     def _repr_html_(self) -> str:
@@ -162,7 +248,7 @@ class NetworkRegistry:
         return len(self.all_networks)
 
     @staticmethod
-    def create_client(network: dict[str, Any]) -> Client:
+    def create_client(network: dict[str, Any], timeout: float | None = None) -> Client:
         # relative
         from ..client.client import connect
 
@@ -171,7 +257,7 @@ class NetworkRegistry:
             protocol = network["protocol"]
             host_or_ip = network["host_or_ip"]
             server_url = ServerURL(port=port, protocol=protocol, host_or_ip=host_or_ip)
-            client = connect(url=str(server_url))
+            client = connect(url=str(server_url), timeout=timeout)
             return client.guest()
         except Exception as e:
             raise SyftException(f"Failed to login with: {network}. {e}")
@@ -240,8 +326,7 @@ class DatasiteRegistry:
     def __init__(self) -> None:
         self.all_datasites: list[dict] = []
         try:
-            response = requests.get(DATASITE_REGISTRY_URL)  # nosec
-            datasites_json = response.json()
+            datasites_json = load_registry_json(DATASITE_REGISTRY_URL)
             self.all_datasites = datasites_json["datasites"]
         except Exception as e:
             logger.warning(
@@ -303,7 +388,7 @@ class DatasiteRegistry:
         return ([Datasite(**ds) for ds in on])._repr_html_()
 
     @staticmethod
-    def create_client(datasite: dict[str, Any]) -> Client:
+    def create_client(datasite: dict[str, Any], timeout: float | None = None) -> Client:
         # relative
         from .client import connect
 
@@ -312,7 +397,7 @@ class DatasiteRegistry:
             protocol = datasite["protocol"]
             host_or_ip = datasite["host_or_ip"]
             server_url = ServerURL(port=port, protocol=protocol, host_or_ip=host_or_ip)
-            client = connect(url=str(server_url))
+            client = connect(url=str(server_url), timeout=timeout)
             return client.guest()
         except Exception as e:
             raise SyftException(f"Failed to login with: {datasite}. {e}")
@@ -329,9 +414,20 @@ class DatasiteRegistry:
 
 
 class NetworksOfDatasitesRegistry:
-    def __init__(self) -> None:
+    """Datasites of all networks in the network registry.
+
+    Networks and their datasites are asked concurrently, every host within
+    `timeout` seconds. The datasites of a network and the metadata of a
+    datasite are cached on disk, see `RegistryCache`.
+    """
+
+    def __init__(
+        self, timeout: float = DEFAULT_TIMEOUT, cache: RegistryCache | None = None
+    ) -> None:
         self.all_networks: list[dict] = []
         self.all_datasites: dict[str, ServerPeer] = {}
+        self.timeout = timeout
+        self.cache = cache if cache is not None else registry_cache
         try:
             network_json = NetworkRegistry.load_network_registry_json()
             self.all_networks = _get_all_networks(
@@ -343,85 +439,66 @@ class NetworksOfDatasitesRegistry:
                 f"Failed to get Network Registry, go checkout: {NETWORK_REGISTRY_REPO}. {e}"
             )
 
-    def _get_all_datasites(self) -> None:
-        for network in self.all_networks:
-            network_client = NetworkRegistry.create_client(network)
-            datasites: list[ServerPeer] = network_client.datasites.retrieve_servers()
-            for datasite in datasites:
-                self.all_datasites[str(datasite.id)] = datasite
-
-    @property
-    def online_networks(self) -> list[dict]:
-        networks = self.all_networks
-
-        def check_network(network: dict) -> dict[Any, Any] | None:
-            url = "http://" + network["host_or_ip"] + ":" + str(network["port"]) + "/"
-            try:
-                res = requests.get(url, timeout=DEFAULT_TIMEOUT)
-                online = "This is a Syft Gateway server." in res.text
-            except Exception:
-                online = False
-
-            # networks without frontend
-            if not online:
-                try:
-                    ping_url = url + "api/v2/"
-                    res = requests.get(ping_url, timeout=DEFAULT_TIMEOUT)
-                    online = res.status_code == 200
-                except Exception:
-                    online = False
-
-            if online:
-                version = network.get("version", None)
-                # Check if syft version was described in NetworkRegistry
-                # If it's unknown, try to update it to an available version.
-                if not version or version == "unknown":
-                    # If not defined, try to ask in /syft/version endpoint (supported by 0.7.0)
-                    try:
-                        version_url = url + "api/v2/metadata"
-                        res = requests.get(version_url, timeout=DEFAULT_TIMEOUT)
-                        if res.status_code == 200:
-                            network["version"] = res.json()["syft_version"]
-                        else:
-                            network["version"] = "unknown"
-                    except Exception:
-                        network["version"] = "unknown"
-                return network
-
-            return None
-
-        # We can use a with statement to ensure threads are cleaned up promptly
-        with futures.ThreadPoolExecutor(max_workers=20) as executor:
-            # map
-            _online_networks = list(
-                executor.map(lambda network: check_network(network), networks)
+    def _retrieve_datasites(self, network: dict) -> list[ServerPeer]:
+        def fetch() -> list[ServerPeer]:
+            network_client = NetworkRegistry.create_client(
+                network, timeout=self.timeout
             )
+            datasites = network_client.datasites.retrieve_servers()
+            if not isinstance(datasites, list):
+                raise SyftException(f"Failed to retrieve datasites: {datasites}")
+            return datasites
 
-        return [network for network in _online_networks if network is not None]
+        return self.cache.get_or_fetch(f"datasites:{_server_url(network)}", fetch)
 
-    @property
-    def online_datasites(self) -> list[tuple[ServerPeer, ServerMetadataJSON | None]]:
-        networks = self.online_networks
+    def _get_metadata(self, datasite: ServerPeer) -> ServerMetadataJSON:
+        metadata = self.cache.get_or_fetch(
+            f"metadata:{datasite.id}",
+            lambda: fetch_server_metadata(datasite, self.timeout).model_dump(),
+        )
+        return ServerMetadataJSON(**metadata)
 
-        _all_online_datasites = []
-        for network in networks:
-            try:
-                network_client = NetworkRegistry.create_client(network)
-            except Exception as e:
-                logger.error(f"Error in creating network client {e}")
+    def _get_datasites(self, networks: list[dict]) -> list[ServerPeer]:
+        datasites_per_network = run_concurrently(
+            self._retrieve_datasites,
+            networks,
+            timeout=self.timeout + CLIENT_CALL_TIMEOUT,
+        )
+        all_datasites = []
+        for network, datasites in zip(networks, datasites_per_network):
+            if datasites is None:
+                logger.error(f"Failed to retrieve datasites of {network.get('name')}")
                 continue
-
-            datasites: list[ServerPeer] = network_client.datasites.retrieve_servers()
             for datasite in datasites:
                 self.all_datasites[str(datasite.id)] = datasite
+            all_datasites += datasites
+        return all_datasites
+
+    def _get_all_datasites(self) -> None:
+        self._get_datasites(self.all_networks)
 
-            _all_online_datasites += [
-                (datasite, datasite.guest_client.metadata)
-                for datasite in datasites
-                if datasite.ping_status == ServerPeerConnectionStatus.ACTIVE
-            ]
+    @property
+    def online_networks(self) -> list[dict]:
+        # the requests to a network are made one after another
+        _online_networks = run_concurrently(
+            lambda network: check_network(network, self.timeout),
+            self.all_networks,
+            timeout=3 * self.timeout,
+        )
+        return [network for network in _online_networks if network is not None]
 
-        return [datasite for datasite in _all_online_datasites if datasite is not None]
+    @property
+    def online_datasites(self) -> list[tuple[ServerPeer, ServerMetadataJSON | None]]:
+        datasites = [
+            datasite
+            for datasite in self._get_datasites(self.online_networks)
+            if datasite.ping_status == ServerPeerConnectionStatus.ACTIVE
+        ]
+        # datasites without a plain HTTP route are logged in to for their metadata
+        metadata = run_concurrently(
+            self._get_metadata, datasites, timeout=self.timeout + CLIENT_CALL_TIMEOUT
+        )
+        return list(zip(datasites, metadata))
 
     def __make_dict__(self) -> list[dict[str, Any]]:
         on = self.online_datasites
@@ -490,11 +567,9 @@ class NetworksOfDatasitesRegistry:
             return self.create_client(self.online_datasites[key][0])
         else:
             on = self.online_datasites
-            count = 0
             for datasite, _ in on:
                 if datasite.name == key:
-                    return self.create_client(self.online_datasites[count][0])
-                count += 1
+                    return self.create_client(datasite)
         raise KeyError(f"Invalid key: {key} for {on}")
 
 
@@ -508,8 +583,7 @@ class EnclaveRegistry:
     def __init__(self) -> None:
         self.all_enclaves: list[dict] = []
         try:
-            response = requests.get(ENCLAVE_REGISTRY_URL)  # nosec
-            enclaves_json = response.json()
+            enclaves_json = load_registry_json(ENCLAVE_REGISTRY_URL)
             self.all_enclaves = enclaves_json["2.0.0"]["enclaves"]
         except Exception as e:
             logger.warning(
@@ -0,0 +1,98 @@
+# stdlib
+from collections.abc import Callable
+import hashlib
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+# relative
+from ..serde.deserialize import _deserialize
+from ..serde.serialize import _serialize
+from ..util.util import get_env
+
+logger = logging.getLogger(__name__)
+
+# seconds after which cached registry responses are refreshed
+DEFAULT_REGISTRY_CACHE_TTL = float(get_env("SYFT_REGISTRY_CACHE_TTL") or 600)
+
+
+def get_registry_cache_path() -> Path:
+    cache_dir = get_env("SYFT_REGISTRY_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".syft" / "registry_cache"
+
+
+class RegistryCache:
+    """On disk cache of the responses of registries and the servers they list.
+
+    Entries older than `ttl` seconds are stale. They are still returned right
+    away, and refreshed in the background for the next time (stale while
+    revalidate), so listing datasites doesn't wait on the network once they
+    were listed before. Only entries that were never fetched are waited for.
+    """
+
+    def __init__(
+        self, path: Path | None = None, ttl: float = DEFAULT_REGISTRY_CACHE_TTL
+    ) -> None:
+        self.path = path if path is not None else get_registry_cache_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha256(key.encode()).hexdigest()}.bin"
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """Cached value of `key` and its age in seconds, None if not cached."""
+        path = self._file(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            return _deserialize(path.read_bytes(), from_bytes=True), age
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Failed to read registry cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._file(key)
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(_serialize(value, to_bytes=True))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug(f"Failed to write registry cache entry {key}: {e}")
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        entry = self.get(key)
+        if entry is None:
+            value = fetch()
+            self.set(key, value)
+            return value
+
+        value, age = entry
+        if age > self.ttl:
+            self._revalidate(key, fetch)
+        return value
+
+    def _revalidate(self, key: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self.set(key, fetch())
+            except Exception as e:
+                logger.debug(f"Failed to refresh registry cache entry {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
@@ -1,4 +1,6 @@
 # stdlib
+import ast
+import struct
 from typing import cast
 
 # third party
@@ -113,14 +115,142 @@ def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
     return cast(bytes, _serialize(output_array, to_bytes=True))
 
 
+# Arrays are written as NUMPY_MAGIC, the little endian uint32 length of the
+# header, the header (a python literal dict like in the .npy format) and the
+# array buffer. The magic can not be the start of a capnp message, which
+# is how arrays serialized with the older formats are recognized.
+NUMPY_MAGIC = b"\x93SYFTNP"
+NUMPY_HEADER_LENGTH = struct.Struct("<I")
+
+# buffers smaller than this are never compressed
+COMPRESSION_MIN_BYTES = 1024 * 1024
+# size of the samples used to estimate how compressible a buffer is
+COMPRESSION_SAMPLE_BYTES = 64 * 1024
+# a buffer is compressed only if the samples shrink below this ratio
+COMPRESSION_MAX_RATIO = 0.8
+
+
+def _choose_codec(buffer: memoryview) -> str | None:
+    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
+        return None
+    if buffer.nbytes < COMPRESSION_MIN_BYTES:
+        return None
+
+    codec = flags.APACHE_ARROW_COMPRESSION.value
+    # sample the start, middle and end of the buffer, high entropy data
+    # like random floats barely compresses and is not worth the CPU time
+    middle = (buffer.nbytes - COMPRESSION_SAMPLE_BYTES) // 2
+    sample = b"".join(
+        buffer[start : start + COMPRESSION_SAMPLE_BYTES]
+        for start in (0, middle, buffer.nbytes - COMPRESSION_SAMPLE_BYTES)
+    )
+    compressed_size = pa.compress(sample, codec=codec, asbytes=False).size
+    if compressed_size > COMPRESSION_MAX_RATIO * len(sample):
+        return None
+    return codec
+
+
+def _pack(header: dict, buffers: list[bytes | memoryview]) -> bytes:
+    header_bytes = repr(header).encode()
+    return b"".join(
+        [NUMPY_MAGIC, NUMPY_HEADER_LENGTH.pack(len(header_bytes)), header_bytes]
+        + buffers
+    )
+
+
+def _unpack(buf: bytes) -> tuple[dict, memoryview]:
+    header_start = len(NUMPY_MAGIC) + NUMPY_HEADER_LENGTH.size
+    (header_length,) = NUMPY_HEADER_LENGTH.unpack_from(buf, len(NUMPY_MAGIC))
+    header_end = header_start + header_length
+    header = ast.literal_eval(buf[header_start:header_end].decode())
+    return header, memoryview(buf)[header_end:]
+
+
+def raw_numpy_serialize(obj: np.ndarray) -> bytes:
+    """Serialize the array buffer as is, compressed only when it pays off."""
+    if obj.dtype.hasobject:
+        raise TypeError(f"Can't serialize numpy array with dtype {obj.dtype}")
+    # ascontiguousarray returns at least 1-d arrays, flatten to keep the shape of obj
+    buffer = memoryview(np.ascontiguousarray(obj.reshape(-1)).view(np.uint8))
+    codec = _choose_codec(buffer)
+    if codec is not None:
+        buffer = memoryview(pa.compress(buffer, codec=codec, asbytes=False))
+    header = {
+        "kind": "raw",
+        "descr": np.lib.format.dtype_to_descr(obj.dtype),
+        "shape": obj.shape,
+        "codec": codec,
+        "nbytes": obj.nbytes,
+    }
+    return _pack(header, [buffer])
+
+
+def string_numpy_serialize(obj: np.ndarray) -> bytes:
+    """Serialize a string array as the offsets and data buffers of an Arrow string array."""
+    # 64 bit offsets, so arrays with more than 2GB of text fit in one buffer
+    arrow_array = pa.array(obj.reshape(-1)).cast(pa.large_string())
+    if isinstance(arrow_array, pa.ChunkedArray):
+        arrow_array = arrow_array.combine_chunks()
+    _, offsets, data = arrow_array.buffers()
+    offsets_size = (len(arrow_array) + 1) * np.dtype(np.int64).itemsize
+    header = {
+        "kind": "str",
+        "descr": np.lib.format.dtype_to_descr(obj.dtype),
+        "shape": obj.shape,
+        "length": len(arrow_array),
+        "offsets_size": offsets_size,
+    }
+    buffers = [memoryview(offsets)[:offsets_size]]
+    if data is not None:
+        buffers.append(memoryview(data))
+    return _pack(header, buffers)
+
+
+def _numpy_deserialize_new(buf: bytes) -> np.ndarray:
+    header, payload = _unpack(buf)
+    dtype = np.lib.format.descr_to_dtype(header["descr"])
+    shape = header["shape"]
+
+    if header["kind"] == "str":
+        offsets_size = header["offsets_size"]
+        offsets = pa.py_buffer(payload[:offsets_size])
+        data = pa.py_buffer(payload[offsets_size:])
+        arrow_array = pa.Array.from_buffers(
+            pa.large_string(), header["length"], [None, offsets, data]
+        )
+        return np.array(
+            arrow_array.to_numpy(zero_copy_only=False), dtype=dtype
+        ).reshape(shape)
+
+    if header["codec"] is not None:
+        payload = memoryview(
+            pa.decompress(
+                payload,
+                decompressed_size=header["nbytes"],
+                codec=header["codec"],
+                asbytes=False,
+            )
+        )
+        np_array = np.frombuffer(payload, dtype=dtype).reshape(shape)
+        # the decompressed buffer is owned by this array only
+        np_array.setflags(write=True)
+        return np_array
+    # the serialized bytes are immutable, copy once to get a writable array
+    return np.frombuffer(payload, dtype=dtype).reshape(shape).copy()
+
+
 def numpy_serialize(obj: np.ndarray) -> bytes:
     if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
+        return raw_numpy_serialize(obj)
     else:
-        return arraytonumpyutf8(obj)
+        return string_numpy_serialize(obj)
 
 
 def numpy_deserialize(buf: bytes) -> np.ndarray:
+    if buf[: len(NUMPY_MAGIC)] == NUMPY_MAGIC:
+        return _numpy_deserialize_new(buf)
+
+    # arrays serialized with older versions of syft
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
@@ -1,4 +1,6 @@
 # stdlib
+import hashlib
+import struct
 import tempfile
 from typing import Any
 
@@ -32,3 +34,27 @@ def _serialize(
 
     if to_proto:
         return proto
+
+
+def _serialize_sha256(obj: object, for_hashing: bool = True) -> Any:
+    """sha256 of `_serialize(obj, to_bytes=True)`, fed with the message segments
+    instead of joining them into one bytes object first."""
+    # relative
+    from .recursive import rs_object2proto
+
+    proto = rs_object2proto(obj, for_hashing=for_hashing)
+    segments = proto.to_segments()
+    # capnp frames the segments with the segment count minus one and the size
+    # of every segment in words, padded to a whole word
+    header = struct.pack(
+        f"<{len(segments) + 1}I",
+        len(segments) - 1,
+        *(len(segment) // 8 for segment in segments),
+    )
+    if len(segments) % 2 == 0:
+        header += bytes(4)
+
+    digest = hashlib.sha256(header)
+    for segment in segments:
+        digest.update(segment)
+    return digest
@@ -27,6 +27,7 @@ from ..types.dicttuple import DictTuple
 from ..types.dicttuple import _Meta as _DictTupleMetaClass
 from ..types.syft_metaclass import EmptyType
 from ..types.syft_metaclass import PartialModelMetaclass
+from ..util.experimental_flags import flags
 from .array import numpy_deserialize
 from .array import numpy_serialize
 from .deserialize import _deserialize as deserialize
@@ -72,7 +73,24 @@ recursive_serde_register_type(
 )
 
 
-def serialize_dataframe(df: DataFrame) -> bytes:
+ARROW_IPC_MAGIC = b"ARROW1"
+PARQUET_MAGIC = b"PAR1"
+SERIES_NAME_KEY = b"syft.series_name"
+
+
+def _write_arrow_ipc(table: pa.Table) -> bytes:
+    # uncompressed buffers, so reading them back does not copy
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_arrow_ipc(buf: bytes) -> pa.Table:
+    return pa.ipc.open_file(pa.py_buffer(buf)).read_all()
+
+
+def serialize_dataframe_parquet(df: DataFrame) -> bytes:
     table = pa.Table.from_pandas(df)
     sink = pa.BufferOutputStream()
     # 🟡 TODO 37: Should we warn about this?
@@ -86,10 +104,21 @@ def serialize_dataframe(df: DataFrame) -> bytes:
     return numpy_bytes
 
 
+def serialize_dataframe(df: DataFrame) -> bytes:
+    if flags.PANDAS_PARQUET_SERDE:
+        return serialize_dataframe_parquet(df)
+    # categoricals become dictionary encoded arrays, the index and column
+    # names are kept in the pandas metadata of the schema
+    return _write_arrow_ipc(pa.Table.from_pandas(df))
+
+
 def deserialize_dataframe(buf: bytes) -> DataFrame:
-    reader = pa.BufferReader(buf)
-    numpy_bytes = reader.read_buffer()
-    result = pq.read_table(numpy_bytes)
+    if buf.startswith(PARQUET_MAGIC):
+        reader = pa.BufferReader(buf)
+        numpy_bytes = reader.read_buffer()
+        result = pq.read_table(numpy_bytes)
+    else:
+        result = _read_arrow_ipc(buf)
     df = result.to_pandas()
     return df
 
@@ -104,14 +133,36 @@ recursive_serde_register(
 )
 
 
+def serialize_series(series: Series) -> bytes:
+    try:
+        table = pa.Table.from_pandas(series.to_frame())
+    except pa.ArrowException:
+        # e.g. object series with mixed python types
+        return serialize(DataFrame(series).to_dict(), to_bytes=True)
+    # to_frame names an unnamed series 0, remember to undo that
+    metadata = {
+        **table.schema.metadata,
+        SERIES_NAME_KEY: b"named" if series.name is not None else b"unnamed",
+    }
+    return _write_arrow_ipc(table.replace_schema_metadata(metadata))
+
+
 def deserialize_series(blob: bytes) -> Series:
-    df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return Series(df[df.columns[0]])
+    if not blob.startswith(ARROW_IPC_MAGIC):
+        # series serialized with older versions of syft
+        df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
+        return Series(df[df.columns[0]])
+
+    table = _read_arrow_ipc(blob)
+    series = table.to_pandas().iloc[:, 0]
+    if table.schema.metadata.get(SERIES_NAME_KEY) == b"unnamed":
+        series.name = None
+    return series
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
     canonical_name="pandas_series",
     version=1,
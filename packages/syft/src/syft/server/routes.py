@@ -1,7 +1,9 @@
 # stdlib
+import asyncio
 import base64
 import binascii
 from collections.abc import AsyncGenerator
+from collections.abc import Iterator
 import logging
 from typing import Annotated
 
@@ -16,9 +18,11 @@ from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 import requests
+from starlette.concurrency import run_in_threadpool
 
 # relative
 from ..abstract_server import AbstractServer
+from ..client.client import SERVER_UID_HEADER
 from ..client.connection import ServerConnection
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
@@ -76,7 +80,9 @@ def make_routes(worker: Worker) -> APIRouter:
         try:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
-            stream_response = peer_connection._make_get(url.path, stream=True)
+            stream_response = await run_in_threadpool(
+                peer_connection._make_get, url.path, stream=True
+            )
         except requests.RequestException:
             raise HTTPException(404, "Failed to retrieve data from datasite.")
 
@@ -88,6 +94,18 @@ def make_routes(worker: Worker) -> APIRouter:
         async for chunk in request.stream():
             yield chunk
 
+    def iterate_in_thread(
+        chunks: AsyncGenerator[bytes, None], loop: asyncio.AbstractEventLoop
+    ) -> Iterator[bytes]:
+        """Read the chunks of the event loop `loop` from a worker thread."""
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    chunks.__anext__(), loop
+                ).result()
+            except StopAsyncIteration:
+                return
+
     @router.put("/stream/{peer_uid}/{url_path}/", name="stream")
     async def stream_upload(peer_uid: str, url_path: str, request: Request) -> Response:
         try:
@@ -95,16 +113,25 @@ def make_routes(worker: Worker) -> APIRouter:
         except binascii.Error:
             raise HTTPException(404, "Invalid `url_path`.")
 
-        data = await request.body()
-
         peer_uid_parsed = UID.from_string(peer_uid)
 
         try:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
 
-            print("Url on stream", url.path)
-            response = peer_connection._make_put(url.path, data=data, stream=True)
+            # the upload is streamed on to the peer while it is received, with
+            # its size when the client sent one, blob stores may reject chunks
+            data = iterate_in_thread(
+                read_request_body_in_chunks(request), asyncio.get_running_loop()
+            )
+            content_length = request.headers.get("content-length")
+            response = await run_in_threadpool(
+                peer_connection._make_put,
+                url.path,
+                data=data,
+                stream=True,
+                content_length=int(content_length) if content_length else None,
+            )
         except requests.RequestException:
             raise HTTPException(404, "Failed to upload data to datasite")
 
@@ -168,7 +195,21 @@ def make_routes(worker: Worker) -> APIRouter:
         else:
             return handle_syft_new_api(user_verify_key, communication_protocol)
 
-    def handle_new_api_call(data: bytes) -> Response:
+    def handle_new_api_call(data: bytes, server_uid: str | None = None) -> Response:
+        if server_uid is not None and server_uid != worker.id.no_dash:
+            # calls for a peer are passed on without deserializing them
+            try:
+                peer_uid = UID.from_string(server_uid)
+            except ValueError:
+                peer_uid = None
+            result = (
+                worker.forward_raw_api_call(peer_uid, data)
+                if peer_uid is not None
+                else None
+            )
+            if result is not None:
+                return Response(result, media_type="application/octet-stream")
+
         obj_msg = deserialize(blob=data, from_bytes=True)
         result = worker.handle_api_call(api_call=obj_msg)
         return Response(
@@ -187,9 +228,9 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_new_api_call(data)
+                return handle_new_api_call(data, request.headers.get(SERVER_UID_HEADER))
         else:
-            return handle_new_api_call(data)
+            return handle_new_api_call(data, request.headers.get(SERVER_UID_HEADER))
 
     def handle_forgot_password(email: str, server: AbstractServer) -> Response:
         method = server.get_service_method(UserService.forgot_password)
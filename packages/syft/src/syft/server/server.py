@@ -39,6 +39,7 @@ from ..client.client import SyftClient
 from ..exceptions.exception import PySyftException
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.deserialize import _deserialize as deserialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.action.action_store import ActionStore
@@ -59,6 +60,7 @@ from ..service.job.job_stash import JobType
 from ..service.metadata.server_metadata import ServerMetadata
 from ..service.network.network_service import NetworkService
 from ..service.network.utils import PeerHealthCheckTask
+from ..service.notifier.email_dispatcher import EmailDispatcher
 from ..service.notifier.notifier_service import NotifierService
 from ..service.queue.base_queue import AbstractMessageHandler
 from ..service.queue.base_queue import QueueConsumer
@@ -90,6 +92,7 @@ from ..service.worker.utils import DEFAULT_WORKER_POOL_NAME
 from ..service.worker.utils import create_default_image
 from ..service.worker.worker_image_service import SyftWorkerImageService
 from ..service.worker.worker_pool import WorkerPool
+from ..service.worker.worker_pool_autoscaler import WorkerPoolAutoscaler
 from ..service.worker.worker_pool_service import SyftWorkerPoolService
 from ..service.worker.worker_pool_stash import SyftWorkerPoolStash
 from ..service.worker.worker_stash import WorkerStash
@@ -349,6 +352,7 @@ class Server(AbstractServer):
         self.server_side_type = ServerSideType(server_side_type)
         self.client_cache: dict = {}
         self.peer_client_cache: dict = {}
+        self.peer_connection_cache: dict = {}
 
         if isinstance(server_type, str):
             server_type = ServerType(server_type)
@@ -440,6 +444,15 @@ class Server(AbstractServer):
         if background_tasks:
             self.run_peer_health_checks(context=context)
 
+        # started once autoscaling is enabled for a worker pool
+        self.worker_pool_autoscaler = WorkerPoolAutoscaler()
+
+        # started once an email is queued, or right away to send the emails
+        # queued before a restart
+        self.email_dispatcher = EmailDispatcher()
+        if background_tasks:
+            self.email_dispatcher.run(context=context)
+
         ServerRegistry.set_server_for(self.id, self)
 
     @property
@@ -510,6 +523,8 @@ class Server(AbstractServer):
     def stop(self) -> None:
         if self.peer_health_manager is not None:
             self.peer_health_manager.stop()
+        self.worker_pool_autoscaler.stop()
+        self.email_dispatcher.stop()
 
         for consumer_list in self.queue_manager.consumers.values():
             for c in consumer_list:
@@ -1102,6 +1117,49 @@ class Server(AbstractServer):
 
         return SyftError(message=(f"Server has no route to {server_uid}"))
 
+    def forward_raw_api_call(self, server_uid: UID, data: bytes) -> bytes | None:
+        """Pass a serialized API call for a peer on to it, as it is.
+
+        Only the outer `SignedSyftAPICall` is deserialized, to check its
+        signature, the message it signs stays serialized for the peer.
+        Returns the serialized result of the peer, or None if the call can't be
+        passed through and has to be handled with `handle_api_call`.
+        """
+        # relative
+        from ..client.client import HTTPConnection
+        from ..client.client import SERVER_UID_HEADER
+        from ..service.network.routes import route_to_connection
+
+        if "networkservice" not in self.service_path_map:
+            return None
+
+        try:
+            api_call = deserialize(data, from_bytes=True)
+        except Exception:
+            return None
+        if not isinstance(api_call, SignedSyftAPICall) or isinstance(
+            api_call.is_valid, SyftError
+        ):
+            return None
+
+        network_service = self.get_service(NetworkService)
+        peer = network_service.stash.get_by_uid(self.verify_key, server_uid)
+        if peer.is_err() or peer.ok() is None:
+            return None
+
+        route = peer.ok().pick_highest_priority_route()
+        peer_cache_key = hash(server_uid) + hash(route)
+        connection = self.peer_connection_cache.get(peer_cache_key)
+        if connection is None:
+            connection = route_to_connection(route=route)
+            self.peer_connection_cache[peer_cache_key] = connection
+        if not isinstance(connection, HTTPConnection):
+            return None
+
+        return connection.post_api_call(
+            data, headers={SERVER_UID_HEADER: server_uid.no_dash}
+        )
+
     def get_role_for_credentials(self, credentials: SyftVerifyKey) -> ServiceRole:
         role = self.get_service("userservice").get_role_for_credentials(
             credentials=credentials
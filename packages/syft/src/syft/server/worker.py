@@ -3,6 +3,7 @@ from ..serde.serializable import serializable
 from .server import Server
 
 
-@serializable(canonical_name="Worker", version=1)
+# the autoscaler only runs next to a live server, it is not serialized
+@serializable(without=["worker_pool_autoscaler"], canonical_name="Worker", version=1)
 class Worker(Server):
     pass
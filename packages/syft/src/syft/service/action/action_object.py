@@ -34,9 +34,9 @@ from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
 from ...server.credentials import SyftVerifyKey
-from ...service.blob_storage.util import can_upload_to_blob_storage
+from ...service.blob_storage.util import can_upload_serialized_to_blob_storage
+from ...service.blob_storage.util import serialize_for_blob_storage
 from ...service.response import SyftError
 from ...service.response import SyftSuccess
 from ...service.response import SyftWarning
@@ -66,6 +66,8 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     # relative
+    from ..metadata.server_metadata import ServerMetadata
+    from ..metadata.server_metadata import ServerMetadataJSON
     from ..sync.diff_state import AttrDiff
 
 NoneType = type(None)
@@ -240,6 +242,12 @@ class ActionObjectPointer:
 HOOK_ALWAYS = "ALWAYS"
 HOOK_ON_POINTERS = "ON_POINTERS"
 
+# seconds a single long poll in `wait` may block on the server
+WAIT_LONG_POLL_TIMEOUT = 10.0
+# backoff between polls when the server returns early, e.g. it has too many waiters
+WAIT_MIN_BACKOFF = 0.1
+WAIT_MAX_BACKOFF = 2.0
+
 passthrough_attrs = [
     "__dict__",  # python
     "__class__",  # python
@@ -273,6 +281,7 @@ passthrough_attrs = [
     "get",  # syft
     "delete_data",  # syft
     "_save_to_blob_storage_",  # syft
+    "_get_server_metadata",  # syft
     "syft_action_data",  # syft
     "syft_resolved",  # syft
     "syft_action_data_server_id",
@@ -640,6 +649,7 @@ BASE_PASSTHROUGH_ATTRS: list[str] = [
     "wait",
     "_save_to_blob_storage",
     "_save_to_blob_storage_",
+    "_get_server_metadata",
     "syft_action_data",
     "__check_action_data",
     "as_empty_data",
@@ -796,6 +806,25 @@ class ActionObject(SyncableSyftObject):
 
         return None
 
+    def _get_server_metadata(self) -> ServerMetadata | ServerMetadataJSON | None:
+        # clients already hold the server metadata on their API,
+        # only fall back to a metadata call when there is none
+        if self.syft_server_location and self.syft_client_verify_key:
+            api = APIRegistry.api_for(
+                self.syft_server_location, self.syft_client_verify_key
+            )
+            if api is not None and api.metadata is not None:
+                return api.metadata
+
+        get_metadata = from_api_or_context(
+            func_or_path="metadata.get_metadata",
+            syft_server_location=self.syft_server_location,
+            syft_client_verify_key=self.syft_client_verify_key,
+        )
+        if get_metadata is None or isinstance(get_metadata, SyftError):
+            return None
+        return get_metadata()
+
     def _save_to_blob_storage_(self, data: Any) -> SyftError | SyftWarning | None:
         # relative
         from ...types.blob_storage import BlobFile
@@ -809,20 +838,18 @@ class ActionObject(SyncableSyftObject):
                     )
                     data._upload_to_blobstorage_from_api(api)
             else:
-                get_metadata = from_api_or_context(
-                    func_or_path="metadata.get_metadata",
-                    syft_server_location=self.syft_server_location,
-                    syft_client_verify_key=self.syft_client_verify_key,
-                )
-                if get_metadata is not None and not can_upload_to_blob_storage(
-                    data, get_metadata()
+                # serialize once, the same buffer is used for the size check
+                # and for the upload
+                serialized = serialize_for_blob_storage(data)
+                metadata = self._get_server_metadata()
+                if metadata is not None and not can_upload_serialized_to_blob_storage(
+                    serialized, metadata
                 ):
                     self.syft_action_saved_to_blob_store = False
                     return SyftWarning(
                         message=f"The action object {self.id} was not saved to "
                         f"the blob store but to memory cache since it is small."
                     )
-                serialized = serialize(data, to_bytes=True)
                 size = sys.getsizeof(serialized)
                 storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
 
@@ -1475,19 +1502,36 @@ class ActionObject(SyncableSyftObject):
         else:
             obj_id = self.id
 
-        counter = 0
+        # servers running an older version don't have the `action.wait` endpoint
+        long_poll = api is not None and api.services.action.has_submodule("wait")
+        backoff = WAIT_MIN_BACKOFF
+        start = time.monotonic()
         while api:
-            obj_resolved: bool | str = api.services.action.is_resolved(obj_id)
+            remaining = (
+                None if timeout is None else timeout - (time.monotonic() - start)
+            )
+            if remaining is not None and remaining <= 0:
+                return SyftError(message="Reached Timeout!")
+            poll_timeout = (
+                WAIT_LONG_POLL_TIMEOUT
+                if remaining is None
+                else min(WAIT_LONG_POLL_TIMEOUT, remaining)
+            )
+
+            poll_start = time.monotonic()
+            obj_resolved: bool | str = (
+                api.services.action.wait(obj_id, timeout=poll_timeout)
+                if long_poll
+                else api.services.action.is_resolved(obj_id)
+            )
             if isinstance(obj_resolved, str):
                 return SyftError(message=obj_resolved)
             if obj_resolved:
                 break
-            if not obj_resolved:
-                time.sleep(1)
-                if timeout is not None:
-                    counter += 1
-                    if counter > timeout:
-                        return SyftError(message="Reached Timeout!")
+            # the server returned early without blocking, back off before polling again
+            if time.monotonic() - poll_start < poll_timeout / 2:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, WAIT_MAX_BACKOFF)
 
         return self
 
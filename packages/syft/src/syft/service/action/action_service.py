@@ -1,7 +1,16 @@
 # stdlib
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from enum import Enum
+from functools import lru_cache
+from functools import partial
 import importlib
 import logging
+import threading
 from typing import Any
+from typing import TypeVar
 from typing import cast
 
 # third party
@@ -13,12 +22,17 @@ from result import Result
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
+from ...store.change_notifier import change_notifier
 from ...types.datetime import DateTime
 from ...types.syft_object import SyftObject
 from ...types.twin_object import TwinObject
 from ...types.uid import UID
+from ...util.util import InFlightBudget
+from ...util.util import get_env
+from ...util.util import str_to_bool
 from ..blob_storage.service import BlobStorageService
 from ..code.user_code import UserCode
+from ..code.user_code import UserCodeExecutionOutput
 from ..code.user_code import execute_byte_code
 from ..context import AuthedServiceContext
 from ..policy.policy import OutputPolicy
@@ -27,19 +41,21 @@ from ..response import SyftError
 from ..response import SyftSuccess
 from ..response import SyftWarning
 from ..service import AbstractService
+from ..service import LibConfigRegistry
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
-from ..service import UserLibConfigRegistry
 from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
 from ..user.user_roles import ServiceRole
+from .action_data_empty import ActionDataEmpty
 from .action_endpoint import CustomEndpointActionObject
 from .action_object import Action
 from .action_object import ActionObject
 from .action_object import ActionObjectPointer
 from .action_object import ActionType
 from .action_object import AnyActionObject
+from .action_object import TraceResultRegistry
 from .action_object import TwinMode
 from .action_permissions import ActionObjectPermission
 from .action_permissions import ActionObjectREAD
@@ -52,6 +68,87 @@ from .pandas import PandasSeriesObject  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# MB of input blobs of a function downloaded at once
+ACTION_DATA_MAX_IN_FLIGHT_MB = float(get_env("ACTION_DATA_MAX_IN_FLIGHT_MB") or 1024)
+ACTION_DATA_LOAD_WORKERS = 8
+# module functions and classes resolved once per process, by path and name
+CALLABLE_CACHE_SIZE = 4096
+
+
+class TwinExecutionMode(Enum):
+    # the private and then the mock branch, in the calling thread
+    SEQUENTIAL = "sequential"
+    # the mock branch in a thread, next to the private branch. NumPy and pandas
+    # release the GIL for most of their work, so both branches run in parallel
+    THREADS = "threads"
+
+
+TWIN_EXECUTION_MODE = TwinExecutionMode(get_env("TWIN_EXECUTION_MODE") or "threads")
+# skip the mock branch of user code executed with execute permission, e.g. by an
+# admin, or for approved code, which only needs the private result
+TWIN_SKIP_MOCK_FOR_APPROVED_CODE = str_to_bool(
+    get_env("TWIN_SKIP_MOCK_FOR_APPROVED_CODE", "false")
+)
+TWIN_EXECUTION_WORKERS = int(get_env("TWIN_EXECUTION_WORKERS") or 8)
+
+# shared by all twin computations, so no thread is started per action
+_twin_executor = ThreadPoolExecutor(
+    max_workers=TWIN_EXECUTION_WORKERS, thread_name_prefix="twin-mock"
+)
+_twin_thread = threading.local()
+
+PrivateResult = TypeVar("PrivateResult")
+MockResult = TypeVar("MockResult")
+
+
+def execute_twin_branches(
+    private: Callable[[], PrivateResult],
+    mock: Callable[[], MockResult],
+    mode: TwinExecutionMode | None = None,
+) -> tuple[PrivateResult, MockResult]:
+    """Run the private and the mock branch of a twin computation in `mode`, which
+    defaults to `TWIN_EXECUTION_MODE`. Errors are raised like when the branches
+    run one after the other."""
+    mode = TWIN_EXECUTION_MODE if mode is None else mode
+    # tracing state is kept per thread, and twin computations nested in a mock
+    # branch run in its thread, so they can't wait on a full executor
+    if (
+        mode == TwinExecutionMode.SEQUENTIAL
+        or TraceResultRegistry.current_thread_is_tracing()
+        or getattr(_twin_thread, "is_mock_branch", False)
+    ):
+        private_result = private()
+        return private_result, mock()
+
+    mock_future = _twin_executor.submit(_run_mock_branch, mock)
+    try:
+        private_result = private()
+    except BaseException:
+        # the mock branch isn't left running on its own
+        if not mock_future.cancel():
+            wait([mock_future])
+        raise
+    return private_result, mock_future.result()
+
+
+def _run_mock_branch(mock: Callable[[], MockResult]) -> MockResult:
+    _twin_thread.is_mock_branch = True
+    try:
+        return mock()
+    finally:
+        _twin_thread.is_mock_branch = False
+
+
+@lru_cache(maxsize=CALLABLE_CACHE_SIZE)
+def resolve_callable(path: str, op: str) -> Any:
+    """The attribute `op` of the module or class at `path`, e.g. `numpy.sum` for
+    ("numpy", "sum"), resolved once per process."""
+    path_elements = path.split(".")
+    res = importlib.import_module(path_elements[0])
+    for p in path_elements[1:]:
+        res = getattr(res, p)
+    return getattr(res, op)
+
 
 @serializable(canonical_name="ActionService", version=1)
 class ActionService(AbstractService):
@@ -241,6 +338,29 @@ class ActionService(AbstractService):
         # If it's not in the store or permission error, return the error
         return result
 
+    @service_method(path="action.wait", name="wait", roles=GUEST_ROLE_LEVEL)
+    def wait(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        timeout: float = 10.0,
+    ) -> Result[Ok[bool], Err[str]]:
+        """Long poll, returns once the object is resolved or after `timeout` seconds"""
+        uids = [uid]
+        obj = self._get(context, uid)
+        if obj.is_ok() and obj.ok().is_link:
+            uids.append(obj.ok().syft_action_data.action_object_id.id)
+
+        result: Result[Ok[bool], Err[str]] = Ok(False)
+
+        def check() -> bool:
+            nonlocal result
+            result = self.is_resolved(context, uid)
+            return result.is_err() or bool(result.ok())
+
+        change_notifier.wait_until(uids, check, timeout)
+        return result
+
     @service_method(
         path="action.resolve_links", name="resolve_links", roles=GUEST_ROLE_LEVEL
     )
@@ -294,39 +414,123 @@ class ActionService(AbstractService):
             uid=uid, credentials=context.credentials, has_permission=has_permission
         )
         if result.is_ok() and context.server is not None:
-            obj: TwinObject | ActionObject = result.ok()
-            obj._set_obj_location_(
-                context.server.id,
-                context.credentials,
+            return self._prepare_stored_obj(
+                context, result.ok(), twin_mode, resolve_nested
             )
-            # Resolve graph links
-            if (
-                not isinstance(obj, TwinObject)  # type: ignore[unreachable]
-                and resolve_nested
-                and obj.is_link
-            ):
-                if not self.is_resolved(  # type: ignore[unreachable]
-                    context, obj.syft_action_data.action_object_id.id
-                ).ok():
-                    return SyftError(message="This object is not resolved yet.")
-                result = self.resolve_links(
-                    context, obj.syft_action_data.action_object_id.id, twin_mode
-                )
-                return result
-            if isinstance(obj, TwinObject):
-                if twin_mode == TwinMode.PRIVATE:
-                    obj = obj.private
-                    obj.syft_point_to(context.server.id)
-                elif twin_mode == TwinMode.MOCK:
-                    obj = obj.mock
-                    obj.syft_point_to(context.server.id)
-                else:
-                    obj.mock.syft_point_to(context.server.id)
-                    obj.private.syft_point_to(context.server.id)
-            return Ok(obj)
         else:
             return result
 
+    def _get_many(
+        self,
+        context: AuthedServiceContext,
+        uids: list[UID],
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+        has_permission: bool = False,
+        resolve_nested: bool = True,
+    ) -> Result[list[ActionObject], str]:
+        """Get objects from the action store, in one read of the store"""
+        result = self.store.get_many(
+            uids=uids, credentials=context.credentials, has_permission=has_permission
+        )
+        if result.is_err():
+            return result
+        objs = result.ok()
+        missing = [uid for uid in uids if uid.id not in objs]
+        if missing:
+            return Err(
+                f"Could not find items with uids {missing}, or permission denied"
+            )
+
+        action_objects = []
+        for uid in uids:
+            res = self._prepare_stored_obj(
+                context, objs[uid.id], twin_mode, resolve_nested
+            )
+            if not isinstance(res, Ok):
+                return res
+            action_objects.append(res.ok())
+        return Ok(action_objects)
+
+    def _prepare_stored_obj(
+        self,
+        context: AuthedServiceContext,
+        obj: TwinObject | ActionObject,
+        twin_mode: TwinMode,
+        resolve_nested: bool,
+    ) -> Result[ActionObject, str]:
+        obj._set_obj_location_(
+            context.server.id,
+            context.credentials,
+        )
+        # Resolve graph links
+        if (
+            not isinstance(obj, TwinObject)  # type: ignore[unreachable]
+            and resolve_nested
+            and obj.is_link
+        ):
+            if not self.is_resolved(  # type: ignore[unreachable]
+                context, obj.syft_action_data.action_object_id.id
+            ).ok():
+                return SyftError(message="This object is not resolved yet.")
+            result = self.resolve_links(
+                context, obj.syft_action_data.action_object_id.id, twin_mode
+            )
+            return result
+        if isinstance(obj, TwinObject):
+            if twin_mode == TwinMode.PRIVATE:
+                obj = obj.private
+                obj.syft_point_to(context.server.id)
+            elif twin_mode == TwinMode.MOCK:
+                obj = obj.mock
+                obj.syft_point_to(context.server.id)
+            else:
+                obj.mock.syft_point_to(context.server.id)
+                obj.private.syft_point_to(context.server.id)
+        return Ok(obj)
+
+    def _load_action_data(
+        self,
+        context: AuthedServiceContext,
+        objs: list[ActionObject | TwinObject],
+    ) -> None:
+        """Download the blobs of `objs` concurrently, instead of one by one when
+        their data is read. At most `ACTION_DATA_MAX_IN_FLIGHT_MB` of blobs are
+        downloaded at once. Blobs that fail to download are downloaded again when
+        their data is read."""
+        action_objects: list[ActionObject] = []
+        for obj in objs:
+            if isinstance(obj, TwinObject):
+                action_objects += [obj.private, obj.mock]
+            elif isinstance(obj, ActionObject):
+                action_objects.append(obj)
+        pending = [
+            obj
+            for obj in action_objects
+            if obj.syft_blob_storage_entry_id
+            and obj.syft_created_at
+            and isinstance(obj.syft_action_data_cache, ActionDataEmpty)
+        ]
+        if len(pending) < 2:
+            return
+
+        blob_stash = context.server.get_service(BlobStorageService).stash
+        budget = InFlightBudget(ACTION_DATA_MAX_IN_FLIGHT_MB)
+
+        def release(mb: float) -> Callable[[Future], None]:
+            return lambda _: budget.release(mb)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(pending), ACTION_DATA_LOAD_WORKERS)
+        ) as executor:
+            for obj in pending:
+                entry = blob_stash.get_by_uid(
+                    context.server.verify_key, obj.syft_blob_storage_entry_id
+                ).ok()
+                mb = entry.file_size / (1024 * 1024) if entry is not None else 0.0
+                budget.acquire(mb)
+                future = executor.submit(obj.reload_cache)
+                future.add_done_callback(release(mb))
+
     @service_method(
         path="action.get_pointer", name="get_pointer", roles=GUEST_ROLE_LEVEL
     )
@@ -388,8 +592,9 @@ class ActionService(AbstractService):
         output_policy = code_item.get_output_policy(context)
 
         # Unwrap nested ActionObjects
-        for _k, arg in kwargs.items():
-            self.flatten_action_arg(context, arg) if isinstance(arg, UID) else None
+        self.flatten_action_args(
+            context, [arg for arg in kwargs.values() if isinstance(arg, UID)]
+        )
 
         if not override_execution_permission:
             if input_policy is None:
@@ -429,6 +634,8 @@ class ActionService(AbstractService):
             else:
                 filtered_kwargs = filtered_kwargs_res.ok()
 
+        self._load_action_data(context, list(filtered_kwargs.values()))
+
         # update input policy to track any input state
 
         has_twin_inputs = False
@@ -468,9 +675,23 @@ class ActionService(AbstractService):
                 private_kwargs = filter_twin_kwargs(
                     real_kwargs, twin_mode=TwinMode.PRIVATE, allow_python_types=True
                 )
-                private_exec_result = execute_byte_code(
-                    code_item, private_kwargs, context
+                mock_kwargs = filter_twin_kwargs(
+                    real_kwargs, twin_mode=TwinMode.MOCK, allow_python_types=True
                 )
+                skip_mock = (
+                    override_execution_permission and TWIN_SKIP_MOCK_FOR_APPROVED_CODE
+                ) or any(isinstance(v, ActionDataEmpty) for v in mock_kwargs.values())
+
+                mock_exec_result: UserCodeExecutionOutput | None = None
+                if skip_mock:
+                    private_exec_result = execute_byte_code(
+                        code_item, private_kwargs, context
+                    )
+                else:
+                    private_exec_result, mock_exec_result = execute_twin_branches(
+                        lambda: execute_byte_code(code_item, private_kwargs, context),
+                        lambda: execute_byte_code(code_item, mock_kwargs, context),
+                    )
                 if output_policy:
                     private_exec_result.result = output_policy.apply_to_output(
                         context,
@@ -483,18 +704,9 @@ class ActionService(AbstractService):
                     result_id, private_exec_result.result
                 )
 
-                mock_kwargs = filter_twin_kwargs(
-                    real_kwargs, twin_mode=TwinMode.MOCK, allow_python_types=True
-                )
-                # relative
-                from .action_data_empty import ActionDataEmpty
-
-                if any(isinstance(v, ActionDataEmpty) for v in mock_kwargs.values()):
+                if mock_exec_result is None:
                     mock_exec_result_obj = ActionDataEmpty()
                 else:
-                    mock_exec_result = execute_byte_code(
-                        code_item, mock_kwargs, context
-                    )
                     if output_policy:
                         mock_exec_result.result = output_policy.apply_to_output(
                             context, mock_exec_result.result, update_policy=False
@@ -596,25 +808,8 @@ class ActionService(AbstractService):
         context: AuthedServiceContext,
         plan_kwargs: dict[str, ActionObject],
     ) -> Result[ActionObject, str] | SyftError:
-        id2inpkey = {v.id: k for k, v in plan.inputs.items()}
-
-        for plan_action in plan.actions:
-            if (
-                hasattr(plan_action.remote_self, "id")
-                and plan_action.remote_self.id in id2inpkey
-            ):
-                plan_action.remote_self = plan_kwargs[
-                    id2inpkey[plan_action.remote_self.id]
-                ]
-            for i, arg in enumerate(plan_action.args):
-                if arg in id2inpkey:
-                    plan_action.args[i] = plan_kwargs[id2inpkey[arg]]
-
-            for k, arg in enumerate(plan_action.kwargs):
-                if arg in id2inpkey:
-                    plan_action.kwargs[k] = plan_kwargs[id2inpkey[arg]]
-
-        for plan_action in plan.actions:
+        # the stored plan is left as is, so it can be run again with other inputs
+        for plan_action in plan.remap_actions_to_inputs(**plan_kwargs):
             action_res = self.execute(context, plan_action)
             if isinstance(action_res, SyftError):
                 return action_res
@@ -625,9 +820,11 @@ class ActionService(AbstractService):
         self, context: AuthedServiceContext, action: Action
     ) -> Result[ActionObject, str] | Err:
         # run function/class init
-        _user_lib_config_registry = UserLibConfigRegistry.from_user(context.credentials)
         absolute_path = f"{action.path}.{action.op}"
-        if absolute_path in _user_lib_config_registry:
+        # only the config of this path is checked, instead of building the
+        # UserLibConfigRegistry of all paths for every call
+        lib_config = LibConfigRegistry.get_registered_configs().get(absolute_path)
+        if lib_config is not None and lib_config.has_permission(context.credentials):
             # TODO: implement properly
             # Now we are assuming its a function/class
             return execute_callable(self, context, action)
@@ -718,20 +915,22 @@ class ActionService(AbstractService):
     ) -> Result[TwinObject | Any, str]:
         if isinstance(resolved_self, TwinObject):
             # method
-            private_result = execute_object(
-                self,
-                context,
-                resolved_self.private,
-                action,
-                twin_mode=TwinMode.PRIVATE,
+            private_result, mock_result = execute_twin_branches(
+                lambda: execute_object(
+                    self,
+                    context,
+                    resolved_self.private,
+                    action,
+                    twin_mode=TwinMode.PRIVATE,
+                ),
+                lambda: execute_object(
+                    self, context, resolved_self.mock, action, twin_mode=TwinMode.MOCK
+                ),
             )
             if private_result.is_err():
                 return Err(
                     f"Failed executing action {action}, result is an error: {private_result.err()}"
                 )
-            mock_result = execute_object(
-                self, context, resolved_self.mock, action, twin_mode=TwinMode.MOCK
-            )
             if mock_result.is_err():
                 return Err(
                     f"Failed executing action {action}, result is an error: {mock_result.err()}"
@@ -814,7 +1013,34 @@ class ActionService(AbstractService):
         if res.is_err():
             return arg
 
-        action_object = res.ok()
+        self._flatten_action_object(context, res.ok())
+        return None
+
+    def flatten_action_args(
+        self, context: AuthedServiceContext, args: list[UID]
+    ) -> None:
+        """`flatten_action_arg` for all `args`, which are read from the store at once"""
+        res = self.store.get_many(uids=args, credentials=context.credentials)
+        if res.is_err():
+            return
+        for obj in res.ok().values():
+            action_object = self._prepare_stored_obj(
+                context, obj, TwinMode.PRIVATE, resolve_nested=True
+            )
+            if isinstance(action_object, Ok):
+                self._flatten_action_object(context, action_object.ok())
+
+    def _flatten_action_object(
+        self, context: AuthedServiceContext, action_object: ActionObject
+    ) -> None:
+        # only collections and ActionObjects contain ActionObjects, the data of
+        # other types isn't downloaded from the blob store to check
+        data_type = action_object.syft_action_data_type
+        if isinstance(data_type, type) and not issubclass(
+            data_type, list | dict | set | ActionObject
+        ):
+            return
+
         data = action_object.syft_action_data
 
         if self.contains_nested_actionobjects(data):
@@ -822,13 +1048,11 @@ class ActionService(AbstractService):
             # Update existing action object with the new flattened data
             action_object.syft_action_data_cache = new_data
             action_object._save_to_blob_storage()
-            res = self._set(
+            self._set(
                 context=context,
                 action_object=action_object,
             )
 
-        return None
-
     @service_method(path="action.execute", name="execute", roles=GUEST_ROLE_LEVEL)
     def execute(
         self, context: AuthedServiceContext, action: Action
@@ -1105,18 +1329,8 @@ def execute_callable(
 
     # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
     # is not bound to the original object or mutated
-    # stdlib
-
     # TODO: get from CMPTree is probably safer
-    def _get_target_callable(path: str, op: str) -> Any:
-        path_elements = path.split(".")
-        res = importlib.import_module(path_elements[0])
-        for p in path_elements[1:]:
-            res = getattr(res, p)
-        res = getattr(res, op)
-        return res
-
-    target_callable = _get_target_callable(action.path, action.op)
+    target_callable = resolve_callable(action.path, action.op)
 
     result = None
     try:
@@ -1130,18 +1344,17 @@ def execute_callable(
                 result = target_callable(*filtered_args, **filtered_kwargs)
                 result_action_object = wrap_result(action.result_id, result)
             else:
-                twin_mode = TwinMode.PRIVATE
-                private_args = filter_twin_args(args, twin_mode=twin_mode)
-                private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
-                private_result = target_callable(*private_args, **private_kwargs)
+                private_args = filter_twin_args(args, twin_mode=TwinMode.PRIVATE)
+                private_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.PRIVATE)
+                mock_args = filter_twin_args(args, twin_mode=TwinMode.MOCK)
+                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.MOCK)
+                private_result, mock_result = execute_twin_branches(
+                    partial(target_callable, *private_args, **private_kwargs),
+                    partial(target_callable, *mock_args, **mock_kwargs),
+                )
                 result_action_object_private = wrap_result(
                     action.result_id, private_result
                 )
-
-                twin_mode = TwinMode.MOCK
-                mock_args = filter_twin_args(args, twin_mode=twin_mode)
-                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
-                mock_result = target_callable(*mock_args, **mock_kwargs)
                 result_action_object_mock = wrap_result(action.result_id, mock_result)
 
                 result_action_object = TwinObject(
@@ -1193,14 +1406,15 @@ def execute_object(
                 # self isn't a twin but one of the inputs is
                 private_args = filter_twin_args(args, twin_mode=TwinMode.PRIVATE)
                 private_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.PRIVATE)
-                private_result = target_method(*private_args, **private_kwargs)
+                mock_args = filter_twin_args(args, twin_mode=TwinMode.MOCK)
+                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.MOCK)
+                private_result, mock_result = execute_twin_branches(
+                    partial(target_method, *private_args, **private_kwargs),
+                    partial(target_method, *mock_args, **mock_kwargs),
+                )
                 result_action_object_private = wrap_result(
                     action.result_id, private_result
                 )
-
-                mock_args = filter_twin_args(args, twin_mode=TwinMode.MOCK)
-                mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=TwinMode.MOCK)
-                mock_result = target_method(*mock_args, **mock_kwargs)
                 result_action_object_mock = wrap_result(action.result_id, mock_result)
 
                 result_action_object = TwinObject(
@@ -1218,7 +1432,6 @@ def execute_object(
                 # twin mock path
                 mock_args = filter_twin_args(args, twin_mode=twin_mode)  # type:ignore[unreachable]
                 mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
-                target_method = getattr(unboxed_resolved_self, action.op, None)
                 result = target_method(*mock_args, **mock_kwargs)
                 result_action_object = wrap_result(action.result_id, result)
             else:
@@ -13,6 +13,11 @@ from result import Result
 from ...serde.serializable import serializable
 from ...server.credentials import SyftSigningKey
 from ...server.credentials import SyftVerifyKey
+from ...store.change_log import CHANGE_DELETE
+from ...store.change_log import CHANGE_PERMISSIONS
+from ...store.change_log import CHANGE_SET
+from ...store.change_log import ChangeLog
+from ...store.change_notifier import change_notifier
 from ...store.dict_document_store import DictStoreConfig
 from ...store.document_store import BasePartitionSettings
 from ...store.document_store import DocumentStore
@@ -68,6 +73,12 @@ class KeyValueActionStore(ActionStore):
         self.storage_permissions = self.store_config.backing_store(
             "storage_permissions", self.settings, self.store_config, ddtype=set
         )
+        # uid -> (sequence number, op), for syncing changes only
+        self.change_log = ChangeLog(
+            self.store_config.backing_store(
+                "change_log", self.settings, self.store_config
+            )
+        )
 
         if root_verify_key is None:
             root_verify_key = SyftSigningKey.generate().verify_key
@@ -100,6 +111,29 @@ class KeyValueActionStore(ActionStore):
                 return Err(f"Could not find item with uid {uid}, {e}")
         return Err(f"Permission: {read_permission} denied")
 
+    def get_many(
+        self,
+        uids: list[UID],
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+    ) -> Result[dict[UID, SyftObject], str]:
+        """Get the objects `uids` in one read of the store. Objects that don't exist
+        or the credentials can't read are left out."""
+        uids = [uid.id for uid in uids]  # We only need the UID from LineageID or UID
+
+        if not (has_permission or self._has_full_permission(credentials)):
+            permissions = self.permissions.get_many(uids)
+            uids = [
+                uid
+                for uid in uids
+                if ActionObjectREAD(uid=uid, credentials=credentials).permission_string
+                in permissions.get(uid, set())
+            ]
+        try:
+            return Ok(self.data.get_many(uids))
+        except Exception as e:
+            return Err(f"Could not get items with uids {uids}, {e}")
+
     def get_mock(self, uid: UID) -> Result[SyftObject, str]:
         uid = uid.id  # We only need the UID from LineageID or UID
 
@@ -180,23 +214,25 @@ class KeyValueActionStore(ActionStore):
                 # create default permissions
                 self.permissions[uid] = set()
             if has_result_read_permission:
-                self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
+                self._add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
             else:
-                self.add_permissions(
-                    [
-                        ActionObjectWRITE(uid=uid, credentials=credentials),
-                        ActionObjectEXECUTE(uid=uid, credentials=credentials),
-                    ]
+                self._add_permission(
+                    ActionObjectWRITE(uid=uid, credentials=credentials)
+                )
+                self._add_permission(
+                    ActionObjectEXECUTE(uid=uid, credentials=credentials)
                 )
 
             if uid not in self.storage_permissions:
                 # create default storage permissions
                 self.storage_permissions[uid] = set()
             if add_storage_permission:
-                self.add_storage_permission(
+                self._add_storage_permission(
                     StoragePermission(uid=uid, server_uid=self.server_uid)
                 )
 
+            self.change_log.record(uid, CHANGE_SET)
+            change_notifier.notify(uid)
             return Ok(SyftSuccess(message=f"Set for ID: {uid}"))
         return Err(f"Permission: {write_permission} denied")
 
@@ -230,6 +266,7 @@ class KeyValueActionStore(ActionStore):
                 del self.data[uid]
             if uid in self.permissions:
                 del self.permissions[uid]
+            self.change_log.record(uid, CHANGE_DELETE)
             return Ok(SyftSuccess(message=f"ID: {uid} deleted"))
         return Err(f"Permission: {owner_permission} denied")
 
@@ -237,28 +274,9 @@ class KeyValueActionStore(ActionStore):
         if not isinstance(permission.permission, ActionPermission):
             raise Exception(f"ObjectPermission type: {permission.permission} not valid")
 
-        if (
-            permission.credentials is not None
-            and self.root_verify_key.verify == permission.credentials.verify
-        ):
+        if self._has_full_permission(permission.credentials):
             return True
 
-        if self.__user_stash is not None:
-            # relative
-            from ...service.user.user_roles import ServiceRole
-
-            res = self.__user_stash.get_by_verify_key(
-                credentials=permission.credentials,
-                verify_key=permission.credentials,
-            )
-
-            if (
-                res.is_ok()
-                and (user := res.ok()) is not None
-                and user.role in (ServiceRole.DATA_OWNER, ServiceRole.ADMIN)
-            ):
-                return True
-
         if (
             permission.uid in self.permissions
             and permission.permission_string in self.permissions[permission.uid]
@@ -277,22 +295,63 @@ class KeyValueActionStore(ActionStore):
 
         return False
 
+    def _has_full_permission(self, credentials: SyftVerifyKey | None) -> bool:
+        """The server and its data owners and admins have every permission."""
+        if (
+            credentials is not None
+            and self.root_verify_key.verify == credentials.verify
+        ):
+            return True
+
+        if self.__user_stash is not None:
+            # relative
+            from ...service.user.user_roles import ServiceRole
+
+            res = self.__user_stash.get_by_verify_key(
+                credentials=credentials,
+                verify_key=credentials,
+            )
+
+            if (
+                res.is_ok()
+                and (user := res.ok()) is not None
+                and user.role in (ServiceRole.DATA_OWNER, ServiceRole.ADMIN)
+            ):
+                return True
+        return False
+
     def has_permissions(self, permissions: list[ActionObjectPermission]) -> bool:
         return all(self.has_permission(p) for p in permissions)
 
-    def add_permission(self, permission: ActionObjectPermission) -> None:
+    def _record_permission_change(self, uid: UID) -> None:
+        # permissions of objects that are not stored yet are logged with the object
+        if uid in self.data:
+            self.change_log.record(uid, CHANGE_PERMISSIONS)
+
+    def changes_since(self, seq: int) -> Result[dict[UID, str], str]:
+        """Objects changed after change sequence number `seq`, uid -> op."""
+        return Ok(self.change_log.changes_since(seq))
+
+    def _add_permission(self, permission: ActionObjectPermission) -> None:
         permissions = self.permissions[permission.uid]
         permissions.add(permission.permission_string)
         self.permissions[permission.uid] = permissions
 
+    def add_permission(self, permission: ActionObjectPermission) -> None:
+        self._add_permission(permission)
+        self._record_permission_change(permission.uid)
+
     def remove_permission(self, permission: ActionObjectPermission) -> None:
         permissions = self.permissions[permission.uid]
         permissions.remove(permission.permission_string)
         self.permissions[permission.uid] = permissions
+        self._record_permission_change(permission.uid)
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
         for permission in permissions:
-            self.add_permission(permission)
+            self._add_permission(permission)
+        for uid in {permission.uid for permission in permissions}:
+            self._record_permission_change(uid)
 
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], str]:
         if uid in self.permissions:
@@ -302,19 +361,26 @@ class KeyValueActionStore(ActionStore):
     def get_all_permissions(self) -> Result[dict[UID, set[str]], str]:
         return Ok(dict(self.permissions.items()))
 
-    def add_storage_permission(self, permission: StoragePermission) -> None:
+    def _add_storage_permission(self, permission: StoragePermission) -> None:
         permissions = self.storage_permissions[permission.uid]
         permissions.add(permission.server_uid)
         self.storage_permissions[permission.uid] = permissions
 
+    def add_storage_permission(self, permission: StoragePermission) -> None:
+        self._add_storage_permission(permission)
+        self._record_permission_change(permission.uid)
+
     def add_storage_permissions(self, permissions: list[StoragePermission]) -> None:
         for permission in permissions:
-            self.add_storage_permission(permission)
+            self._add_storage_permission(permission)
+        for uid in {permission.uid for permission in permissions}:
+            self._record_permission_change(uid)
 
     def remove_storage_permission(self, permission: StoragePermission) -> None:
         permissions = self.storage_permissions[permission.uid]
         permissions.remove(permission.server_uid)
         self.storage_permissions[permission.uid] = permissions
+        self._record_permission_change(permission.uid)
 
     def has_storage_permission(self, permission: StoragePermission | UID) -> bool:
         if isinstance(permission, UID):
@@ -50,8 +50,28 @@ class Plan(SyftObject):
 
         return f"{obj_str}\n{inp_str}\n{act_str}\n{out_str}\n\n{plan_str}"
 
-    def remap_actions_to_inputs(self, **new_inputs: Any) -> None:
-        pass
+    def remap_actions_to_inputs(self, **new_inputs: Any) -> list[Action]:
+        """Copies of the traced actions, with the plan inputs replaced by `new_inputs`.
+
+        The plan itself is not changed, so it can be run again with other inputs.
+        """
+        id2input = {
+            v.id: new_inputs[k] for k, v in self.inputs.items() if k in new_inputs
+        }
+
+        def remap(arg: Any) -> Any:
+            return id2input.get(getattr(arg, "id", None), arg)
+
+        return [
+            action.model_copy(
+                update={
+                    "remote_self": remap(action.remote_self),
+                    "args": [remap(arg) for arg in action.args],
+                    "kwargs": {k: remap(v) for k, v in action.kwargs.items()},
+                }
+            )
+            for action in self.actions
+        ]
 
     def __call__(self, *args: Any, **kwargs: Any) -> ActionObject | list[ActionObject]:
         if len(self.outputs) == 1:
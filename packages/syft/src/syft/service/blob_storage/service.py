@@ -192,7 +192,11 @@ class BlobStorageService(AbstractService):
         roles=GUEST_ROLE_LEVEL,
     )
     def read(
-        self, context: AuthedServiceContext, uid: UID
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        offset: int | None = None,
+        length: int | None = None,
     ) -> BlobRetrieval | SyftError:
         result = self.stash.get_by_uid(context.credentials, uid=uid)
         if result.is_ok():
@@ -204,7 +208,11 @@ class BlobStorageService(AbstractService):
 
             with context.server.blob_storage_client.connect() as conn:
                 res: BlobRetrieval = conn.read(
-                    obj.location, obj.type_, bucket_name=obj.bucket_name
+                    obj.location,
+                    obj.type_,
+                    offset=offset,
+                    length=length,
+                    bucket_name=obj.bucket_name,
                 )
                 res.syft_blob_storage_entry_id = uid
                 res.file_size = obj.file_size
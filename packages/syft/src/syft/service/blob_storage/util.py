@@ -4,6 +4,8 @@ from typing import Any
 # relative
 from ...service.response import SyftException
 from ...util.util import get_mb_serialized_size
+from ...util.util import get_mb_size_of_serialized
+from ...util.util import get_serialized_with_mb_size
 from ..metadata.server_metadata import ServerMetadata
 from ..metadata.server_metadata import ServerMetadataJSON
 
@@ -21,3 +23,19 @@ def can_upload_to_blob_storage(
     if serialized_size.is_err():
         raise SyftException(f"{serialized_size.err()}")
     return serialized_size.ok() >= min_size_for_blob_storage_upload(metadata)
+
+
+def can_upload_serialized_to_blob_storage(
+    serialized: bytes, metadata: ServerMetadata | ServerMetadataJSON
+) -> bool:
+    return get_mb_size_of_serialized(serialized) >= min_size_for_blob_storage_upload(
+        metadata
+    )
+
+
+def serialize_for_blob_storage(data: Any) -> bytes:
+    result = get_serialized_with_mb_size(data)
+    if result.is_err():
+        raise SyftException(f"{result.err()}")
+    serialized, _ = result.ok()
+    return serialized
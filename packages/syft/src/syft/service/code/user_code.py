@@ -71,6 +71,7 @@ from ..action.action_object import Action
 from ..action.action_object import ActionObject
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
+from ..job.job_progress import JobProgressReporter
 from ..job.job_stash import Job
 from ..output.output_service import ExecutionOutput
 from ..output.output_service import OutputService
@@ -81,6 +82,7 @@ from ..policy.policy import EmpyInputPolicy
 from ..policy.policy import ExactMatch
 from ..policy.policy import InputPolicy
 from ..policy.policy import OutputPolicy
+from ..policy.policy import OutputPolicyExecuteCount
 from ..policy.policy import SingleExecutionExactOutput
 from ..policy.policy import SubmitUserPolicy
 from ..policy.policy import UserPolicy
@@ -690,6 +692,12 @@ class UserCode(SyncableSyftObject):
                 message="You must wait for the output policy to be approved"
             )
         output_ids = filter_only_uids(outputs)
+        # admins are not held to the limit, like when they run code themselves
+        limit = (
+            output_policy.limit
+            if isinstance(output_policy, OutputPolicyExecuteCount) and not is_admin
+            else None
+        )
 
         output_service = context.server.get_service("outputservice")
         output_service = cast(OutputService, output_service)
@@ -701,6 +709,7 @@ class UserCode(SyncableSyftObject):
             job_id=job_id,
             output_policy_id=self.output_policy_id,
             input_ids=input_ids,
+            output_policy_limit=limit,
         )
         if isinstance(execution_result, SyftError):
             return execution_result
@@ -1696,20 +1705,33 @@ class SecureContext:
         action_service = server.get_service("actionservice")
         # user_service = server.get_service("userservice")
 
+        def write_progress(
+            n_iters: int | None, current_iter: int | None, increment: int
+        ) -> None:
+            job_service.stash.update_progress(
+                context.credentials,
+                uid=context.job_id,
+                n_iters=n_iters,
+                current_iter=current_iter,
+                increment=increment,
+            )
+
+        progress = JobProgressReporter(
+            write_progress,
+            current_iter=context.job.current_iter if context.job is not None else None,
+        )
+
         def job_set_n_iters(n_iters: int) -> None:
-            job = context.job
-            job.n_iters = n_iters
-            job_service.update(context, job)
+            context.job.n_iters = n_iters
+            progress.set_n_iters(n_iters)
 
         def job_set_current_iter(current_iter: int) -> None:
-            job = context.job
-            job.current_iter = current_iter
-            job_service.update(context, job)
+            context.job.current_iter = current_iter
+            progress.set_current_iter(current_iter)
 
         def job_increase_current_iter(current_iter: int) -> None:
-            job = context.job
-            job.current_iter += current_iter
-            job_service.update(context, job)
+            progress.increase_current_iter(current_iter)
+            context.job.current_iter = progress.current_iter
 
         # def set_api_registry():
         #     user_signing_key = [
@@ -1767,6 +1789,7 @@ class SecureContext:
         self.job_set_n_iters = job_set_n_iters
         self.job_set_current_iter = job_set_current_iter
         self.job_increase_current_iter = job_increase_current_iter
+        self.job_flush_progress = progress.flush
         self.launch_job = launch_job
         self.is_async = context.job is not None
 
@@ -1905,6 +1928,10 @@ def execute_byte_code(
 
             result = Err(result_message)
 
+        # write the progress that is still buffered
+        if safe_context.is_async:
+            safe_context.job_flush_progress()
+
         # reset print
         print = original_print
 
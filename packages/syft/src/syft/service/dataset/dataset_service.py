@@ -144,20 +144,31 @@ class DatasetService(AbstractService):
         page_size: int | None = 0,
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset] | SyftError:
-        """Search a Dataset by name"""
-        results = self.get_all(context)
-
-        if isinstance(results, SyftError):
-            return results
-
-        filtered_results = [
-            dataset
-            for dataset_name, dataset in results.items()
-            if name in dataset_name and not dataset.to_be_deleted
-        ]
+        """Search Datasets by name, description, assets and contributors"""
+        result = self.stash.search(context.credentials, query=name)
+        if result.is_err():
+            return SyftError(message=result.err())
+        uids = result.ok()
+
+        # paginate the ranked uids, only the datasets of the page are loaded
+        slice_ = _paginate_collection(uids, page_size=page_size, page_index=page_index)
+        datasets = []
+        for uid in uids[slice_] if slice_ is not None else uids:
+            dataset_result = self.stash.get_by_uid(context.credentials, uid=uid)
+            if dataset_result.is_err():
+                return SyftError(message=dataset_result.err())
+            dataset = dataset_result.ok()
+            if dataset is None or dataset.to_be_deleted:
+                continue
+            if context.server is not None:
+                dataset.server_uid = context.server.id
+            datasets.append(dataset)
 
-        return _paginate_dataset_collection(
-            filtered_results, page_size=page_size, page_index=page_index
+        results = DictTuple(datasets, lambda dataset: dataset.name)
+        return (
+            results
+            if slice_ is None
+            else DatasetPageView(datasets=results, total=len(uids))
         )
 
     @service_method(path="dataset.get_by_id", name="get_by_id")
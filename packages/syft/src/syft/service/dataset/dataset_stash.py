@@ -13,6 +13,8 @@ from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
+from ...store.search_index import InMemorySearchIndex
+from ...store.search_index import SearchFields
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from .dataset import Dataset
@@ -22,6 +24,13 @@ NamePartitionKey = PartitionKey(key="name", type_=str)
 ActionIDsPartitionKey = PartitionKey(key="action_ids", type_=list[UID])
 
 
+class DatasetSearchIndex(InMemorySearchIndex):
+    def __init__(self) -> None:
+        super().__init__(
+            field_weights={"name": 4.0, "assets": 2.0, "contributors": 2.0},
+        )
+
+
 @instrument
 @serializable(canonical_name="DatasetStash", version=1)
 class DatasetStash(BaseUIDStoreStash):
@@ -29,10 +38,29 @@ class DatasetStash(BaseUIDStoreStash):
     settings: PartitionSettings = PartitionSettings(
         name=Dataset.__canonical_name__, object_type=Dataset
     )
+    search_index_type = DatasetSearchIndex
 
     def __init__(self, store: DocumentStore) -> None:
         super().__init__(store=store)
 
+    def search_fields(self, obj: Dataset) -> SearchFields | None:
+        if obj.to_be_deleted:
+            return None
+        contributors = [obj.uploader, *obj.contributors]
+        return {
+            "name": obj.name,
+            "description": obj.description.text if obj.description else "",
+            "summary": obj.summary or "",
+            "assets": " ".join(
+                f"{asset.name} {asset.description.text if asset.description else ''}"
+                for asset in obj.asset_list
+            ),
+            "contributors": " ".join(
+                f"{contributor.name} {contributor.email}"
+                for contributor in contributors
+            ),
+        }
+
     def get_by_name(
         self, credentials: SyftVerifyKey, name: str
     ) -> Result[Dataset | None, str]:
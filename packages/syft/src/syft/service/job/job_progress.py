@@ -0,0 +1,94 @@
+# stdlib
+from collections.abc import Callable
+import threading
+import time
+from typing import Any
+
+# relative
+from ...util.util import get_env
+
+# seconds between writes of the buffered progress of a job
+DEFAULT_PROGRESS_FLUSH_INTERVAL = float(get_env("JOB_PROGRESS_FLUSH_INTERVAL") or 1.0)
+# iterations after which buffered progress is written, regardless of the interval
+_flush_delta = get_env("JOB_PROGRESS_FLUSH_DELTA")
+DEFAULT_PROGRESS_FLUSH_DELTA = int(_flush_delta) if _flush_delta else None
+
+# write(n_iters, current_iter, increment)
+ProgressWriter = Callable[[int | None, int | None, int], Any]
+
+
+class JobProgressReporter:
+    """Buffers the progress user code reports for its job.
+
+    Every call to `set_current_iter` or `increase_current_iter` in a training
+    loop used to write the whole job record. The reporter keeps the changes in
+    memory and passes them to `write` once `flush_interval` seconds passed or
+    `flush_delta` iterations changed since the last write. Changes of `n_iters`
+    are written right away, the progress bar can't be drawn without them.
+    """
+
+    def __init__(
+        self,
+        write: ProgressWriter,
+        current_iter: int | None = None,
+        flush_interval: float = DEFAULT_PROGRESS_FLUSH_INTERVAL,
+        flush_delta: int | None = DEFAULT_PROGRESS_FLUSH_DELTA,
+    ) -> None:
+        self._write = write
+        self.flush_interval = flush_interval
+        self.flush_delta = flush_delta
+        self.current_iter = current_iter
+
+        self._lock = threading.Lock()
+        self._n_iters: int | None = None
+        self._current_iter: int | None = None
+        self._increment = 0
+        self._delta = 0
+        self._last_flush = time.monotonic()
+
+    @property
+    def has_pending(self) -> bool:
+        return (
+            self._n_iters is not None
+            or self._current_iter is not None
+            or self._increment != 0
+        )
+
+    def set_n_iters(self, n_iters: int) -> None:
+        with self._lock:
+            self._n_iters = n_iters
+            self._flush()
+
+    def set_current_iter(self, current_iter: int) -> None:
+        with self._lock:
+            self._delta += abs(current_iter - (self.current_iter or 0))
+            self.current_iter = current_iter
+            self._current_iter = current_iter
+            self._increment = 0
+            self._maybe_flush()
+
+    def increase_current_iter(self, n: int) -> None:
+        with self._lock:
+            self._delta += abs(n)
+            self.current_iter = (self.current_iter or 0) + n
+            self._increment += n
+            self._maybe_flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval or (
+            self.flush_delta is not None and self._delta >= self.flush_delta
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.has_pending:
+            self._write(self._n_iters, self._current_iter, self._increment)
+        self._n_iters = None
+        self._current_iter = None
+        self._increment = 0
+        self._delta = 0
+        self._last_flush = time.monotonic()
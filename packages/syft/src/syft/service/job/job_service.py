@@ -8,6 +8,7 @@ from typing import cast
 # relative
 from ...serde.serializable import serializable
 from ...server.worker_settings import WorkerSettings
+from ...store.change_notifier import change_notifier
 from ...store.document_store import DocumentStore
 from ...types.uid import UID
 from ...util.telemetry import instrument
@@ -67,6 +68,34 @@ class JobService(AbstractService):
             res = res.ok()
             return res
 
+    @service_method(
+        path="job.wait",
+        name="wait",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def wait(
+        self, context: AuthedServiceContext, uid: UID, timeout: float = 10.0
+    ) -> Job | SyftError:
+        """Long poll, returns the job once it is resolved or after `timeout` seconds"""
+        job: Job | None = None
+        error: str | None = None
+
+        def is_resolved() -> bool:
+            nonlocal job, error
+            res = self.stash.get_by_uid(context.credentials, uid=uid)
+            if res.is_err():
+                error = res.err()
+                return True
+            job = res.ok()
+            return job is None or job.resolved
+
+        change_notifier.wait_until([uid], is_resolved, timeout)
+        if error is not None:
+            return SyftError(message=error)
+        if job is None:
+            return SyftError(message=f"Job {uid} does not exist")
+        return job
+
     @service_method(path="job.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get_all(self, context: AuthedServiceContext) -> list[Job] | SyftError:
         res = self.stash.get_all(context.credentials)
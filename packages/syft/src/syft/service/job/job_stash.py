@@ -6,6 +6,8 @@ from datetime import timezone
 from enum import Enum
 import random
 from string import Template
+import threading
+import time
 from time import sleep
 from typing import Any
 
@@ -24,6 +26,7 @@ from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...service.context import AuthedServiceContext
 from ...service.worker.worker_pool import SyftWorker
+from ...store.change_notifier import change_notifier
 from ...store.document_store import BaseUIDStoreStash
 from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
@@ -44,6 +47,9 @@ from ...util.telemetry import instrument
 from ...util.util import prompt_warning_message
 from ..action.action_object import Action
 from ..action.action_object import ActionObject
+from ..action.action_object import WAIT_LONG_POLL_TIMEOUT
+from ..action.action_object import WAIT_MAX_BACKOFF
+from ..action.action_object import WAIT_MIN_BACKOFF
 from ..action.action_permissions import ActionObjectPermission
 from ..log.log import SyftLog
 from ..response import SyftError
@@ -333,6 +339,9 @@ class Job(SyncableSyftObject):
         job: Job | None = api.make_call(call)
         if job is None:
             return None
+        self._update_from(job)
+
+    def _update_from(self, job: "Job") -> None:
         self.resolved = job.resolved
         if job.resolved:
             self.result = job.result
@@ -680,10 +689,39 @@ class Job(SyncableSyftObject):
                 f"by setting n_consumers > 0."
             )
 
+        # servers running an older version don't have the `job.wait` endpoint
+        long_poll = api.services.job.has_submodule("wait")
         print_warning = True
-        counter = 0
+        backoff = WAIT_MIN_BACKOFF
+        start = time.monotonic()
         while True:
-            self.fetch()
+            remaining = (
+                None if timeout is None else timeout - (time.monotonic() - start)
+            )
+            if remaining is not None and remaining <= 0:
+                return SyftError(message="Reached Timeout!")
+            poll_timeout = (
+                WAIT_LONG_POLL_TIMEOUT
+                if remaining is None
+                else min(WAIT_LONG_POLL_TIMEOUT, remaining)
+            )
+
+            # block on the server until the job is resolved, back off before
+            # polling again when the server returned early without blocking
+            poll_start = time.monotonic()
+            job = (
+                api.services.job.wait(uid=self.id, timeout=poll_timeout)
+                if long_poll
+                else None
+            )
+            if isinstance(job, Job):
+                self._update_from(job)
+            else:
+                self.fetch()
+            if not self.resolved and time.monotonic() - poll_start < poll_timeout / 2:
+                sleep(backoff)
+                backoff = min(backoff * 2, WAIT_MAX_BACKOFF)
+
             if self.resolved:
                 if isinstance(self.result, SyftError | Err) or self.status in [  # type: ignore[unreachable]
                     JobStatus.ERRORED,
@@ -705,13 +743,6 @@ class Job(SyncableSyftObject):
                     )
                     print_warning = False
 
-            sleep(1)
-
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
-                    return SyftError(message="Reached Timeout!")
-
         # if self.resolve returns self.result as error, then we
         # return SyftError and not wait for the result
         # otherwise if a job is resolved and not errored out, we wait for the result
@@ -841,6 +872,10 @@ class JobInfo(SyftObject):
         return info
 
 
+# makes the read-modify-write in `JobStash._update_fields` atomic within a process
+_job_update_lock = threading.Lock()
+
+
 @instrument
 @serializable(canonical_name="JobStash", version=1)
 class JobStash(BaseUIDStoreStash):
@@ -870,7 +905,114 @@ class JobStash(BaseUIDStoreStash):
         ):
             item.result._clear_cache()
 
-        return super().update(credentials, item, add_permissions)
+        res = super().update(credentials, item, add_permissions)
+        if res.is_ok():
+            change_notifier.notify(item.id)
+        return res
+
+    def set(
+        self,
+        credentials: SyftVerifyKey,
+        obj: Job,
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[Job, str]:
+        res = super().set(
+            credentials,
+            obj,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+            ignore_duplicates=ignore_duplicates,
+        )
+        if res.is_ok():
+            change_notifier.notify(obj.id)
+        return res
+
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: Job,
+        has_permission: bool = False,
+    ) -> Result[Job, str]:
+        res = super().update(credentials, obj, has_permission=has_permission)
+        if res.is_ok():
+            change_notifier.notify(obj.id)
+        return res
+
+    def _update_fields(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        apply: Callable[[Job], bool],
+    ) -> Result[Job, str]:
+        """Read-modify-write of a single job, `apply` returns if the job has to be written.
+
+        Only the fields set by `apply` change, so writes of other fields since the
+        caller last fetched the job are not overwritten.
+        """
+        with _job_update_lock:
+            res = self.get_by_uid(credentials, uid)
+            if res.is_err():
+                return res
+            job = res.ok()
+            if job is None:
+                return Err(f"Job {uid} does not exist")
+            if not apply(job):
+                return Ok(job)
+            return self.update(credentials, job)
+
+    def update_progress(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        n_iters: int | None = None,
+        current_iter: int | None = None,
+        increment: int = 0,
+    ) -> Result[Job, str]:
+        """Apply a progress change to the stored job, leaving its other fields as they are.
+
+        `current_iter` is set before `increment` is added to it.
+        """
+
+        def apply(job: Job) -> bool:
+            if n_iters is not None:
+                job.n_iters = n_iters
+            if current_iter is not None:
+                job.current_iter = current_iter
+            if increment:
+                job.current_iter = (job.current_iter or 0) + increment
+            return True
+
+        return self._update_fields(credentials, uid, apply)
+
+    def set_processing(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        server_uid: UID,
+        job_worker_id: UID | None = None,
+        job_pid: int | None = None,
+    ) -> Result[Job, str]:
+        """Mark a job as picked up by a consumer, in a single write.
+
+        Jobs that were resolved in the meantime, e.g. by a subprocess that finished
+        before the consumer recorded its pid, are left as they are.
+        """
+
+        def apply(job: Job) -> bool:
+            if job.resolved:
+                return False
+            job.status = JobStatus.PROCESSING
+            job.server_uid = server_uid
+            job.updated_at = DateTime.now()
+            if job_worker_id is not None:
+                job.job_worker_id = job_worker_id
+            if job_pid is not None:
+                job.job_pid = job_pid
+            return True
+
+        return self._update_fields(credentials, uid, apply)
 
     def get_by_result_id(
         self,
@@ -53,13 +53,19 @@ class LogService(AbstractService):
         if result.is_err():
             return SyftError(message=str(result.err()))
         new_log = result.ok()
-        if new_str:
-            new_log.append(new_str)
 
-        if new_err:
-            new_log.append_error(new_err)
+        def append_to(log: SyftLog | None) -> SyftLog:
+            log = new_log if log is None else log
+            if new_str:
+                log.append(new_str)
 
-        result = self.stash.update(context.credentials, new_log)
+            if new_err:
+                log.append_error(new_err)
+            return log
+
+        # appended under the lock of the partition, so concurrent appends, like the
+        # ones of the private and the mock run of a function, aren't lost
+        result = self.stash.partition.update_with(context.credentials, uid, append_to)
         if result.is_err():
             return SyftError(message=str(result.err()))
         return SyftSuccess(message="Log Append successful!")
@@ -456,6 +456,11 @@ class MigrationService(AbstractService):
                     )
         return Ok(migrated_objects)
 
+    def _reconcile_execution_counts(self, context: AuthedServiceContext) -> Result:
+        # outputs are written to their partition directly, not counted on the way
+        output_stash = context.server.get_service("outputservice").stash
+        return output_stash.reconcile_execution_counts(context.credentials)
+
     @service_method(
         path="migration.migrate_data",
         name="migrate_data",
@@ -500,6 +505,9 @@ class MigrationService(AbstractService):
         )
         if objects_update_update_result.is_err():
             return SyftError(message=objects_update_update_result.value)
+        counts_result = self._reconcile_execution_counts(context)
+        if counts_result.is_err():
+            return SyftError(message=counts_result.err())
 
         migration_actionobjects_result = self._get_migration_actionobjects(context)
 
@@ -651,6 +659,9 @@ class MigrationService(AbstractService):
         store_objects_result = self._create_migrated_objects(context, migrated_objects)
         if store_objects_result.is_err():
             return SyftError(message=store_objects_result.err())
+        counts_result = self._reconcile_execution_counts(context)
+        if counts_result.is_err():
+            return SyftError(message=counts_result.err())
 
         # migrate+apply action objects
         migrated_actionobjects = self._migrate_objects(
@@ -10,6 +10,7 @@ from result import Result
 
 # relative
 from ...abstract_server import ServerType
+from ...client.client import HTTPConnection
 from ...client.client import ServerConnection
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
@@ -221,7 +222,7 @@ class ServerPeer(SyftObject):
         return self.server_routes[-1] if self.server_routes else None
 
     def client_with_context(
-        self, context: ServerServiceContext
+        self, context: ServerServiceContext, timeout: float | None = None
     ) -> Result[type[SyftClient], str]:
         # third party
 
@@ -230,6 +231,8 @@ class ServerPeer(SyftObject):
         # select the route with highest priority to connect to the peer
         final_route: ServerRoute = self.pick_highest_priority_route()
         connection: ServerConnection = route_to_connection(route=final_route)
+        if isinstance(connection, HTTPConnection):
+            connection.set_timeout(timeout)
         try:
             client_type = connection.get_client_type()
         except Exception as e:
@@ -1,31 +1,134 @@
 # stdlib
+from concurrent import futures
 import logging
+import math
+import random
 import threading
-import time
 from typing import cast
 
 # relative
+from ...client.client import SyftClient
 from ...serde.serializable import serializable
 from ...types.datetime import DateTime
+from ...types.uid import UID
+from ...util.util import get_env
+from ...util.util import run_with_deadlines
 from ..context import AuthedServiceContext
 from ..response import SyftError
 from .network_service import NetworkService
 from .network_service import ServerPeerAssociationStatus
+from .routes import ServerRoute
 from .server_peer import ServerPeer
 from .server_peer import ServerPeerConnectionStatus
 from .server_peer import ServerPeerUpdate
 
 logger = logging.getLogger(__name__)
 
+# peers checked at the same time
+PEER_HEALTH_CHECK_WORKERS = int(get_env("PEER_HEALTH_CHECK_WORKERS") or 16)
+# seconds a peer has to answer before it is marked as timed out
+PEER_HEALTH_CHECK_TIMEOUT = float(get_env("PEER_HEALTH_CHECK_TIMEOUT") or 10)
 
-@serializable(without=["thread"], canonical_name="PeerHealthCheckTask", version=1)
+
+@serializable(
+    without=["thread", "_stop_event", "_clients", "_clients_lock", "_executor"],
+    canonical_name="PeerHealthCheckTask",
+    version=1,
+)
 class PeerHealthCheckTask:
+    """Pings all peers of the server every `repeat_time` seconds.
+
+    Peers are checked concurrently and every peer has `peer_timeout` seconds to
+    answer, counted from when its check started and also used as the timeout of
+    its HTTP requests, so a slow or dead peer doesn't hold up the others. Clients are kept
+    between rounds for as long as the peer's route doesn't change, reusing their
+    connections and APIs. The interval between rounds varies randomly by
+    up to `jitter` of it, so the servers of a network don't ping at the same time.
+    """
+
     repeat_time = 10  # in seconds
+    jitter = 0.2
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_workers: int = PEER_HEALTH_CHECK_WORKERS,
+        peer_timeout: float = PEER_HEALTH_CHECK_TIMEOUT,
+    ) -> None:
         self.thread: threading.Thread | None = None
         self.started_time = None
-        self._stop = False
+        self.max_workers = max_workers
+        self.peer_timeout = peer_timeout
+        self._stop_event = threading.Event()
+        # peer id -> (route, client), reused while the route stays the same
+        self._clients: dict[UID, tuple[ServerRoute, SyftClient]] = {}
+        self._clients_lock = threading.Lock()
+        # shared between rounds, so calls to peers that don't answer in time
+        # keep a worker busy instead of an abandoned pool each
+        self._executor: futures.ThreadPoolExecutor | None = None
+
+    def _client_for(
+        self, context: AuthedServiceContext, peer: ServerPeer
+    ) -> SyftClient:
+        route = peer.pick_highest_priority_route()
+        with self._clients_lock:
+            cached = self._clients.get(peer.id)
+        if cached is not None and cached[0] == route:
+            return cached[1]
+
+        peer_client = peer.client_with_context(
+            context=context, timeout=self.peer_timeout
+        )
+        if peer_client.is_err():
+            raise Exception(peer_client.err())
+        client = peer_client.ok()
+        with self._clients_lock:
+            self._clients[peer.id] = (route, client)
+        return client
+
+    def _get_executor(self) -> futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="peer-health-check"
+            )
+        return self._executor
+
+    def _drop_client(self, peer: ServerPeer) -> None:
+        with self._clients_lock:
+            self._clients.pop(peer.id, None)
+
+    def check_peer(
+        self, context: AuthedServiceContext, peer: ServerPeer
+    ) -> ServerPeerUpdate:
+        peer_update = ServerPeerUpdate(id=peer.id)
+        peer_update.pinged_timestamp = DateTime.now()
+        try:
+            peer_client = self._client_for(context, peer)
+            peer_status = peer_client.api.services.network.check_peer_association(
+                peer_id=context.server.id
+            )
+        except Exception as e:
+            logger.error(f"Failed to ping peer: {peer}", exc_info=e)
+            self._drop_client(peer)
+            peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
+            return peer_update
+
+        peer_update.ping_status = (
+            ServerPeerConnectionStatus.ACTIVE
+            if peer_status == ServerPeerAssociationStatus.PEER_ASSOCIATED
+            else ServerPeerConnectionStatus.INACTIVE
+        )
+        if isinstance(peer_status, SyftError):
+            # the peer may have restarted, connect again next time
+            self._drop_client(peer)
+            peer_update.ping_status_message = (
+                f"Error `{peer_status.message}` when pinging peer '{peer.name}'"
+            )
+        else:
+            peer_update.ping_status_message = (
+                f"Peer '{peer.name}''s ping status: "
+                f"{peer_update.ping_status.value.lower()}"
+            )
+        return peer_update
 
     def peer_route_heathcheck(self, context: AuthedServiceContext) -> SyftError | None:
         """
@@ -52,62 +155,63 @@ class PeerHealthCheckTask:
             return SyftError(message=f"{result.err()}")
 
         all_peers: list[ServerPeer] = result.ok()
-
-        for peer in all_peers:
+        if not all_peers:
+            return None
+
+        with self._clients_lock:
+            peer_ids = {peer.id for peer in all_peers}
+            for peer_id in list(self._clients):
+                if peer_id not in peer_ids:
+                    del self._clients[peer_id]
+
+        # a call times out `peer_timeout` seconds after it started, calls still
+        # queued behind peers that don't answer are skipped until the next round
+        workers = min(self.max_workers, len(all_peers))
+        pending = run_with_deadlines(
+            self._get_executor(),
+            lambda peer: self.check_peer(context, peer),
+            all_peers,
+            timeout=self.peer_timeout,
+            max_wait=self.peer_timeout * (math.ceil(len(all_peers) / workers) + 1),
+        )
+        peer_updates = []
+        for peer, future in zip(all_peers, pending):
+            if future.cancelled():
+                continue
+            if future.done():
+                peer_updates.append(future.result())
+                continue
+            self._drop_client(peer)
             peer_update = ServerPeerUpdate(id=peer.id)
             peer_update.pinged_timestamp = DateTime.now()
-            try:
-                peer_client = peer.client_with_context(context=context)
-                if peer_client.is_err():
-                    logger.error(
-                        f"Failed to create client for peer: {peer}: {peer_client.err()}"
-                    )
-                    peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
-                    peer_client = None
-            except Exception as e:
-                logger.error(f"Failed to create client for peer: {peer}", exc_info=e)
-
-                peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
-                peer_client = None
-
-            if peer_client is not None:
-                peer_client = peer_client.ok()
-                peer_status = peer_client.api.services.network.check_peer_association(
-                    peer_id=context.server.id
-                )
-                peer_update.ping_status = (
-                    ServerPeerConnectionStatus.ACTIVE
-                    if peer_status == ServerPeerAssociationStatus.PEER_ASSOCIATED
-                    else ServerPeerConnectionStatus.INACTIVE
-                )
-                if isinstance(peer_status, SyftError):
-                    peer_update.ping_status_message = (
-                        f"Error `{peer_status.message}` when pinging peer '{peer.name}'"
-                    )
-                else:
-                    peer_update.ping_status_message = (
-                        f"Peer '{peer.name}''s ping status: "
-                        f"{peer_update.ping_status.value.lower()}"
-                    )
-
-            result = network_stash.update(
-                credentials=context.server.verify_key,
-                peer_update=peer_update,
-                has_permission=True,
+            peer_update.ping_status = ServerPeerConnectionStatus.TIMEOUT
+            peer_update.ping_status_message = (
+                f"Peer '{peer.name}' did not answer within {self.peer_timeout}s"
             )
+            peer_updates.append(peer_update)
 
-            if result.is_err():
-                logger.error(f"Failed to update peer in stash: {result.err()}")
+        result = network_stash.update_many(
+            credentials=context.server.verify_key,
+            objs=peer_updates,
+            has_permission=True,
+        )
+        if result.is_err():
+            logger.error(f"Failed to update peers in stash: {result.err()}")
+        else:
+            for update_result in result.ok():
+                if update_result.is_err():
+                    logger.error(
+                        f"Failed to update peer in stash: {update_result.err()}"
+                    )
 
         return None
 
     def _run(self, context: AuthedServiceContext) -> None:
         self.started_time = DateTime.now()
-        while True:
-            if self._stop:
-                break
+        delay = self.repeat_time * random.uniform(0, self.jitter)  # nosec
+        while not self._stop_event.wait(delay):
             self.peer_route_heathcheck(context)
-            time.sleep(self.repeat_time)
+            delay = self.repeat_time * random.uniform(1 - self.jitter, 1 + self.jitter)  # nosec
 
     def run(self, context: AuthedServiceContext) -> None:
         if self.thread is not None:
@@ -116,6 +220,7 @@ class PeerHealthCheckTask:
                 f"{self.thread.name} with ID: {self.thread.ident}."
             )
         else:
+            self._stop_event.clear()
             self.thread = threading.Thread(target=self._run, args=(context,))
             logger.info(
                 f"Start running peers health check in thread "
@@ -125,8 +230,11 @@ class PeerHealthCheckTask:
 
     def stop(self) -> None:
         if self.thread:
-            self._stop = True
+            self._stop_event.set()
             self.thread.join()
             self.thread = None
             self.started_time = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Peer health check task stopped.")
@@ -1,4 +1,5 @@
 # stdlib
+from collections.abc import Iterable
 
 # third party
 from result import Err
@@ -104,6 +105,26 @@ class NotificationStash(BaseUIDStoreStash):
         )
         return self.query_one(credentials=credentials, qks=qks)
 
+    def get_by_linked_obj_uids(
+        self, credentials: SyftVerifyKey, obj_uids: Iterable[UID]
+    ) -> Result[dict[UID, Notification], str]:
+        """Notifications linked to any of `obj_uids`, by the uid of the object.
+
+        Reads the partition once instead of once per object.
+        """
+        obj_uids = set(obj_uids)
+        result = self.get_all(credentials)
+        if result.is_err():
+            return result
+        notifications: dict[UID, Notification] = {}
+        for notification in result.ok():
+            if notification.linked_obj is None:
+                continue
+            obj_uid = notification.linked_obj.object_uid
+            if obj_uid in obj_uids and obj_uid not in notifications:
+                notifications[obj_uid] = notification
+        return Ok(notifications)
+
     def update_notification_status(
         self, credentials: SyftVerifyKey, uid: UID, status: NotificationStatus
     ) -> Result[Notification, str]:
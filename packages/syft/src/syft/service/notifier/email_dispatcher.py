@@ -0,0 +1,305 @@
+# stdlib
+import logging
+import smtplib
+import threading
+import time
+from typing import Any
+
+# third party
+from pydantic import Field
+from result import Ok
+from result import Result
+
+# relative
+from ...serde.serializable import serializable
+from ...server.credentials import SyftVerifyKey
+from ...store.document_store import BaseUIDStoreStash
+from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionSettings
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
+from ...util.util import get_env
+from ..context import AuthedServiceContext
+from .smtp_client import SMTPClient
+
+logger = logging.getLogger(__name__)
+
+# emails sent over one connection before the queue is read again
+EMAIL_BATCH_SIZE = int(get_env("EMAIL_BATCH_SIZE") or 50)
+# emails sent per second at most, 0 for no limit
+EMAIL_SEND_RATE = float(get_env("EMAIL_SEND_RATE") or 10)
+EMAIL_MAX_ATTEMPTS = int(get_env("EMAIL_MAX_ATTEMPTS") or 5)
+# seconds before the first retry of an email, doubled on every further attempt
+EMAIL_RETRY_BACKOFF = float(get_env("EMAIL_RETRY_BACKOFF") or 30)
+EMAIL_MAX_RETRY_BACKOFF = 3600
+# seconds an email is reserved for the dispatcher sending it, after which other
+# dispatchers sharing the store may send it, if it is still queued
+EMAIL_SEND_LEASE = 300
+# seconds an unused SMTP connection is kept open
+SMTP_IDLE_TIMEOUT = 60.0
+
+
+@serializable()
+class QueuedEmail(SyftObject):
+    __canonical_name__ = "QueuedEmail"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    sender: str
+    receiver: list[str]
+    subject: str
+    body: str
+    attempts: int = 0
+    # time.time() after which the email is sent
+    send_after: float = Field(default_factory=time.time)
+    last_error: str | None = None
+
+
+@serializable(canonical_name="QueuedEmailStash", version=1)
+class QueuedEmailStash(BaseUIDStoreStash):
+    object_type = QueuedEmail
+    settings: PartitionSettings = PartitionSettings(
+        name=QueuedEmail.__canonical_name__, object_type=QueuedEmail
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+    def get_due(
+        self, credentials: SyftVerifyKey, limit: int
+    ) -> Result[list[QueuedEmail], str]:
+        result = self.get_all(credentials, has_permission=True)
+        if result.is_err():
+            return result
+        now = time.time()
+        due = sorted(
+            (email for email in result.ok() if email.send_after <= now),
+            key=lambda email: email.send_after,
+        )
+        return Ok(due[:limit])
+
+    def reserve(
+        self, credentials: SyftVerifyKey, email: QueuedEmail, until: float
+    ) -> Result[QueuedEmail, str]:
+        """Hold `email` back for other dispatchers until `until`, unless it was
+        reserved, rescheduled or sent since it was read."""
+
+        def reserve_email(current: QueuedEmail | None) -> QueuedEmail:
+            if current is None or current.send_after != email.send_after:
+                raise ValueError(f"Email {email.id} was taken by another dispatcher")
+            current.send_after = until
+            return current
+
+        return self.partition.update_with(
+            credentials, email.id, reserve_email, has_permission=True
+        )
+
+    def next_send_after(self, credentials: SyftVerifyKey) -> float | None:
+        result = self.get_all(credentials, has_permission=True)
+        if result.is_err() or not result.ok():
+            return None
+        return min(email.send_after for email in result.ok())
+
+
+def retry_delay(attempts: int) -> float:
+    return min(EMAIL_RETRY_BACKOFF * 2 ** (attempts - 1), EMAIL_MAX_RETRY_BACKOFF)
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """Rejections by the mail server that fail again when retried."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500 and not isinstance(
+            error, smtplib.SMTPAuthenticationError
+        )
+    return isinstance(error, ValueError)
+
+
+@serializable(
+    without=["thread", "_lock", "_wakeup", "_stop", "_smtp", "_smtp_key", "_smtp_used"],
+    canonical_name="EmailDispatcher",
+    version=1,
+)
+class EmailDispatcher:
+    """Sends queued emails in the background, so API calls don't wait on SMTP.
+
+    Emails are queued in a stash, so they survive restarts, and sent in batches
+    over one SMTP connection, which is kept open between batches for
+    `SMTP_IDLE_TIMEOUT` seconds. At most `send_rate` emails are sent per second.
+    Emails that fail to send are retried with exponential backoff, up to
+    `max_attempts` times. How many emails a user gets per day is limited by
+    `NotifierService.dispatch_notification`, before they are queued.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = EMAIL_BATCH_SIZE,
+        send_rate: float = EMAIL_SEND_RATE,
+        max_attempts: int = EMAIL_MAX_ATTEMPTS,
+    ) -> None:
+        self.batch_size = batch_size
+        self.send_rate = send_rate
+        self.max_attempts = max_attempts
+        self.thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_key: tuple[Any, ...] | None = None
+        self._smtp_used = 0.0
+
+    def enqueue(
+        self, context: AuthedServiceContext, email: QueuedEmail
+    ) -> Result[QueuedEmail, str]:
+        stash = context.server.get_service("notifierservice").email_queue_stash
+        result = stash.set(context.server.verify_key, email)
+        if result.is_ok():
+            self.run(context)
+            self._wakeup.set()
+        return result
+
+    def _connection(self, smtp_client: SMTPClient) -> smtplib.SMTP:
+        key = (
+            smtp_client.server,
+            smtp_client.port,
+            smtp_client.username,
+            smtp_client.password,
+        )
+        if self._smtp is not None and self._smtp_key == key:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        self._close_connection()
+        smtp = smtp_client.connect()
+        self._smtp = smtp
+        self._smtp_key = key
+        return smtp
+
+    def _close_connection(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:  # nosec
+            pass
+        self._smtp = None
+        self._smtp_key = None
+
+    def dispatch(self, context: AuthedServiceContext) -> int:
+        """Send one batch of due emails, returns the number of emails sent."""
+        notifier_service = context.server.get_service("notifierservice")
+        stash: QueuedEmailStash = notifier_service.email_queue_stash
+        credentials = context.server.verify_key
+
+        result = stash.get_due(credentials, self.batch_size)
+        if result.is_err():
+            logger.error(f"Failed to read queued emails: {result.err()}")
+            return 0
+        emails = result.ok()
+        if not emails:
+            return 0
+
+        settings = notifier_service.stash.get(credentials).ok()
+        if settings is None or not settings.active:
+            # sent once notifications are turned on again
+            for email in emails:
+                email.send_after = time.time() + EMAIL_RETRY_BACKOFF
+            stash.update_many(credentials, emails, has_permission=True)
+            return 0
+
+        # reserve the batch, emails other dispatchers sharing the store reserved
+        # after they were read are left to them
+        reserved = []
+        for email in emails:
+            result = stash.reserve(credentials, email, time.time() + EMAIL_SEND_LEASE)
+            if result.is_ok():
+                reserved.append(result.ok())
+        emails = reserved
+
+        smtp_client = SMTPClient(
+            server=settings.email_server,
+            port=settings.email_port,
+            username=settings.email_username,
+            password=settings.email_password,
+        )
+        sent = 0
+        failed = []
+        for i, email in enumerate(emails):
+            if self.send_rate > 0 and i > 0:
+                time.sleep(1 / self.send_rate)
+            try:
+                SMTPClient.send_with(
+                    self._connection(smtp_client),
+                    email.sender,
+                    email.receiver,
+                    email.subject,
+                    email.body,
+                )
+            except Exception as e:
+                self._close_connection()
+                email.attempts += 1
+                email.last_error = str(e)
+                if is_permanent_failure(e) or email.attempts >= self.max_attempts:
+                    logger.error(
+                        f"Failed to send email '{email.subject}' to {email.receiver} "
+                        f"after {email.attempts} attempts: {e}"
+                    )
+                    stash.delete_by_uid(credentials, email.id)
+                else:
+                    email.send_after = time.time() + retry_delay(email.attempts)
+                    failed.append(email)
+                continue
+            self._smtp_used = time.monotonic()
+            stash.delete_by_uid(credentials, email.id)
+            sent += 1
+
+        if failed:
+            stash.update_many(credentials, failed, has_permission=True)
+        return sent
+
+    def _wait_time(self, context: AuthedServiceContext) -> float:
+        stash = context.server.get_service("notifierservice").email_queue_stash
+        send_after = stash.next_send_after(context.server.verify_key)
+        wait = SMTP_IDLE_TIMEOUT
+        if send_after is not None:
+            wait = min(wait, max(send_after - time.time(), 0))
+        if self._smtp is not None:
+            idle = SMTP_IDLE_TIMEOUT - (time.monotonic() - self._smtp_used)
+            wait = min(wait, max(idle, 0))
+        return wait
+
+    def _run(self, context: AuthedServiceContext) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.dispatch(context) < self.batch_size:
+                    if (
+                        self._smtp is not None
+                        and time.monotonic() - self._smtp_used >= SMTP_IDLE_TIMEOUT
+                    ):
+                        self._close_connection()
+                    self._wakeup.wait(self._wait_time(context))
+                    self._wakeup.clear()
+            except Exception as e:
+                logger.error("Failed to dispatch emails", exc_info=e)
+                self._stop.wait(EMAIL_RETRY_BACKOFF)
+        self._close_connection()
+
+    def run(self, context: AuthedServiceContext) -> None:
+        with self._lock:
+            if self.thread is not None:
+                return
+            self._stop.clear()
+            self.thread = threading.Thread(
+                target=self._run, args=(context,), daemon=True
+            )
+            self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self.thread.join()
+            self.thread = None
+            logger.info("Email dispatcher stopped.")
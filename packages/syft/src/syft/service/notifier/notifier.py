@@ -31,6 +31,7 @@ from ..context import AuthedServiceContext
 from ..notification.notifications import Notification
 from ..response import SyftError
 from ..response import SyftSuccess
+from .email_dispatcher import QueuedEmail
 from .notifier_enums import NOTIFIERS
 from .smtp_client import SMTPClient
 
@@ -115,10 +116,19 @@ class EmailNotifier(BaseNotifier):
             if isinstance(receiver_email, str):
                 receiver_email = [receiver_email]
 
-            self.smtp_client.send(  # type: ignore
-                sender=self.sender, receiver=receiver_email, subject=subject, body=body
+            # sent in the background, not to hold up the API call on SMTP
+            result = context.server.email_dispatcher.enqueue(
+                context,
+                QueuedEmail(
+                    sender=self.sender,
+                    receiver=receiver_email,
+                    subject=subject,
+                    body=body,
+                ),
             )
-            return Ok("Email sent successfully!")
+            if result.is_err():
+                return Err(f"Failed to queue email: {result.err()}")
+            return Ok("Email queued successfully!")
         except Exception:
             return Err(
                 "Some notifications failed to be delivered. Please check the health of the mailing server."
@@ -19,6 +19,7 @@ from ..notification.notifications import Notification
 from ..response import SyftError
 from ..response import SyftSuccess
 from ..service import AbstractService
+from .email_dispatcher import QueuedEmailStash
 from .notifier import NotificationPreferences
 from .notifier import NotifierSettings
 from .notifier import UserNotificationActivity
@@ -37,6 +38,7 @@ class NotifierService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = NotifierStash(store=store)
+        self.email_queue_stash = QueuedEmailStash(store=store)
 
     def settings(  # Maybe just notifier.settings
         self,
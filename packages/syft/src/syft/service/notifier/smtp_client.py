@@ -26,7 +26,25 @@ class SMTPClient(BaseModel):
             raise ValueError("Both username and password must be provided")
         return values
 
-    def send(self, sender: str, receiver: list[str], subject: str, body: str) -> None:
+    def connect(self) -> smtplib.SMTP:
+        """Open a logged in connection, to send several emails over."""
+        server = smtplib.SMTP(self.server, self.port, timeout=SOCKET_TIMEOUT)
+        try:
+            server.ehlo()
+            if server.has_extn("STARTTLS"):
+                server.starttls()
+                server.ehlo()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    @staticmethod
+    def send_with(
+        server: smtplib.SMTP, sender: str, receiver: list[str], subject: str, body: str
+    ) -> None:
+        """Send an email over the open connection `server`."""
         if not (subject and body and receiver):
             raise ValueError("Subject, body, and recipient email(s) are required")
 
@@ -36,14 +54,14 @@ class SMTPClient(BaseModel):
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "html"))
 
-        with smtplib.SMTP(self.server, self.port, timeout=SOCKET_TIMEOUT) as server:
-            server.ehlo()
-            if server.has_extn("STARTTLS"):
-                server.starttls()
-                server.ehlo()
-            server.login(self.username, self.password)
-            text = msg.as_string()
-            server.sendmail(sender, ", ".join(receiver), text)
+        server.sendmail(sender, receiver, msg.as_string())
+
+    def send(self, sender: str, receiver: list[str], subject: str, body: str) -> None:
+        if not (subject and body and receiver):
+            raise ValueError("Subject, body, and recipient email(s) are required")
+
+        with self.connect() as server:
+            self.send_with(server, sender, receiver, subject, body)
         # TODO: Add error handling
 
     @classmethod
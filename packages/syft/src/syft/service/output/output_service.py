@@ -1,4 +1,6 @@
 # stdlib
+from collections import Counter
+from collections.abc import Callable
 from typing import ClassVar
 
 # third party
@@ -19,13 +21,16 @@ from ...store.document_store import QueryKeys
 from ...store.linked_obj import LinkedObject
 from ...types.datetime import DateTime
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
 from ...types.syncable_object import SyncableSyftObject
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_object import ActionObject
+from ..action.action_permissions import ActionObjectPermission
 from ..action.action_permissions import ActionObjectREAD
 from ..context import AuthedServiceContext
 from ..response import SyftError
+from ..response import SyftSuccess
 from ..service import AbstractService
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
@@ -192,6 +197,84 @@ class ExecutionOutput(SyncableSyftObject):
         return res
 
 
+@serializable()
+class OutputPolicyExecutionCount(SyftObject):
+    """Number of outputs of an output policy, stored under the id of the policy."""
+
+    __canonical_name__ = "OutputPolicyExecutionCount"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    count: int = 0
+
+
+@instrument
+@serializable(canonical_name="OutputPolicyExecutionCountStash", version=1)
+class OutputPolicyExecutionCountStash(BaseUIDStoreStash):
+    object_type = OutputPolicyExecutionCount
+    settings: PartitionSettings = PartitionSettings(
+        name=OutputPolicyExecutionCount.__canonical_name__,
+        object_type=OutputPolicyExecutionCount,
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+    def add(
+        self,
+        credentials: SyftVerifyKey,
+        output_policy_id: UID,
+        n: int,
+        count_outputs: Callable[[], int],
+        limit: int | None = None,
+    ) -> Result[OutputPolicyExecutionCount, str]:
+        """Add `n` to the count of the policy, in one locked write.
+
+        Policies without a count yet, like the ones of outputs stored before
+        outputs were counted, start from `count_outputs()`. With a `limit`, the
+        count is only increased if it stays within it, so concurrent executions
+        can't both pass the limit.
+        """
+        limit_reached: int | None = None
+
+        def add_n(
+            current: OutputPolicyExecutionCount | None,
+        ) -> OutputPolicyExecutionCount:
+            nonlocal limit_reached
+            if current is None:
+                current = OutputPolicyExecutionCount(
+                    id=output_policy_id, count=count_outputs()
+                )
+            if limit is not None and n > 0 and current.count + n > limit:
+                limit_reached = current.count
+                return current
+            current.count = max(current.count + n, 0)
+            return current
+
+        res = self.partition.update_with(
+            credentials, output_policy_id, add_n, has_permission=True
+        )
+        if res.is_ok() and limit_reached is not None:
+            return Err(
+                f"Policy is no longer valid. count: {limit_reached} >= limit: {limit}"
+            )
+        return res
+
+    def set_count(
+        self, credentials: SyftVerifyKey, output_policy_id: UID, count: int
+    ) -> Result[OutputPolicyExecutionCount, str]:
+        def set_to_count(
+            current: OutputPolicyExecutionCount | None,
+        ) -> OutputPolicyExecutionCount:
+            if current is None:
+                return OutputPolicyExecutionCount(id=output_policy_id, count=count)
+            current.count = count
+            return current
+
+        return self.partition.update_with(
+            credentials, output_policy_id, set_to_count, has_permission=True
+        )
+
+
 @instrument
 @serializable(canonical_name="OutputStash", version=1)
 class OutputStash(BaseUIDStoreStash):
@@ -205,6 +288,118 @@ class OutputStash(BaseUIDStoreStash):
         self.store = store
         self.settings = self.settings
         self._object_type = self.object_type
+        self.execution_counts = OutputPolicyExecutionCountStash(store=store)
+
+    def set(
+        self,
+        credentials: SyftVerifyKey,
+        obj: ExecutionOutput,
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        output_policy_limit: int | None = None,
+    ) -> Result[ExecutionOutput, str]:
+        """Store the output and count it for its output policy. With an
+        `output_policy_limit`, outputs past the limit of the policy are not
+        stored."""
+        root_key = self.partition.root_verify_key
+        policy_id = obj.output_policy_id
+        is_new = (
+            policy_id is not None and self.get_by_uid(root_key, obj.id).ok() is None
+        )
+        # counted before the output is stored, so a policy counted for the first
+        # time is counted from the outputs stored before this one
+        if is_new:
+            res = self.execution_counts.add(
+                root_key,
+                policy_id,
+                1,
+                lambda: self._count_outputs(policy_id),
+                limit=output_policy_limit,
+            )
+            if res.is_err():
+                return res
+
+        res = super().set(
+            credentials,
+            obj,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+            ignore_duplicates=ignore_duplicates,
+        )
+        if res.is_err() and is_new:
+            self.execution_counts.add(
+                root_key, policy_id, -1, lambda: self._count_outputs(policy_id)
+            )
+        return res
+
+    def delete_by_uid(
+        self, credentials: SyftVerifyKey, uid: UID
+    ) -> Result[SyftSuccess, str]:
+        output = self.get_by_uid(credentials, uid).ok()
+        res = super().delete_by_uid(credentials, uid)
+        if res.is_ok() and output is not None and output.output_policy_id:
+            policy_id = output.output_policy_id
+            self.execution_counts.add(
+                self.partition.root_verify_key,
+                policy_id,
+                -1,
+                lambda: self._count_outputs(policy_id),
+            )
+        return res
+
+    def _count_outputs(self, output_policy_id: UID) -> int:
+        outputs = self.get_by_output_policy_id(
+            self.partition.root_verify_key, output_policy_id
+        )
+        if outputs.is_err():
+            raise ValueError(outputs.err())
+        return len(outputs.ok())
+
+    def get_execution_count(
+        self, credentials: SyftVerifyKey, output_policy_id: UID
+    ) -> Result[int, str]:
+        """Number of outputs of the output policy, without reading them."""
+        res = self.execution_counts.get_by_uid(credentials, output_policy_id)
+        if res.is_err():
+            return res
+        if res.ok() is not None:
+            return Ok(res.ok().count)
+        # outputs stored before outputs were counted
+        res = self.execution_counts.add(
+            credentials,
+            output_policy_id,
+            0,
+            lambda: self._count_outputs(output_policy_id),
+        )
+        return res.map(lambda execution_count: execution_count.count)
+
+    def reconcile_execution_counts(
+        self, credentials: SyftVerifyKey
+    ) -> Result[int, str]:
+        """Count the outputs of every output policy again, e.g. after outputs
+        were migrated into the store. Returns the number of policies counted."""
+        outputs = self.get_all(credentials, has_permission=True)
+        if outputs.is_err():
+            return outputs
+        counts = Counter(
+            output.output_policy_id
+            for output in outputs.ok()
+            if output.output_policy_id is not None
+        )
+        execution_counts = self.execution_counts.get_all(
+            credentials, has_permission=True
+        )
+        if execution_counts.is_err():
+            return execution_counts
+        for execution_count in execution_counts.ok():
+            counts.setdefault(execution_count.id, 0)
+
+        for output_policy_id, count in counts.items():
+            res = self.execution_counts.set_count(credentials, output_policy_id, count)
+            if res.is_err():
+                return res
+        return Ok(len(counts))
 
     def get_by_user_code_id(
         self, credentials: SyftVerifyKey, user_code_id: UID
@@ -271,6 +466,7 @@ class OutputService(AbstractService):
         job_id: UID | None = None,
         output_policy_id: UID | None = None,
         input_ids: dict[str, UID] | None = None,
+        output_policy_limit: int | None = None,
     ) -> ExecutionOutput | SyftError:
         output = ExecutionOutput.from_ids(
             output_ids=output_ids,
@@ -282,8 +478,12 @@ class OutputService(AbstractService):
             input_ids=input_ids,
         )
 
-        res = self.stash.set(context.credentials, output)
-        return res
+        res = self.stash.set(
+            context.credentials, output, output_policy_limit=output_policy_limit
+        )
+        if res.is_err():
+            return SyftError(message=res.err())
+        return res.ok()
 
     @service_method(
         path="output.get_by_user_code_id",
@@ -367,6 +567,22 @@ class OutputService(AbstractService):
             return result.ok()
         return SyftError(message=result.err())
 
+    @service_method(
+        path="output.get_execution_count",
+        name="get_execution_count",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def get_execution_count(
+        self, context: AuthedServiceContext, output_policy_id: UID
+    ) -> int | SyftError:
+        result = self.stash.get_execution_count(
+            credentials=context.server.verify_key,  # type: ignore
+            output_policy_id=output_policy_id,
+        )
+        if result.is_ok():
+            return result.ok()
+        return SyftError(message=result.err())
+
     @service_method(
         path="output.get",
         name="get",
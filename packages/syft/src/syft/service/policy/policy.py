@@ -338,7 +338,9 @@ def user_code_arg2id(arg: Any) -> UID:
     return uid
 
 
-def retrieve_item_from_db(id: UID, context: AuthedServiceContext) -> ActionObject:
+def retrieve_items_from_db(
+    ids: list[UID], context: AuthedServiceContext
+) -> Result[list[ActionObject], str]:
     # relative
     from ...service.action.action_object import TwinMode
 
@@ -346,16 +348,12 @@ def retrieve_item_from_db(id: UID, context: AuthedServiceContext) -> ActionObjec
     root_context = AuthedServiceContext(
         server=context.server, credentials=context.server.verify_key
     )
-    value = action_service._get(
+    return action_service._get_many(
         context=root_context,
-        uid=id,
+        uids=ids,
         twin_mode=TwinMode.NONE,
         has_permission=True,
     )
-    if value.is_err():
-        return value
-    else:
-        return value.ok()
 
 
 class InputPolicy(Policy):
@@ -523,13 +521,21 @@ class MixedInputPolicy(InputPolicy):
     ) -> Result[dict[Any, Any], str]:
         try:
             res = {}
+            passed_ids = {
+                kw: kwargs[kw]
+                for rules in self.kwarg_rules.values()
+                for kw, rule in rules.items()
+                if rule.requires_input
+            }
+            inputs = retrieve_items_from_db(list(passed_ids.values()), context)
+            if inputs.is_err():
+                return inputs
+            action_objects = dict(zip(passed_ids.keys(), inputs.ok()))
+
             for _, rules in self.kwarg_rules.items():
                 for kw, rule in rules.items():
                     if rule.requires_input:
-                        passed_id = kwargs[kw]
-                        actionobject: ActionObject = retrieve_item_from_db(
-                            passed_id, context
-                        )
+                        actionobject: ActionObject = action_objects[kw]
                         rule_check_args = (actionobject,)
                     else:
                         rule_check_args = ()  # type: ignore
@@ -583,7 +589,6 @@ def retrieve_from_db(
     from ...service.action.action_object import TwinMode
 
     action_service = context.server.get_service("actionservice")
-    code_inputs = {}
 
     # When we are retrieving the code from the database, we need to use the server's
     # verify key as the credentials. This is because when we approve the code, we
@@ -594,16 +599,15 @@ def retrieve_from_db(
         server=context.server, credentials=context.server.verify_key
     )
     if context.server.server_type == ServerType.DATASITE:
-        for var_name, arg_id in allowed_inputs.items():
-            kwarg_value = action_service._get(
-                context=root_context,
-                uid=arg_id,
-                twin_mode=TwinMode.NONE,
-                has_permission=True,
-            )
-            if kwarg_value.is_err():
-                return Err(kwarg_value.err())
-            code_inputs[var_name] = kwarg_value.ok()
+        kwarg_values = action_service._get_many(
+            context=root_context,
+            uids=list(allowed_inputs.values()),
+            twin_mode=TwinMode.NONE,
+            has_permission=True,
+        )
+        if kwarg_values.is_err():
+            return Err(kwarg_values.err())
+        code_inputs = dict(zip(allowed_inputs.keys(), kwarg_values.ok()))
     else:
         raise Exception(
             f"Invalid Server Type for Code Submission:{context.server.server_type}"
@@ -760,11 +764,7 @@ class OutputPolicyExecuteCount(OutputPolicy):
             raise ValueError(
                 f"api is None. You must login to {self.syft_server_location}"
             )
-        output_history = api.services.output.get_by_output_policy_id(self.id)
-
-        if isinstance(output_history, SyftError):
-            return output_history
-        return len(output_history)
+        return api.services.output.get_execution_count(self.id)
 
     @property
     def is_valid(self) -> SyftSuccess | SyftError:  # type: ignore
@@ -780,10 +780,9 @@ class OutputPolicyExecuteCount(OutputPolicy):
 
     def _is_valid(self, context: AuthedServiceContext) -> SyftSuccess | SyftError:
         output_service = context.server.get_service("outputservice")
-        output_history = output_service.get_by_output_policy_id(context, self.id)
-        if isinstance(output_history, SyftError):
-            return output_history
-        execution_count = len(output_history)
+        execution_count = output_service.get_execution_count(context, self.id)
+        if isinstance(execution_count, SyftError):
+            return execution_count
 
         is_valid = execution_count < self.limit
         if is_valid:
@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 # stdlib
+from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Iterable
 import copy
-import hashlib
 import textwrap
 import time
 from typing import Any
 
 # third party
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import field_validator
 from rich.progress import Progress
 from typing_extensions import Self
@@ -21,7 +22,7 @@ from ...client.api import ServerIdentity
 from ...client.client import SyftClient
 from ...client.client import SyftClientSessionCache
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize
+from ...serde.serialize import _serialize_sha256
 from ...server.credentials import SyftSigningKey
 from ...server.credentials import SyftVerifyKey
 from ...service.metadata.server_metadata import ServerMetadata
@@ -652,6 +653,68 @@ def add_code_request_to_project(
     )
 
 
+class ProjectEventIndex:
+    """Lookups of the events of a project by id, type and parent event, and the
+    number of events at the start of the chain that were validated.
+
+    The index is built from `Project.events` as events are appended, and built
+    again if the list is replaced or an indexed event is not in its place anymore.
+    It is derived from the events, so it is not part of the project's state.
+    """
+
+    def __init__(self) -> None:
+        self.reset(None)
+
+    def reset(self, events: list[ProjectEvent] | None) -> None:
+        self.events = events
+        self.last_indexed: ProjectEvent | None = None
+        self.positions: dict[UID, int] = {}
+        self.by_id: dict[UID, ProjectEvent] = {}
+        self.by_type: dict[type, list[ProjectEvent]] = defaultdict(list)
+        self.by_parent: dict[UID, list[ProjectEvent]] = defaultdict(list)
+        # events without a parent event
+        self.top_level: list[ProjectEvent] = []
+        self.n_validated = 0
+
+    def update(self, events: list[ProjectEvent]) -> None:
+        n_indexed = len(self.positions)
+        if (
+            events is not self.events
+            or len(events) < n_indexed
+            or (n_indexed and events[n_indexed - 1] is not self.last_indexed)
+        ):
+            self.reset(events)
+            n_indexed = 0
+
+        for position in range(n_indexed, len(events)):
+            event = events[position]
+            self.positions[event.id] = position
+            self.by_id[event.id] = event
+            self.by_type[type(event)].append(event)
+            if hasattr(event, "parent_event_id"):
+                self.by_parent[event.parent_event_id].append(event)
+            else:
+                self.top_level.append(event)
+            self.last_indexed = event
+
+    def of_types(self, types: tuple[type, ...]) -> list[ProjectEvent]:
+        events = [
+            event
+            for event_type, events in self.by_type.items()
+            if issubclass(event_type, types)
+            for event in events
+        ]
+        return self.in_order(events)
+
+    def in_order(self, events: list[ProjectEvent]) -> list[ProjectEvent]:
+        return sorted(events, key=lambda event: self.positions[event.id])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ProjectEventIndex)
+
+    __hash__ = object.__hash__
+
+
 @serializable()
 class Project(SyftObject):
     __canonical_name__ = "Project"
@@ -689,6 +752,8 @@ class Project(SyftObject):
     state_sync_leader: ServerIdentity
     leader_server_peer: ServerPeer | None = None
 
+    _event_index: ProjectEventIndex = PrivateAttr(default_factory=ProjectEventIndex)
+
     # Unused
     consensus_model: ConsensusModel
     project_permissions: set[str]
@@ -824,7 +889,14 @@ class Project(SyftObject):
         result = self._append_event(event, credentials=credentials)
         return result
 
+    @property
+    def event_index(self) -> ProjectEventIndex:
+        self._event_index.update(self.events)
+        return self._event_index
+
     def validate_events(self, debug: bool = False) -> SyftSuccess | SyftError:
+        """Validates the events added since the last validation, and the whole
+        chain of events with `debug`."""
         current_hash = self.start_hash
 
         def valid_str(current_hash: int) -> str:
@@ -833,8 +905,14 @@ class Project(SyftObject):
         if len(self.events) == 0:
             return SyftSuccess(message=valid_str(current_hash))
 
-        last_event = None
-        for event in self.events:
+        index = self.event_index
+        n_validated = 0 if debug else index.n_validated
+        last_event = self.events[n_validated - 1] if n_validated else None
+        if last_event is not None:
+            current_hash = last_event.event_hash
+
+        for position in range(n_validated, len(self.events)):
+            event = self.events[position]
             result = event.valid_descendant(self, last_event)
             current_hash = event.event_hash
 
@@ -848,6 +926,7 @@ class Project(SyftObject):
 
             if not result:
                 return result
+            index.n_validated = max(index.n_validated, position + 1)
             last_event = event
         return SyftSuccess(message=valid_str(current_hash))
 
@@ -864,9 +943,6 @@ class Project(SyftObject):
         else:
             raise Exception(f"More than 1 result for {parent_uid}")
 
-    # TODO: add a another view for the project objects
-    # to be able to have a Directed Acyclic Graph view of the graph events
-    # this would allow to query the sub events effectively
     def get_events(
         self,
         types: type | list[type] | None = None,
@@ -888,8 +964,23 @@ class Project(SyftObject):
         if isinstance(ids, UID):
             ids = [ids]
 
+        # start from the most selective index, then check the other conditions
+        index = self.event_index
+        if len(ids):
+            candidates = [index.by_id[uid] for uid in set(ids) if uid in index.by_id]
+        elif len(parent_event_ids):
+            candidates = [
+                event
+                for parent_event_id in set(parent_event_ids)
+                for event in index.by_parent.get(parent_event_id, [])
+            ]
+        elif len(types):
+            candidates = index.of_types(tuple(types))
+        else:
+            candidates = index.top_level
+
         results = []
-        for event in self.events:
+        for event in index.in_order(candidates):
             type_check = False
             if len(types) == 0 or isinstance(event, tuple(types)):
                 type_check = True
@@ -903,11 +994,7 @@ class Project(SyftObject):
             ):
                 parent_check = True
 
-            id_check = False
-            if len(ids) == 0 or event.id in ids:
-                id_check = True
-
-            if type_check and parent_check and id_check:
+            if type_check and parent_check:
                 results.append(event)
         return results
 
@@ -934,11 +1021,7 @@ class Project(SyftObject):
         )
 
     def get_messages(self) -> list[ProjectMessage | ProjectThreadMessage]:
-        return [
-            event
-            for event in self.events
-            if isinstance(event, (ProjectMessage | ProjectThreadMessage))
-        ]
+        return self.event_index.of_types((ProjectMessage, ProjectThreadMessage))  # type: ignore
 
     @property
     def messages(self) -> str:
@@ -1122,7 +1205,8 @@ class Project(SyftObject):
     @property
     def requests(self) -> list[Request]:
         return [
-            event.request for event in self.events if isinstance(event, ProjectRequest)
+            event.request  # type: ignore[attr-defined]
+            for event in self.event_index.of_types((ProjectRequest,))
         ]
 
     @property
@@ -1386,8 +1470,7 @@ def hash_object(obj: Any) -> tuple[bytes, str]:
     Returns:
         str: Hashed value of the object
     """
-    hash_bytes = _serialize(obj, to_bytes=True, for_hashing=True)
-    hash = hashlib.sha256(hash_bytes)
+    hash = _serialize_sha256(obj, for_hashing=True)
     return (hash.digest(), hash.hexdigest())
 
 
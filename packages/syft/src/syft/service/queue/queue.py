@@ -18,7 +18,6 @@ from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...service.context import AuthedServiceContext
 from ...store.document_store import BaseStash
-from ...types.datetime import DateTime
 from ...types.uid import UID
 from ..job.job_stash import Job
 from ..job.job_stash import JobStatus
@@ -248,6 +247,25 @@ def handle_message_multiprocessing(
     monitor_thread.stop()
 
 
+def set_job_processing(
+    worker: Any,  # should be of type Worker(Server), but get circular import error
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+    syft_worker_id: UID | None,
+    job_pid: int | None = None,
+) -> None:
+    res = worker.job_stash.set_processing(
+        credentials,
+        queue_item.job_id,
+        server_uid=worker.id,
+        job_worker_id=syft_worker_id,
+        job_pid=job_pid,
+    )
+    if res.is_err():
+        logger.warning(res.err())
+        raise Exception(res.err())
+
+
 @serializable(canonical_name="APICallMessageHandler", version=1)
 class APICallMessageHandler(AbstractMessageHandler):
     queue_name = "api_call"
@@ -282,29 +300,15 @@ class APICallMessageHandler(AbstractMessageHandler):
         worker.signing_key = worker_settings.signing_key
 
         credentials = queue_item.syft_client_verify_key
-        res = worker.job_stash.get_by_uid(credentials, queue_item.job_id)
-        if res.is_err():
-            logger.warning(res.err())
-            raise Exception(res.value)
-        job_item: Job = res.ok()
 
+        # the producer already stored the queue item as PROCESSING before
+        # sending it, only write it again when it moved to another server
+        if queue_item.server_uid != worker.id:
+            queue_item.server_uid = worker.id
+            queue_result = worker.queue_stash.set_result(credentials, queue_item)
+            if isinstance(queue_result, SyftError):
+                raise Exception(f"{queue_result.err()}")
         queue_item.status = Status.PROCESSING
-        queue_item.server_uid = worker.id
-
-        job_item.status = JobStatus.PROCESSING
-        job_item.server_uid = worker.id  # type: ignore[assignment]
-        job_item.updated_at = DateTime.now()
-
-        if syft_worker_id is not None:
-            job_item.job_worker_id = syft_worker_id
-
-        queue_result = worker.queue_stash.set_result(credentials, queue_item)
-        if isinstance(queue_result, SyftError):
-            raise Exception(f"{queue_result.err()}")
-
-        job_result = worker.job_stash.set_result(credentials, job_item)
-        if isinstance(job_result, SyftError):
-            raise Exception(f"{job_result.err()}")
 
         logger.info(
             f"Handling queue item: id={queue_item.id}, method={queue_item.method} "
@@ -313,6 +317,7 @@ class APICallMessageHandler(AbstractMessageHandler):
         )
 
         if queue_config.thread_workers:
+            set_job_processing(worker, queue_item, credentials, syft_worker_id)
             thread = Thread(
                 target=handle_message_multiprocessing,
                 args=(worker_settings, queue_item, credentials),
@@ -327,6 +332,8 @@ class APICallMessageHandler(AbstractMessageHandler):
                 args=(worker_settings, queue_item, credentials),
             )
             process.start()
-            job_item.job_pid = process.pid
-            worker.job_stash.set_result(credentials, job_item)
+            # record the status and the pid in a single write, after the start
+            set_job_processing(
+                worker, queue_item, credentials, syft_worker_id, process.pid
+            )
             process.join()
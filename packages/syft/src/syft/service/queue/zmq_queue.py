@@ -1,6 +1,8 @@
 # stdlib
 from binascii import hexlify
 from collections import defaultdict
+from collections.abc import Callable
+import heapq
 import itertools
 import logging
 import socketserver
@@ -13,6 +15,7 @@ from typing import Any
 from typing import cast
 
 # third party
+from pydantic import Field
 from pydantic import field_validator
 from result import Result
 import zmq
@@ -115,7 +118,7 @@ class Worker(SyftBaseModel):
     identity: bytes
     service: Service | None = None
     syft_worker_id: UID | None = None
-    expiry_t: Timeout = Timeout(WORKER_TIMEOUT_SEC)
+    expiry_t: Timeout = Field(default_factory=lambda: Timeout(WORKER_TIMEOUT_SEC))
 
     @field_validator("syft_worker_id", mode="before")
     @classmethod
@@ -146,6 +149,64 @@ class Worker(SyftBaseModel):
         )
 
 
+class QueueDependencyIndex:
+    """Unresolved inputs of queued action items, like the pending edges of a DAG scheduler.
+
+    The inputs of an item are walked once, when the item is first seen, and the
+    unresolved action objects it found are indexed in both directions. `refresh`
+    only looks up each pending input once, no matter how many items wait on it,
+    and releases the items that waited on it once it is resolved. Resolved
+    inputs are walked again, as their data can hold unresolved objects itself.
+    """
+
+    def __init__(self, unresolved: Callable[..., set[UID]]) -> None:
+        self.unresolved = unresolved
+        # item id -> unresolved inputs
+        self.pending: dict[UID, set[UID]] = {}
+        # input id -> items waiting on it
+        self.dependents: defaultdict[UID, set[UID]] = defaultdict(set)
+
+    def is_runnable(self, item: ActionQueueItem) -> bool:
+        if item.id not in self.pending:
+            action = item.kwargs["action"]
+            try:
+                pending = self.unresolved(action.args) | self.unresolved(action.kwargs)
+            except Exception as e:
+                # not indexed, the inputs are walked again next time
+                logger.exception("Failed to resolve action objects.", exc_info=e)
+                return False
+            self._set_pending(item.id, pending)
+        return len(self.pending[item.id]) == 0
+
+    def refresh(self) -> None:
+        for uid in list(self.dependents):
+            try:
+                # inputs that can't be found are still waited on
+                unresolved = self.unresolved(uid, missing_is_unresolved=True)
+            except Exception as e:
+                logger.exception("Failed to resolve action objects.", exc_info=e)
+                continue
+            if unresolved == {uid}:
+                continue
+            for item_id in self.dependents.pop(uid):
+                self._set_pending(item_id, (self.pending[item_id] - {uid}) | unresolved)
+
+    def retain(self, item_ids: set[UID]) -> None:
+        """Forget items that are not queued anymore."""
+        for item_id in set(self.pending) - item_ids:
+            for uid in self.pending.pop(item_id):
+                dependents = self.dependents.get(uid)
+                if dependents is not None:
+                    dependents.discard(item_id)
+                    if not dependents:
+                        del self.dependents[uid]
+
+    def _set_pending(self, item_id: UID, pending: set[UID]) -> None:
+        self.pending[item_id] = pending
+        for uid in pending:
+            self.dependents[uid].add(item_id)
+
+
 @serializable(canonical_name="ZMQProducer", version=1)
 class ZMQProducer(QueueProducer):
     INTERNAL_SERVICE_PREFIX = b"mmi."
@@ -165,6 +226,7 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
+        self.dependencies = QueueDependencyIndex(self.unresolved_action_objects)
         self.post_init()
 
     @property
@@ -176,8 +238,16 @@ class ZMQProducer(QueueProducer):
 
         self.services: dict[str, Service] = {}
         self.workers: dict[bytes, Worker] = {}
+        # last consumer state written per worker, heartbeats only write on changes
+        self.consumer_states: dict[UID, ConsumerState] = {}
         self.waiting: list[Worker] = []
         self.heartbeat_t = Timeout(HEARTBEAT_INTERVAL_SEC)
+        # (expiry, identity) of waiting workers, entries of workers that sent a
+        # heartbeat since are outdated and skipped when they come up
+        self.expiry_heap: list[tuple[float, bytes]] = []
+        # workers marked for deletion are looked up once per heartbeat interval
+        self.deletion_check_t = Timeout(HEARTBEAT_INTERVAL_SEC)
+        self.purged_workers = 0
         self.context = zmq.Context(1)
         self.socket = self.context.socket(zmq.ROUTER)
         self.socket.setsockopt(LINGER, 1)
@@ -227,39 +297,45 @@ class ZMQProducer(QueueProducer):
 
     def contains_unresolved_action_objects(self, arg: Any, recursion: int = 0) -> bool:
         """recursively check collections for unresolved action objects"""
+        try:
+            return len(self.unresolved_action_objects(arg, recursion=recursion)) > 0
+        except Exception as e:
+            logger.exception("Failed to resolve action objects.", exc_info=e)
+            return True
+
+    def unresolved_action_objects(
+        self, arg: Any, recursion: int = 0, missing_is_unresolved: bool = False
+    ) -> set[UID]:
+        """recursively collect the ids of unresolved action objects in collections"""
         if isinstance(arg, UID):
-            arg = self.action_service.get(self.auth_context, arg).ok()
-            return self.contains_unresolved_action_objects(arg, recursion=recursion + 1)
+            uid = arg
+            res = self.action_service.get(self.auth_context, arg)
+            if res.is_err() and missing_is_unresolved:
+                return {uid}
+            arg = res.ok()
+            if isinstance(arg, ActionObject) and not arg.syft_resolved:
+                return {uid}
+            return self.unresolved_action_objects(arg, recursion=recursion + 1)
         if isinstance(arg, ActionObject):
             if not arg.syft_resolved:
                 res = self.action_service.get(self.auth_context, arg)
-                if res.is_err():
-                    return True
+                if res.is_err() or not res.ok().syft_resolved:
+                    return {arg.id}
                 arg = res.ok()
-                if not arg.syft_resolved:
-                    return True
             arg = arg.syft_action_data
 
-        try:
-            value = False
-            if isinstance(arg, list):
-                for elem in arg:
-                    value = self.contains_unresolved_action_objects(
-                        elem, recursion=recursion + 1
-                    )
-                    if value:
-                        return True
-            if isinstance(arg, dict):
-                for elem in arg.values():
-                    value = self.contains_unresolved_action_objects(
-                        elem, recursion=recursion + 1
-                    )
-                    if value:
-                        return True
-            return value
-        except Exception as e:
-            logger.exception("Failed to resolve action objects.", exc_info=e)
-            return True
+        unresolved: set[UID] = set()
+        if isinstance(arg, list):
+            for elem in arg:
+                unresolved |= self.unresolved_action_objects(
+                    elem, recursion=recursion + 1
+                )
+        if isinstance(arg, dict):
+            for elem in arg.values():
+                unresolved |= self.unresolved_action_objects(
+                    elem, recursion=recursion + 1
+                )
+        return unresolved
 
     def read_items(self) -> None:
         while True:
@@ -284,17 +360,17 @@ class ZMQProducer(QueueProducer):
 
                 items_processing = [] if items_processing is None else items_processing
 
+                # only items that are still queued keep their dependencies
+                self.dependencies.retain({item.id for item in items_to_queue})
+                self.dependencies.refresh()
+
                 for item in itertools.chain(items_to_queue, items_processing):
                     # TODO: if resolving fails, set queueitem to errored, and jobitem as well
                     if item.status == Status.CREATED:
                         if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if self.contains_unresolved_action_objects(
-                                action.args
-                            ) or self.contains_unresolved_action_objects(action.kwargs):
+                            if not self.dependencies.is_runnable(item):
                                 continue
 
-                        msg_bytes = serialize(item, to_bytes=True)
                         worker_pool = item.worker_pool.resolve_with_context(
                             self.auth_context
                         )
@@ -311,8 +387,10 @@ class ZMQProducer(QueueProducer):
                         # This list is processed in dispatch method.
 
                         # TODO: Logic to evaluate the CAN RUN Condition
-                        service.requests.append(msg_bytes)
+                        # the consumer relies on the item being sent as PROCESSING
                         item.status = Status.PROCESSING
+                        msg_bytes = serialize(item, to_bytes=True)
+                        service.requests.append(msg_bytes)
                         res = self.queue_stash.update(item.syft_client_verify_key, item)
                         if res.is_err():
                             logger.error(
@@ -360,26 +438,62 @@ class ZMQProducer(QueueProducer):
     def purge_workers(self) -> None:
         """Look for & kill expired workers.
 
-        Workers are oldest to most recent, so we stop at the first alive worker.
+        Expiries are kept in a heap, so only workers whose expiry passed are
+        looked at, instead of loading every waiting worker from the stash.
         """
-        # work on a copy of the iterator
-        for worker in self.waiting:
+        now = Timeout.now()
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            expiry, identity = heapq.heappop(self.expiry_heap)
+            worker = self.workers.get(identity)
+            if (
+                worker is None
+                or worker.get_expiry() != expiry
+                or worker not in self.waiting
+            ):
+                continue
+
             res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
             if res.is_err() or (syft_worker := res.ok()) is None:
                 logger.info(f"Failed to retrieve SyftWorker {worker.syft_worker_id}")
                 continue
+            self._purge_worker(worker, syft_worker)
 
-            if worker.has_expired() or syft_worker.to_be_deleted:
-                logger.info(f"Deleting expired worker id={worker}")
-                self.delete_worker(worker, syft_worker.to_be_deleted)
+        if self.waiting and self.deletion_check_t.has_expired():
+            self.deletion_check_t.reset()
+            res = self.worker_stash.get_to_be_deleted(self.auth_context.credentials)
+            if res.is_err():
+                logger.error(f"Failed to retrieve workers to delete: {res.err()}")
+                return
+            to_be_deleted = {syft_worker.id: syft_worker for syft_worker in res.ok()}
+            for worker in list(self.waiting):
+                if worker.syft_worker_id in to_be_deleted:
+                    self._purge_worker(worker, to_be_deleted[worker.syft_worker_id])
 
-                # relative
-                from ...service.worker.worker_service import WorkerService
+    def _purge_worker(self, worker: Worker, syft_worker: SyftWorker) -> None:
+        logger.info(f"Deleting expired worker id={worker}")
+        self.delete_worker(worker, syft_worker.to_be_deleted)
+        self.purged_workers += 1
 
-                worker_service = cast(
-                    WorkerService, self.auth_context.server.get_service(WorkerService)
-                )
-                worker_service._delete(self.auth_context, syft_worker)
+        # relative
+        from ...service.worker.worker_service import WorkerService
+
+        worker_service = cast(
+            WorkerService, self.auth_context.server.get_service(WorkerService)
+        )
+        worker_service._delete(self.auth_context, syft_worker)
+
+    @property
+    def liveness(self) -> dict[str, int | float | None]:
+        """Worker liveness metrics of this producer."""
+        next_expiry = (
+            self.expiry_heap[0][0] - Timeout.now() if self.expiry_heap else None
+        )
+        return {
+            "workers": len(self.workers),
+            "waiting_workers": len(self.waiting),
+            "purged_workers": self.purged_workers,
+            "seconds_to_next_expiry": next_expiry,
+        }
 
     def update_consumer_state_for_worker(
         self, syft_worker_id: UID, consumer_state: ConsumerState
@@ -390,6 +504,9 @@ class ZMQProducer(QueueProducer):
             )
             return
 
+        if self.consumer_states.get(syft_worker_id) == consumer_state:
+            return
+
         try:
             # Check if worker is present in the database
             worker = self.worker_stash.get_by_uid(
@@ -409,6 +526,10 @@ class ZMQProducer(QueueProducer):
                     f"Failed to update consumer state for worker id={syft_worker_id} "
                     f"to state: {consumer_state} error={res.err()}",
                 )
+            elif consumer_state == ConsumerState.DETACHED:
+                self.consumer_states.pop(syft_worker_id, None)
+            else:
+                self.consumer_states[syft_worker_id] = consumer_state
         except Exception as e:
             logger.error(
                 f"Failed to update consumer state for worker id: {syft_worker_id} to state {consumer_state}",
@@ -423,6 +544,7 @@ class ZMQProducer(QueueProducer):
         if worker.service is not None and worker not in worker.service.waiting:
             worker.service.waiting.append(worker)
         worker.reset_expiry()
+        heapq.heappush(self.expiry_heap, (worker.get_expiry(), worker.identity))
         self.update_consumer_state_for_worker(worker.syft_worker_id, ConsumerState.IDLE)
         self.dispatch(worker.service, None)
 
@@ -438,6 +560,10 @@ class ZMQProducer(QueueProducer):
             worker = service.waiting.pop(0)
             self.waiting.remove(worker)
             self.send_to_worker(worker, QueueMsgProtocol.W_REQUEST, msg)
+            # the consumer records CONSUMING itself, the next heartbeat
+            # after the job has to write IDLE again
+            if worker.syft_worker_id is not None:
+                self.consumer_states[worker.syft_worker_id] = ConsumerState.CONSUMING
 
     def send_to_worker(
         self,
@@ -21,11 +21,12 @@ from ..service import AbstractService
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
-from ..user.user import UserView
+from ..user.user import User
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
 from ..user.user_service import UserService
+from ..user.user_service import cached_user_view
 from .request import Change
 from .request import Request
 from .request import RequestInfo
@@ -117,40 +118,103 @@ class RequestService(AbstractService):
         # return [self.resolve_nested_requests(context, request) for request in requests]
         return requests
 
-    @service_method(path="request.get_all_info", name="get_all_info")
-    def get_all_info(
-        self,
-        context: AuthedServiceContext,
-        page_index: int | None = 0,
-        page_size: int | None = 0,
-    ) -> list[list[RequestInfo]] | list[RequestInfo] | SyftError:
-        """Get the information of all requests"""
+    def _requests_with_users(
+        self, context: AuthedServiceContext, name: str | None = None
+    ) -> list[tuple[Request, User]] | SyftError:
+        """Requests with the users who made them, in one read of each store.
 
+        Only requests of users whose name contains `name` are returned, if given.
+        """
         result = self.stash.get_all(context.credentials)
         if result.is_err():
             return SyftError(message=result.err())
+        requests = result.ok()
 
-        method = context.server.get_service_method(UserService.get_by_verify_key)
-        get_message = context.server.get_service_method(
-            NotificationService.filter_by_obj
+        user_service = context.server.get_service(UserService)
+        users = user_service.get_by_verify_keys(
+            {request.requesting_user_verify_key for request in requests}
         )
+        if isinstance(users, SyftError):
+            return users
+
+        requests_with_users = []
+        for request in requests:
+            user = users.get(request.requesting_user_verify_key)
+            if user is None or (name is not None and name not in user.name):
+                continue
+            requests_with_users.append((request, user))
+        return requests_with_users
+
+    def _request_infos(
+        self,
+        context: AuthedServiceContext,
+        requests_with_users: list[tuple[Request, User]],
+    ) -> list[RequestInfo] | SyftError:
+        notification_stash = context.server.get_service(NotificationService).stash
+        result = notification_stash.get_by_linked_obj_uids(
+            context.credentials, {request.id for request, _ in requests_with_users}
+        )
+        if result.is_err():
+            return SyftError(message=result.err())
+        notifications = result.ok()
 
-        requests: list[RequestInfo] = []
-        for req in result.ok():
-            user = method(req.requesting_user_verify_key).to(UserView)
-            message = get_message(context=context, obj_uid=req.id)
-            requests.append(RequestInfo(user=user, request=req, notification=message))
+        return [
+            RequestInfo(
+                user=cached_user_view(user),
+                request=request,
+                message=notifications[request.id],
+            )
+            for request, user in requests_with_users
+            if request.id in notifications
+        ]
+
+    def _paginate_request_infos(
+        self,
+        context: AuthedServiceContext,
+        requests_with_users: list[tuple[Request, User]] | SyftError,
+        page_index: int | None,
+        page_size: int | None,
+    ) -> list[list[RequestInfo]] | list[RequestInfo] | SyftError:
+        """RequestInfos of the page `page_index`, or of all pages if it is None.
+
+        Notifications and user views are only looked up for the requests shown.
+        """
+        if isinstance(requests_with_users, SyftError):
+            return requests_with_users
         if not page_size:
-            return requests
+            return self._request_infos(context, requests_with_users)
 
-        # If chunk size is defined, then split list into evenly sized chunks
-        chunked_requests: list[list[RequestInfo]] = [
-            requests[i : i + page_size] for i in range(0, len(requests), page_size)
+        if page_index is not None:
+            page = requests_with_users[
+                page_index * page_size : (page_index + 1) * page_size
+            ]
+            if not page and page_index:
+                return SyftError(message=f"Page {page_index} does not exist")
+            return self._request_infos(context, page)
+
+        request_infos = self._request_infos(context, requests_with_users)
+        if isinstance(request_infos, SyftError):
+            return request_infos
+        return [
+            request_infos[i : i + page_size]
+            for i in range(0, len(request_infos), page_size)
         ]
-        if page_index:
-            return chunked_requests[page_index]
-        else:
-            return chunked_requests
+
+    @service_method(path="request.get_all_info", name="get_all_info")
+    def get_all_info(
+        self,
+        context: AuthedServiceContext,
+        page_index: int | None = 0,
+        page_size: int | None = 0,
+    ) -> list[list[RequestInfo]] | list[RequestInfo] | SyftError:
+        """Get the information of all requests"""
+        return self._paginate_request_infos(
+            context,
+            self._requests_with_users(context),
+            # the first page is only returned on its own if asked for by index
+            page_index=page_index or None,
+            page_size=page_size,
+        )
 
     @service_method(path="request.add_changes", name="add_changes")
     def add_changes(
@@ -175,23 +239,14 @@ class RequestService(AbstractService):
         page_index: int | None = 0,
         page_size: int | None = 0,
     ) -> list[RequestInfo] | SyftError:
-        """Get a Dataset"""
-        result = self.get_all_info(context)
-        requests = list(
-            filter(lambda res: (request_filter.name in res.user.name), result)
+        """Get the information of the requests of users matching the filter"""
+        return self._paginate_request_infos(
+            context,
+            self._requests_with_users(context, name=request_filter.name),
+            page_index=page_index,
+            page_size=page_size,
         )
 
-        # If chunk size is defined, then split list into evenly sized chunks
-        if page_size:
-            requests = [
-                requests[i : i + page_size] for i in range(0, len(requests), page_size)
-            ]
-            if page_index is not None:
-                # Return the proper slice using chunk_index
-                requests = requests[page_index]
-
-        return requests
-
     @service_method(
         path="request.apply",
         name="apply",
@@ -176,6 +176,16 @@ def recursive_attr_repr(value_attr: list | dict | bytes, num_tabs: int = 0) -> s
     return f"{sketchy_tab*num_tabs}{str(value_attr)}"
 
 
+def has_same_content(low_obj: SyncableSyftObject, high_obj: SyncableSyftObject) -> bool:
+    """Objects with the same content hash have no diffs, so most objects that did
+    not change since the last sync are not compared attribute by attribute."""
+    try:
+        return low_obj.__sha256__() == high_obj.__sha256__()
+    except Exception as e:
+        logger.debug(f"Failed to hash {type(low_obj).__name__} for diffing: {e}")
+        return False
+
+
 class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
     # version
     __canonical_name__ = "ObjectDiff"
@@ -267,6 +277,7 @@ class ObjectDiff(SyftObject):  # StateTuple (compare 2 objects)
             or high_obj is None
             or (res.is_mock("low") and high_status == "SAME")
             or (res.is_mock("high") and low_status == "SAME")
+            or has_same_content(low_obj, high_obj)
         ):
             diff_list = []
         else:
@@ -576,31 +587,31 @@ class ObjectDiffBatch(SyftObject):
         include_batch_root: bool = True,
     ) -> list[ObjectDiff]:
         root_id = self.root_diff.object_id
-        result = [root_id]
+        result = {root_id}
         unvisited = [root_id]
-        global_roots = [x for x in self.global_roots if x is not root_id]
-        roots = []
+        global_roots = set(self.global_roots) - {root_id}
+        roots = set()
 
         while len(unvisited):
             # Do we update this in the terminal case
             new_servers = []
             for server in unvisited:
                 if server in global_roots:
-                    roots.append(server)
-                else:
-                    new_servers += deps.get(server, [])
-
-            new_servers = [n for n in new_servers if n not in result]
+                    roots.add(server)
+                    continue
+                for dep in deps.get(server, []):
+                    if dep not in result:
+                        result.add(dep)
+                        new_servers.append(dep)
             unvisited = new_servers
-            result += unvisited
 
         if include_roots:
-            result += roots
+            result |= roots
 
         if not include_batch_root:
-            result.remove(root_id)
+            result.discard(root_id)
 
-        return [self.global_diffs[r] for r in set(result)]
+        return [self.global_diffs[r] for r in result]
 
     @property
     def target_server_uid(self) -> UID:
@@ -942,13 +953,16 @@ class ObjectDiffBatch(SyftObject):
             server.object_id, []
         )
 
+        dep_diffs = [
+            self.global_diffs[dep_id]
+            for dep_id in dict.fromkeys(dep_ids)
+            if dep_id in self.global_diffs
+        ]
+
         result = {}
         for child_type in child_types:
             children = [
-                n
-                for n in self.global_diffs.values()
-                if n.object_id in dep_ids
-                and isinstance(n.low_obj or n.high_obj, child_type)
+                n for n in dep_diffs if isinstance(n.low_obj or n.high_obj, child_type)
             ]
             for child in children:
                 if child.object_id not in visited:
@@ -1296,31 +1310,29 @@ class ServerDiff(SyftObject):
         e.g. if a job changed, also unignore the usercode
         """
 
+        batches_by_root_id = {batch.root_id: batch for batch in batches}
         for root_id, batch_hash in previously_ignored_batches.items():
-            for batch in batches:
-                if batch.root_id == root_id:
-                    if hash(batch) == batch_hash:
-                        batch.decision = SyncDecision.IGNORE
-                    else:
-                        logger.debug(
-                            f"""A batch with type {batch.root_type.__name__} was previously ignored but has changed
+            batch = batches_by_root_id.get(root_id)
+            if batch is not None:
+                if hash(batch) == batch_hash:
+                    batch.decision = SyncDecision.IGNORE
+                else:
+                    logger.debug(
+                        f"""A batch with type {batch.root_type.__name__} was previously ignored but has changed
 It will be available for review again."""
-                        )
-                        # batch has changed, so unignore
-                        batch.decision = None
-                        # then we also set the dependent batches to unignore
-                        # currently we dont do this recusively
-                        required_dependencies = {
-                            d.object_id
-                            for d in batch.get_dependencies(include_roots=True)
-                        }
-
-                        for other_batch in batches:
-                            if other_batch is not batch:
-                                other_batch_root_id = {other_batch.root_id}
-                                # if there is overlap
-                                if len(required_dependencies & other_batch_root_id):
-                                    other_batch.decision = None
+                    )
+                    # batch has changed, so unignore
+                    batch.decision = None
+                    # then we also set the dependent batches to unignore
+                    # currently we dont do this recusively
+                    required_dependencies = {
+                        d.object_id for d in batch.get_dependencies(include_roots=True)
+                    }
+
+                    for dependency_id in required_dependencies:
+                        other_batch = batches_by_root_id.get(dependency_id)
+                        if other_batch is not None and other_batch is not batch:
+                            other_batch.decision = None
 
     @staticmethod
     def dependencies_from_states(
@@ -11,6 +11,8 @@ from result import Result
 # relative
 from ...client.api import ServerIdentity
 from ...serde.serializable import serializable
+from ...store.change_log import CHANGE_DELETE
+from ...store.change_log import change_log_watermark
 from ...store.document_store import BaseStash
 from ...store.document_store import DocumentStore
 from ...store.linked_obj import LinkedObject
@@ -36,9 +38,18 @@ from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from .sync_stash import SyncStash
 from .sync_state import SyncState
+from .sync_state import SyncStateDelta
 
 logger = logging.getLogger(__name__)
 
+# NOTE Jobs are handled separately
+SERVICES_TO_SYNC = [
+    "requestservice",
+    "usercodeservice",
+    "usercodestatusservice",
+    "apiservice",
+]
+
 
 def get_store(context: AuthedServiceContext, item: SyncableSyftObject) -> Any:
     if isinstance(item, ActionObject):
@@ -291,6 +302,7 @@ class SyncService(AbstractService):
         if isinstance(jobs, SyftError):
             return Err(jobs.message)
 
+        self.stash.job_batch_index = {}
         for job in jobs:
             job_items_result = self._get_job_batch(context, job)
             if job_items_result.is_err():
@@ -300,6 +312,7 @@ class SyncService(AbstractService):
                 errors[job.id] = job_items_result.err()
                 continue
             items_for_jobs.extend(job_items_result.ok())
+        self.stash.job_batch_index_built = True
 
         return Ok((items_for_jobs, errors))
 
@@ -335,6 +348,8 @@ class SyncService(AbstractService):
                 return action_object
             job_batch.append(action_object.ok())
 
+        for item in job_batch[1:]:
+            self.stash.job_batch_index[item.id.id] = job.id
         return Ok(job_batch)
 
     def get_all_syncable_items(
@@ -342,15 +357,7 @@ class SyncService(AbstractService):
     ) -> Result[tuple[list[SyncableSyftObject], dict[UID, str]], str]:
         all_items: list[SyncableSyftObject] = []
 
-        # NOTE Jobs are handled separately
-        services_to_sync = [
-            "requestservice",
-            "usercodeservice",
-            "usercodestatusservice",
-            "apiservice",
-        ]
-
-        for service_name in services_to_sync:
+        for service_name in SERVICES_TO_SYNC:
             service = context.server.get_service(service_name)
             items = service.get_all(context)
             if isinstance(items, SyftError):
@@ -366,6 +373,181 @@ class SyncService(AbstractService):
 
         return Ok((all_items, errors))
 
+    def get_changed_syncable_items(
+        self, context: AuthedServiceContext, since: int
+    ) -> Result[tuple[list[SyncableSyftObject], set[UID], dict[UID, str]], str]:
+        """
+        Returns the syncable items changed after change sequence number `since`,
+        the ids of the deleted ones, and the jobs that could not be added.
+        A changed log, output or result of a job adds the job with all its items.
+        """
+        if not self.stash.job_batch_index_built:
+            return Err("Job items are not indexed yet")
+
+        items: dict[UID, SyncableSyftObject] = {}
+        deleted_ids: set[UID] = set()
+
+        for service_name in SERVICES_TO_SYNC:
+            stash = context.server.get_service(service_name).stash
+            changes = stash.changes_since(since)
+            if changes.is_err():
+                return changes
+            for uid, op in changes.ok().items():
+                obj = stash.get_by_uid(context.credentials, uid)
+                if obj.is_err():
+                    return obj
+                if op == CHANGE_DELETE or obj.ok() is None:
+                    deleted_ids.add(uid)
+                else:
+                    items[uid] = obj.ok()
+
+        job_stash = context.server.get_service("jobservice").stash
+        changes = job_stash.changes_since(since)
+        if changes.is_err():
+            return changes
+        job_ids = set(changes.ok())
+
+        for service_name in ["logservice", "outputservice"]:
+            stash = context.server.get_service(service_name).stash
+            changes = stash.changes_since(since)
+            if changes.is_err():
+                return changes
+            for uid, op in changes.ok().items():
+                obj = stash.get_by_uid(context.credentials, uid)
+                if obj.is_err():
+                    return obj
+                if op == CHANGE_DELETE or obj.ok() is None:
+                    deleted_ids.add(uid)
+                elif obj.ok().job_id is not None:
+                    job_ids.add(obj.ok().job_id)
+
+        action_store = context.server.get_service("actionservice").store
+        changes = action_store.changes_since(since)
+        if changes.is_err():
+            return changes
+        for uid, op in changes.ok().items():
+            job_id = self.stash.job_batch_index.get(uid)
+            if job_id is None:
+                # not part of a job yet, it is synced with its job
+                continue
+            if op == CHANGE_DELETE:
+                deleted_ids.add(uid)
+            else:
+                job_ids.add(job_id)
+
+        errors = {}
+        done_job_ids: set[UID] = set()
+        while job_ids:
+            done_job_ids |= job_ids
+            # a new subjob changes the dependencies of its parent
+            parent_job_ids = set()
+            for job_id in job_ids:
+                job = job_stash.get_by_uid(context.credentials, job_id)
+                if job.is_err():
+                    return job
+                job = job.ok()
+                if job is None:
+                    deleted_ids.add(job_id)
+                    continue
+                if job.parent_job_id is not None:
+                    parent_job_ids.add(job.parent_job_id)
+
+                job_items_result = self._get_job_batch(context, job)
+                if job_items_result.is_err():
+                    logger.info(
+                        f"Job {job.id} could not be added to SyncState: {job_items_result.err()}"
+                    )
+                    errors[job.id] = job_items_result.err()
+                    continue
+                for item in job_items_result.ok():
+                    items[item.id.id] = item
+            job_ids = parent_job_ids - done_job_ids
+
+        return Ok((list(items.values()), deleted_ids - set(items), errors))
+
+    def get_changed_dependency_ids(
+        self, context: AuthedServiceContext
+    ) -> set[UID] | None:
+        """Ids of the items whose dependencies may have changed since they were
+        added to the dependency graph, None if that is not known."""
+        since = self.stash.dependency_graph_seq
+        if since is None:
+            return None
+        # a changed job item changes the dependencies of the whole job batch,
+        # and of its parent jobs, the changed items contain both
+        changes = self.get_changed_syncable_items(context, since)
+        if changes.is_err():
+            return None
+        items, deleted_ids, errors = changes.ok()
+        return {item.id.id for item in items} | deleted_ids | set(errors)
+
+    def get_dependencies(
+        self, context: AuthedServiceContext, items: list[SyncableSyftObject]
+    ) -> dict[UID, list[UID]]:
+        """Sync dependencies of the items, only the dependencies of items that
+        changed since the last call are computed again."""
+        watermark = change_log_watermark()
+        graph = self.stash.dependency_graph
+        changed_ids = self.get_changed_dependency_ids(context)
+        if changed_ids is None:
+            graph.clear()
+        else:
+            for uid in changed_ids:
+                graph.pop(uid, None)
+
+        dependencies = {}
+        for item in items:
+            uid = item.id.id
+            if uid not in graph:
+                deps = item.get_sync_dependencies(context=context)
+                if isinstance(deps, SyftError):
+                    logger.info(f"Failed to get dependencies of {uid}: {deps.message}")
+                    continue
+                graph[uid] = [dep.id for dep in deps]  # type: ignore
+            dependencies[uid] = graph[uid]
+        self.stash.dependency_graph_seq = watermark
+        return dependencies
+
+    def build_state_changes(
+        self, context: AuthedServiceContext, since: int | None = None
+    ) -> Result[SyncStateDelta, str]:
+        # read before collecting, so changes made meanwhile are in the next delta
+        watermark = change_log_watermark()
+        deleted_ids: set[UID] = set()
+
+        if since is not None:
+            changes_res = self.get_changed_syncable_items(context, since)
+            if changes_res.is_err():
+                logger.info(f"Syncing all items, no changes: {changes_res.err()}")
+                since = None
+            else:
+                objects, deleted_ids, errors = changes_res.ok()
+
+        if since is None:
+            objects_res = self.get_all_syncable_items(context)
+            if objects_res.is_err():
+                return objects_res
+            objects, errors = objects_res.ok()
+
+        state = self.build_current_state(context, include_items=False)
+        if state.is_err():
+            return state
+
+        permissions, storage_permissions = self.get_permissions(context, objects)
+        return Ok(
+            SyncStateDelta(
+                state=state.ok(),
+                since=since,
+                watermark=watermark,
+                objects={obj.id.id: obj for obj in objects},
+                dependencies=self.get_dependencies(context, objects),
+                permissions=permissions,
+                storage_permissions=storage_permissions,
+                errors=errors,
+                deleted_ids=deleted_ids,
+            )
+        )
+
     def build_current_state(
         self,
         context: AuthedServiceContext,
@@ -438,7 +620,9 @@ class SyncService(AbstractService):
             errors=errors,
         )
 
-        new_state.add_objects(objects, context)
+        new_state.add_objects(
+            objects, context, dependencies=self.get_dependencies(context, objects)
+        )
 
         return Ok(new_state)
 
@@ -453,3 +637,18 @@ class SyncService(AbstractService):
             return SyftError(message=res.value)
         else:
             return res.ok()
+
+    @service_method(
+        path="sync._get_state_changes",
+        name="_get_state_changes",
+        roles=ADMIN_ROLE_LEVEL,
+    )
+    def _get_state_changes(
+        self, context: AuthedServiceContext, since: int | None = None
+    ) -> SyncStateDelta | SyftError:
+        """Objects to sync that changed after change sequence number `since`,
+        all objects if it is None or the changes are not known."""
+        res = self.build_state_changes(context, since)
+        if res.is_err():
+            return SyftError(message=res.value)
+        return res.ok()
@@ -16,6 +16,7 @@ from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...types.datetime import DateTime
+from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..context import AuthedServiceContext
 from .sync_state import SyncState
@@ -38,6 +39,14 @@ class SyncStash(BaseUIDStoreStash):
         self.settings = self.settings
         self._object_type = self.object_type
         self.last_state: SyncState | None = None
+        # uid of the logs, outputs and results of jobs -> job uid, to find the
+        # jobs to sync again when one of them changes
+        self.job_batch_index: dict[UID, UID] = {}
+        self.job_batch_index_built = False
+        # uid of syncable objects -> their sync dependencies, up to date with
+        # the changes before change sequence number `dependency_graph_seq`
+        self.dependency_graph: dict[UID, list[UID]] = {}
+        self.dependency_graph_seq: int | None = None
 
     def get_latest(
         self, context: AuthedServiceContext
@@ -131,6 +131,8 @@ class SyncState(SyftObject):
     # NOTE importing ServerDiff annotation with TYPE_CHECKING does not work here,
     # since typing.get_type_hints does not check for TYPE_CHECKING-imported types
     _previous_state_diff: Any = None
+    # sync dependencies of every object, `dependencies` are the ones in the state
+    _object_dependencies: dict[UID, list[UID]] | None = None
 
     __attr_searchable__ = ["created_at"]
 
@@ -178,32 +180,52 @@ class SyncState(SyftObject):
         return diff.status
 
     def add_objects(
-        self, objects: list[SyncableSyftObject], context: AuthedServiceContext
+        self,
+        objects: list[SyncableSyftObject],
+        context: AuthedServiceContext,
+        dependencies: dict[UID, list[UID]] | None = None,
     ) -> None:
+        """Adds objects to the state, `dependencies` holds the sync dependencies
+        of objects that are known already, the others are computed."""
+        dependencies = dependencies if dependencies is not None else {}
+        object_dependencies = dict(self._object_dependencies or {})
         for obj in objects:
             if isinstance(obj.id, LineageID):
-                self.objects[obj.id.id] = obj
+                uid = obj.id.id
             elif isinstance(obj.id, UID):
-                self.objects[obj.id] = obj
+                uid = obj.id
             else:
                 raise ValueError(f"Unsupported id type: {type(obj.id)}")
+            self.objects[uid] = obj
+            # an added object may have changed, its dependencies are not reused
+            object_dependencies.pop(uid, None)
+            if uid in dependencies:
+                object_dependencies[uid] = dependencies[uid]
+        self._object_dependencies = object_dependencies
 
-        # TODO might get slow with large states,
         # need to build dependencies every time to not have UIDs
         # in dependencies that are not in objects
         self._build_dependencies(context=context)
 
     def _build_dependencies(self, context: AuthedServiceContext) -> None:
-        self.dependencies = {}
+        # dependencies of all objects, including the ones not in the state,
+        # are kept so adding objects only computes the ones of the new objects
+        object_dependencies = self._object_dependencies
+        if object_dependencies is None:
+            object_dependencies = self._object_dependencies = {}
 
+        self.dependencies = {}
         all_ids = self.all_ids
-        for obj in self.objects.values():
-            if hasattr(obj, "get_sync_dependencies"):
+        for uid, obj in self.objects.items():
+            if uid not in object_dependencies:
+                if not hasattr(obj, "get_sync_dependencies"):
+                    continue
                 deps = obj.get_sync_dependencies(context=context)
-                deps = [d.id for d in deps if d.id in all_ids]  # type: ignore
-                # TODO: Why is this en check here? here?
-                if len(deps):
-                    self.dependencies[obj.id.id] = deps
+                object_dependencies[uid] = [d.id for d in deps]  # type: ignore
+            deps = [d for d in object_dependencies[uid] if d in all_ids]
+            # TODO: Why is this en check here? here?
+            if len(deps):
+                self.dependencies[uid] = deps
 
     @property
     def rows(self) -> list[SyncStateRow]:
@@ -262,3 +284,79 @@ class SyncState(SyftObject):
         </div>
 """
         return repr + self.rows._repr_html_()
+
+
+@serializable()
+class SyncStateDelta(SyftObject):
+    """The objects to sync that changed since an earlier sync state.
+
+    `since` is the change log sequence number the changes were read from, None
+    if the delta holds all objects. The next delta continues from `watermark`.
+    Clients `merge` deltas into the delta of all objects they got before.
+    """
+
+    __canonical_name__ = "SyncStateDelta"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # sync metadata of the server, without objects
+    state: SyncState
+    since: int | None = None
+    watermark: int
+    objects: dict[UID, SyncableSyftObject] = {}
+    # dependencies of the objects, including the ones not in this delta
+    dependencies: dict[UID, list[UID]] = {}
+    permissions: dict[UID, set[str]] = {}
+    storage_permissions: dict[UID, set[UID]] = {}
+    errors: dict[UID, str] = {}
+    deleted_ids: set[UID] = set()
+
+    def merge(self, previous: Optional["SyncStateDelta"]) -> "SyncStateDelta":
+        if self.since is None:
+            return self
+        if previous is None or previous.since is not None:
+            raise ValueError("Changes can only be merged into a delta of all objects")
+
+        removed_ids = self.deleted_ids | set(self.objects)
+        objects = {
+            uid: obj for uid, obj in previous.objects.items() if uid not in removed_ids
+        }
+        objects.update(self.objects)
+
+        def merged(old: dict, new: dict) -> dict:
+            return {
+                **{uid: v for uid, v in old.items() if uid not in removed_ids},
+                **new,
+            }
+
+        return SyncStateDelta(
+            state=self.state,
+            since=None,
+            watermark=self.watermark,
+            objects=objects,
+            dependencies=merged(previous.dependencies, self.dependencies),
+            permissions=merged(previous.permissions, self.permissions),
+            storage_permissions=merged(
+                previous.storage_permissions, self.storage_permissions
+            ),
+            errors=merged(previous.errors, self.errors),
+        )
+
+    def to_state(self) -> SyncState:
+        all_ids = set(self.objects)
+        dependencies = {}
+        for uid, deps in self.dependencies.items():
+            deps = [dep for dep in deps if dep in all_ids]
+            if uid in all_ids and len(deps):
+                dependencies[uid] = deps
+
+        state = self.state.model_copy(
+            update={
+                "objects": dict(self.objects),
+                "dependencies": dependencies,
+                "permissions": dict(self.permissions),
+                "storage_permissions": dict(self.storage_permissions),
+                "errors": dict(self.errors),
+            }
+        )
+        state._object_dependencies = dict(self.dependencies)
+        return state
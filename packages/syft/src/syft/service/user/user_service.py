@@ -1,8 +1,13 @@
 # stdlib
+from collections.abc import Iterable
 from datetime import datetime
 from datetime import timedelta
 import secrets
 import string
+import threading
+
+# third party
+from cachetools import LRUCache
 
 # relative
 from ...abstract_server import ServerType
@@ -51,6 +56,24 @@ from .user_roles import ServiceRole
 from .user_roles import ServiceRoleCapability
 from .user_stash import UserStash
 
+# users whose view is kept, to list many objects of the same users quickly
+USER_VIEW_CACHE_SIZE = 4096
+
+_user_view_cache: LRUCache = LRUCache(maxsize=USER_VIEW_CACHE_SIZE)
+_user_view_cache_lock = threading.Lock()
+
+
+def cached_user_view(user: User) -> UserView:
+    """UserView of `user`, transformed again only after the user was updated."""
+    key = (user.id, user.updated_date)
+    with _user_view_cache_lock:
+        view = _user_view_cache.get(key)
+    if view is None:
+        view = user.to(UserView)
+        with _user_view_cache_lock:
+            _user_view_cache[key] = view
+    return view
+
 
 @instrument
 @serializable(canonical_name="UserService", version=1)
@@ -419,6 +442,41 @@ class UserService(AbstractService):
 
         return results
 
+    @service_method(path="user.search_text", name="search_text")
+    def search_text(
+        self,
+        context: AuthedServiceContext,
+        query: str,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> UserViewPage | list[UserView] | SyftError:
+        """Search users by name, email and institution, best matches first"""
+        # relative
+        from ..dataset.dataset_service import _paginate_collection
+
+        result = self.stash.search(
+            context.credentials,
+            query=query,
+            has_permission=context.role in [ServiceRole.DATA_OWNER, ServiceRole.ADMIN],
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        uids = result.ok()
+
+        # only the users of the requested page are loaded
+        slice_ = _paginate_collection(uids, page_size=page_size, page_index=page_index)
+        users = []
+        for uid in uids[slice_] if slice_ is not None else uids:
+            user_result = self.stash.get_by_uid(self.admin_verify_key(), uid=uid)
+            if user_result.is_err():
+                return SyftError(message=str(user_result.err()))
+            if (user := user_result.ok()) is not None:
+                users.append(user.to(UserView))
+
+        if slice_ is None:
+            return users
+        return UserViewPage(users=users, total=len(uids))
+
     # @service_method(path="user.get_admin", name="get_admin", roles=GUEST_ROLE_LEVEL)
     # def get_admin(self, context: AuthedServiceContext) -> UserView:
     #     result = self.stash.admin_user()
@@ -776,6 +834,18 @@ class UserService(AbstractService):
             return result.ok()
         return SyftError(message=f"No User with verify_key: {verify_key}")
 
+    def get_by_verify_keys(
+        self, verify_keys: Iterable[SyftVerifyKey]
+    ) -> dict[SyftVerifyKey, User] | SyftError:
+        # bypasses permissions like get_by_verify_key
+        credentials = self.admin_verify_key()
+        result = self.stash.get_by_verify_keys(
+            credentials=credentials, verify_keys=verify_keys
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return result.ok()
+
     # TODO: This exposed service is only for the development phase.
     # enable/disable notifications will be called from Notifier Service
 
@@ -1,4 +1,5 @@
 # stdlib
+from collections.abc import Iterable
 
 # third party
 from result import Ok
@@ -14,6 +15,8 @@ from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
 from ...store.document_store import UIDPartitionKey
+from ...store.search_index import InMemorySearchIndex
+from ...store.search_index import SearchFields
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -29,6 +32,14 @@ SigningKeyPartitionKey = PartitionKey(key="signing_key", type_=SyftSigningKey)
 VerifyKeyPartitionKey = PartitionKey(key="verify_key", type_=SyftVerifyKey)
 
 
+class UserSearchIndex(InMemorySearchIndex):
+    def __init__(self) -> None:
+        super().__init__(
+            field_weights={"name": 2.0, "email": 2.0},
+            substring_fields=("name", "email"),
+        )
+
+
 @instrument
 @serializable(canonical_name="UserStash", version=1)
 class UserStash(BaseStash):
@@ -37,10 +48,18 @@ class UserStash(BaseStash):
         name=User.__canonical_name__,
         object_type=User,
     )
+    search_index_type = UserSearchIndex
 
     def __init__(self, store: DocumentStore) -> None:
         super().__init__(store=store)
 
+    def search_fields(self, obj: User) -> SearchFields | None:
+        return {
+            "name": obj.name or "",
+            "email": obj.email or "",
+            "institution": obj.institution or "",
+        }
+
     def set(
         self,
         credentials: SyftVerifyKey,
@@ -116,6 +135,22 @@ class UserStash(BaseStash):
         qks = QueryKeys(qks=[VerifyKeyPartitionKey.with_obj(verify_key)])
         return self.query_one(credentials=credentials, qks=qks)
 
+    def get_by_verify_keys(
+        self, credentials: SyftVerifyKey, verify_keys: Iterable[SyftVerifyKey]
+    ) -> Result[dict[SyftVerifyKey, User], str]:
+        """Users with any of `verify_keys`, read in one pass over the partition."""
+        verify_keys = set(verify_keys)
+        result = self.get_all(credentials)
+        if result.is_err():
+            return result
+        return Ok(
+            {
+                user.verify_key: user
+                for user in result.ok()
+                if user.verify_key in verify_keys
+            }
+        )
+
     def delete_by_uid(
         self, credentials: SyftVerifyKey, uid: UID, has_permission: bool = False
     ) -> Result[SyftSuccess, str]:
@@ -0,0 +1,277 @@
+# stdlib
+from abc import ABC
+from abc import abstractmethod
+from collections import defaultdict
+import logging
+import math
+import threading
+import time
+from typing import Any
+
+# third party
+from pydantic import model_validator
+
+# relative
+from ...types.base import SyftBaseModel
+from ...types.datetime import DateTime
+from ...types.uid import UID
+from ..context import AuthedServiceContext
+from ..queue.queue_stash import Status
+from ..response import SyftError
+from ..response import SyftSuccess
+from .worker_pool import ConsumerState
+
+logger = logging.getLogger(__name__)
+
+
+class AutoscalePolicy(SyftBaseModel):
+    """Bounds and targets the autoscaler keeps a worker pool within."""
+
+    min_workers: int = 0
+    max_workers: int
+    # queued jobs a worker may have waiting before a worker is added
+    target_queue_per_worker: float = 1.0
+    # add a worker when the 90th percentile of queued job wait times is above this
+    max_wait_seconds: float = 60.0
+    # scale down only when fewer workers than this fraction are busy
+    scale_down_utilization: float = 0.5
+    scale_up_cooldown_seconds: float = 60.0
+    scale_down_cooldown_seconds: float = 300.0
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> "AutoscalePolicy":
+        if not 0 <= self.min_workers <= self.max_workers:
+            raise ValueError(
+                f"Invalid worker bounds: min={self.min_workers}, max={self.max_workers}"
+            )
+        if self.target_queue_per_worker <= 0:
+            raise ValueError("target_queue_per_worker must be positive")
+        return self
+
+
+class PoolMetrics(SyftBaseModel):
+    queued: int = 0
+    processing: int = 0
+    workers: int = 0
+    busy_workers: int = 0
+    wait_p90_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_workers / self.workers if self.workers else 0.0
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, math.ceil(q * len(values)) - 1)]
+
+
+def desired_workers(policy: AutoscalePolicy, metrics: PoolMetrics, current: int) -> int:
+    """Number of workers the pool should have, within the bounds of the policy."""
+    desired = metrics.processing + math.ceil(
+        metrics.queued / policy.target_queue_per_worker
+    )
+    if metrics.queued and metrics.wait_p90_seconds > policy.max_wait_seconds:
+        desired = max(desired, current + 1)
+    if desired < current and metrics.utilization >= policy.scale_down_utilization:
+        # the workers are kept busy, don't take capacity away yet
+        desired = current
+    return max(policy.min_workers, min(policy.max_workers, desired))
+
+
+def collect_pool_metrics(context: AuthedServiceContext) -> dict[str, PoolMetrics]:
+    """Queue depth, wait times and worker utilization of all worker pools."""
+    server = context.server
+    credentials = server.verify_key
+    pools = server.get_service("SyftWorkerPoolService").stash.get_all(credentials)
+    if pools.is_err():
+        raise Exception(f"Failed to fetch worker pools: {pools.err()}")
+    pool_names: dict[UID, str] = {pool.id: pool.name for pool in pools.ok()}
+    metrics = {name: PoolMetrics() for name in pool_names.values()}
+
+    wait_times: defaultdict[str, list[float]] = defaultdict(list)
+    now = DateTime.now().utc_timestamp
+    for status in (Status.CREATED, Status.PROCESSING):
+        items = server.queue_stash.get_by_status(credentials, status=status)
+        if items.is_err():
+            raise Exception(f"Failed to fetch queue items: {items.err()}")
+        for item in items.ok() or []:
+            name = pool_names.get(item.worker_pool.object_uid)
+            if name is None:
+                continue
+            if status == Status.CREATED:
+                metrics[name].queued += 1
+                if item.created_date is not None:
+                    wait_times[name].append(now - item.created_date.utc_timestamp)
+            else:
+                metrics[name].processing += 1
+
+    workers = server.get_service("WorkerService").stash.get_all(credentials)
+    if workers.is_err():
+        raise Exception(f"Failed to fetch workers: {workers.err()}")
+    for worker in workers.ok():
+        if worker.worker_pool_name not in metrics:
+            continue
+        metrics[worker.worker_pool_name].workers += 1
+        if worker.consumer_state == ConsumerState.CONSUMING:
+            metrics[worker.worker_pool_name].busy_workers += 1
+
+    for name, waits in wait_times.items():
+        metrics[name].wait_p90_seconds = percentile(waits, 0.9)
+    return metrics
+
+
+class AutoscalerBackend(ABC):
+    """Changes the number of workers of a pool, e.g. through the container orchestrator."""
+
+    def can_scale_down(self) -> bool:
+        return True
+
+    @abstractmethod
+    def current_workers(self, context: AuthedServiceContext, pool_name: str) -> int:
+        pass
+
+    @abstractmethod
+    def scale(
+        self, context: AuthedServiceContext, pool_name: str, number: int
+    ) -> SyftSuccess | SyftError:
+        pass
+
+
+class WorkerPoolServiceBackend(AutoscalerBackend):
+    """Scales pools the same way admins do, through the worker pool service.
+
+    Outside Kubernetes pools can only grow, by starting containers.
+    """
+
+    def can_scale_down(self) -> bool:
+        # relative
+        from ...custom_worker.k8s import IN_KUBERNETES
+
+        return IN_KUBERNETES
+
+    def current_workers(self, context: AuthedServiceContext, pool_name: str) -> int:
+        pool = context.server.get_service("SyftWorkerPoolService")._get_worker_pool(
+            context, pool_name=pool_name
+        )
+        if isinstance(pool, SyftError):
+            raise Exception(pool.message)
+        return len(pool.worker_list)
+
+    def scale(
+        self, context: AuthedServiceContext, pool_name: str, number: int
+    ) -> SyftSuccess | SyftError:
+        # relative
+        from ...custom_worker.k8s import IN_KUBERNETES
+
+        service = context.server.get_service("SyftWorkerPoolService")
+        current = self.current_workers(context, pool_name)
+        if IN_KUBERNETES:
+            return service.scale(context, number=number, pool_name=pool_name)
+        if number <= current:
+            return SyftSuccess(message=f"Worker pool kept at {current} workers")
+        result = service.add_workers(
+            context, number=number - current, pool_name=pool_name
+        )
+        if isinstance(result, SyftError):
+            return result
+        return SyftSuccess(message=f"Worker pool scaled to {number} workers")
+
+
+class WorkerPoolAutoscaler:
+    """Scales worker pools by queue depth, job wait times and worker utilization.
+
+    Runs next to the server like the peer health checks. Only pools with a
+    policy are scaled, always within the policy's bounds, and a pool is not
+    scaled up again before the scale up cooldown passed, or down before the
+    scale down cooldown passed since its last scaling.
+    """
+
+    repeat_time = 15  # in seconds
+
+    def __init__(self, backend: AutoscalerBackend | None = None) -> None:
+        self.backend = backend if backend is not None else WorkerPoolServiceBackend()
+        self.policies: dict[str, AutoscalePolicy] = {}
+        self.last_scaled: dict[str, float] = {}
+        self.last_metrics: dict[str, PoolMetrics] = {}
+        self.thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def set_policy(self, pool_name: str, policy: AutoscalePolicy) -> None:
+        self.policies[pool_name] = policy
+
+    def remove_policy(self, pool_name: str) -> None:
+        self.policies.pop(pool_name, None)
+        self.last_scaled.pop(pool_name, None)
+
+    def step(self, context: AuthedServiceContext) -> dict[str, int]:
+        """Scale every pool with a policy once, returns the pools that were scaled."""
+        if not self.policies:
+            return {}
+        self.last_metrics = collect_pool_metrics(context)
+        now = time.monotonic()
+        scaled = {}
+        for pool_name, policy in list(self.policies.items()):
+            metrics = self.last_metrics.get(pool_name)
+            if metrics is None:
+                logger.warning(f"Autoscaling policy for unknown pool {pool_name}")
+                continue
+            current = self.backend.current_workers(context, pool_name)
+            desired = desired_workers(policy, metrics, current)
+            if desired < current and not self.backend.can_scale_down():
+                desired = current
+            if desired == current:
+                continue
+
+            cooldown = (
+                policy.scale_up_cooldown_seconds
+                if desired > current
+                else policy.scale_down_cooldown_seconds
+            )
+            last_scaled = self.last_scaled.get(pool_name)
+            if last_scaled is not None and now - last_scaled < cooldown:
+                continue
+
+            logger.info(
+                f"Autoscaling pool {pool_name} from {current} to {desired} workers, {metrics}"
+            )
+            result = self.backend.scale(context, pool_name, desired)
+            if isinstance(result, SyftError):
+                logger.error(f"Failed to autoscale pool {pool_name}: {result.message}")
+                continue
+            self.last_scaled[pool_name] = now
+            scaled[pool_name] = desired
+        return scaled
+
+    def _run(self, context: AuthedServiceContext) -> None:
+        while not self._stop.is_set():
+            try:
+                self.step(context)
+            except Exception as e:
+                logger.error("Worker pool autoscaling failed", exc_info=e)
+            self._stop.wait(self.repeat_time)
+
+    def run(self, context: AuthedServiceContext) -> None:
+        if self.thread is not None:
+            return
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._run, args=(context,), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread is not None:
+            self._stop.set()
+            self.thread.join()
+            self.thread = None
+            logger.info("Worker pool autoscaler stopped.")
+
+    def status(self) -> dict[str, Any]:
+        return {
+            pool_name: {
+                "policy": policy,
+                "metrics": self.last_metrics.get(pool_name),
+            }
+            for pool_name, policy in self.policies.items()
+        }
@@ -42,6 +42,7 @@ from .worker_image import SyftWorkerImage
 from .worker_image_stash import SyftWorkerImageStash
 from .worker_pool import ContainerSpawnStatus
 from .worker_pool import WorkerPool
+from .worker_pool_autoscaler import AutoscalePolicy
 from .worker_pool_stash import SyftWorkerPoolStash
 from .worker_service import WorkerService
 from .worker_stash import WorkerStash
@@ -550,6 +551,65 @@ class SyftWorkerPoolService(AbstractService):
 
         return SyftSuccess(message=f"Worker pool scaled to {number} workers")
 
+    @service_method(
+        path="worker_pool.enable_autoscaling",
+        name="enable_autoscaling",
+        roles=DATA_OWNER_ROLE_LEVEL,
+    )
+    def enable_autoscaling(
+        self,
+        context: AuthedServiceContext,
+        pool_name: str,
+        max_workers: int,
+        min_workers: int = 0,
+        target_queue_per_worker: float = 1.0,
+        max_wait_seconds: float = 60.0,
+        scale_up_cooldown_seconds: float = 60.0,
+        scale_down_cooldown_seconds: float = 300.0,
+    ) -> SyftSuccess | SyftError:
+        """Scale the worker pool between min_workers and max_workers, by the
+        number of queued jobs per worker and how long they have been waiting.
+
+        Policies are kept in memory by the server and need to be enabled again
+        after a restart.
+        """
+        result = self._get_worker_pool(context, pool_name=pool_name)
+        if isinstance(result, SyftError):
+            return result
+
+        try:
+            policy = AutoscalePolicy(
+                min_workers=min_workers,
+                max_workers=max_workers,
+                target_queue_per_worker=target_queue_per_worker,
+                max_wait_seconds=max_wait_seconds,
+                scale_up_cooldown_seconds=scale_up_cooldown_seconds,
+                scale_down_cooldown_seconds=scale_down_cooldown_seconds,
+            )
+        except pydantic.ValidationError as e:
+            return SyftError(message=f"Invalid autoscaling policy: {e}")
+
+        autoscaler = context.server.worker_pool_autoscaler
+        autoscaler.set_policy(pool_name, policy)
+        autoscaler.run(context=context.as_root_context())
+        return SyftSuccess(
+            message=f"Autoscaling enabled for {pool_name}: {min_workers} to {max_workers} workers"
+        )
+
+    @service_method(
+        path="worker_pool.disable_autoscaling",
+        name="disable_autoscaling",
+        roles=DATA_OWNER_ROLE_LEVEL,
+    )
+    def disable_autoscaling(
+        self, context: AuthedServiceContext, pool_name: str
+    ) -> SyftSuccess | SyftError:
+        autoscaler = context.server.worker_pool_autoscaler
+        if pool_name not in autoscaler.policies:
+            return SyftError(message=f"Autoscaling is not enabled for {pool_name}")
+        autoscaler.remove_policy(pool_name)
+        return SyftSuccess(message=f"Autoscaling disabled for {pool_name}")
+
     @service_method(
         path="worker_pool.filter_by_image_id",
         name="filter_by_image_id",
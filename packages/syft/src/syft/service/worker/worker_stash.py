@@ -21,6 +21,7 @@ from .worker_pool import ConsumerState
 from .worker_pool import SyftWorker
 
 WorkerContainerNamePartitionKey = PartitionKey(key="container_name", type_=str)
+WorkerToBeDeletedPartitionKey = PartitionKey(key="to_be_deleted", type_=bool)
 
 
 @instrument
@@ -61,6 +62,12 @@ class WorkerStash(BaseUIDStoreStash):
         qks = QueryKeys(qks=[WorkerContainerNamePartitionKey.with_obj(worker_name)])
         return self.query_one(credentials=credentials, qks=qks)
 
+    def get_to_be_deleted(
+        self, credentials: SyftVerifyKey
+    ) -> Result[list[SyftWorker], str]:
+        qks = QueryKeys(qks=[WorkerToBeDeletedPartitionKey.with_obj(True)])
+        return self.query_all(credentials=credentials, qks=qks)
+
     def update_consumer_state(
         self, credentials: SyftVerifyKey, worker_uid: UID, consumer_state: ConsumerState
     ) -> Result[str, str]:
@@ -72,6 +79,8 @@ class WorkerStash(BaseUIDStoreStash):
         worker: SyftWorker | None = res.ok()
         if worker is None:
             return Err(f"Worker with id: {worker_uid} not found")
+        if worker.consumer_state == consumer_state:
+            return Ok(f"Worker with id: {worker_uid} is already {consumer_state}")
         worker.consumer_state = consumer_state
         update_res = self.update(credentials=credentials, obj=worker)
         if update_res.is_err():
@@ -38,11 +38,19 @@ Read/retrieve SyftObject from blob storage
 - get a BlobRetrieval from the id of the BlobStorageEntry of the SyftObject
   `blob_retrieval = api.services.blob_storage.read(blob_storage_entry_id)`
 - use `BlobRetrieval.read` to retrieve the SyftObject `syft_object = blob_retrieval.read()`
+
+Read a byte range of a blob
+---------------------------
+
+- pass `offset` and `length` to `api.services.blob_storage.read` and to `BlobRetrieval._read_data`.
+  On-disk storage only reads and returns the range, URL based storage sends an HTTP Range request.
+- `BlobRangeReader` wraps this into a seekable file object, see `BlobFile.open`
 """
 
 # stdlib
 from collections.abc import Callable
 from collections.abc import Generator
+import io
 from io import BytesIO
 import logging
 from typing import Any
@@ -171,6 +179,8 @@ class BlobRetrievalByURL(BlobRetrieval):
         stream: bool = False,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         *args: Any,
+        offset: int | None = None,
+        length: int | None = None,
         **kwargs: Any,
     ) -> Any:
         # relative
@@ -198,6 +208,9 @@ class BlobRetrievalByURL(BlobRetrieval):
             is_blob_file = self.type_ is not None and issubclass(
                 self.type_, BlobFileType
             )
+            if offset is not None or length is not None:
+                return self._read_range(blob_url, offset or 0, length)
+
             if is_blob_file and stream:
                 return syft_iter_content(blob_url, chunk_size)
 
@@ -213,6 +226,66 @@ class BlobRetrievalByURL(BlobRetrieval):
         except requests.RequestException as e:
             return SyftError(message=f"Failed to retrieve with error: {e}")
 
+    def _read_range(
+        self, blob_url: str | ServerURL, offset: int, length: int | None
+    ) -> bytes:
+        """Read the raw bytes [offset, offset + length) with an HTTP Range request."""
+        if length == 0:
+            return b""
+        end = "" if length is None else str(offset + length - 1)
+        response = requests.get(
+            str(blob_url), headers={"Range": f"bytes={offset}-{end}"}
+        )  # nosec
+        response.raise_for_status()
+        if response.status_code == 206:
+            return response.content
+        # the server ignored the Range header and sent the whole blob
+        return response.content[offset : None if length is None else offset + length]
+
+
+class BlobRangeReader(io.RawIOBase):
+    """Read-only, seekable file object over a blob, where every read fetches
+    only the requested byte range. This lets e.g. pyarrow read the footer and
+    single parquet row groups or Arrow IPC record batches of a large file."""
+
+    def __init__(self, read_range: Callable[[int, int], bytes], size: int) -> None:
+        self._read_range = read_range
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return self._pos
+
+    def readinto(self, buffer: Any) -> int:
+        length = min(len(buffer), self._size - self._pos)
+        if length <= 0:
+            return 0
+        data = self._read_range(self._pos, length)
+        n_read = len(data)
+        buffer[:n_read] = data
+        self._pos += n_read
+        return n_read
+
 
 @serializable()
 class BlobDeposit(SyftObject):
@@ -237,7 +310,13 @@ class BlobStorageConnection:
     def __exit__(self, *exc: Any) -> None:
         raise NotImplementedError
 
-    def read(self, fp: SecureFilePathLocation, type_: type | None) -> BlobRetrieval:
+    def read(
+        self,
+        fp: SecureFilePathLocation,
+        type_: type | None,
+        offset: int | None = None,
+        length: int | None = None,
+    ) -> BlobRetrieval:
         raise NotImplementedError
 
     def allocate(
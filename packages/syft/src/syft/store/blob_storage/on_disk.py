@@ -55,11 +55,22 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
         pass
 
     def read(
-        self, fp: SecureFilePathLocation, type_: type | None, **kwargs: Any
+        self,
+        fp: SecureFilePathLocation,
+        type_: type | None,
+        offset: int | None = None,
+        length: int | None = None,
+        **kwargs: Any,
     ) -> BlobRetrieval:
         file_path = self._base_directory / fp.path
+        if offset is None and length is None:
+            data = file_path.read_bytes()
+        else:
+            with open(file_path, "rb") as f:
+                f.seek(offset or 0)
+                data = f.read(-1 if length is None else length)
         return SyftObjectRetrieval(
-            syft_object=file_path.read_bytes(),
+            syft_object=data,
             file_name=file_path.name,
             type_=type_,
         )
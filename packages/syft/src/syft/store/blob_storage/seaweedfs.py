@@ -252,12 +252,15 @@ class SeaweedFSConnection(BlobStorageConnection):
         self,
         fp: SecureFilePathLocation,
         type_: type | None,
+        offset: int | None = None,
+        length: int | None = None,
         bucket_name: str | None = None,
     ) -> BlobRetrieval:
         if bucket_name is None:
             bucket_name = self.default_bucket_name
         # this will generate the url, the SecureFilePathLocation also handles the logic
         # that decides whether to use a direct connection to azure/aws/gcp or via seaweed
+        # a byte range is requested by the client with an HTTP Range header on this url
         return fp.generate_url(self, type_, bucket_name)
 
     def allocate(
@@ -0,0 +1,54 @@
+# stdlib
+import threading
+import time
+from typing import Any
+
+# relative
+from ..serde.serializable import serializable
+from ..types.uid import UID
+
+CHANGE_SET = "set"
+CHANGE_UPDATE = "update"
+CHANGE_DELETE = "delete"
+CHANGE_PERMISSIONS = "permissions"
+
+# a change is logged right after it was written, readers start this far before
+# the time they last read, to not miss changes other writers were logging meanwhile
+CHANGE_LOG_GRACE_NS = 5 * 10**9
+
+_seq_lock = threading.Lock()
+_last_seq = 0
+
+
+def next_change_seq() -> int:
+    """Sequence numbers are increasing in this process, and ordered by time
+    across the processes sharing a store."""
+    global _last_seq
+    with _seq_lock:
+        _last_seq = max(time.time_ns(), _last_seq + 1)
+        return _last_seq
+
+
+def change_log_watermark() -> int:
+    """Sequence number to read changes from, to get all changes from now on."""
+    return time.time_ns() - CHANGE_LOG_GRACE_NS
+
+
+@serializable(canonical_name="ChangeLog", version=1)
+class ChangeLog:
+    """Log of the objects changed in a partition, uid -> (sequence number, op).
+
+    Only the last change of every object is kept, so the log grows with the
+    number of objects in the partition, not with the number of writes.
+    """
+
+    def __init__(self, backing_store: Any) -> None:
+        self.entries = backing_store
+
+    def record(self, uid: UID, op: str) -> None:
+        self.entries[uid] = (next_change_seq(), op)
+
+    def changes_since(self, seq: int) -> dict[UID, str]:
+        return {
+            uid: op for uid, (entry_seq, op) in self.entries.items() if entry_seq > seq
+        }
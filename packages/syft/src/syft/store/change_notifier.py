@@ -0,0 +1,84 @@
+# stdlib
+from collections import defaultdict
+from collections.abc import Callable
+import threading
+import time
+
+# relative
+from ..types.uid import UID
+
+# upper bound for a single long poll, so requests don't hang forever
+MAX_LONG_POLL_TIMEOUT = 30.0
+# writes done by other processes are not notified, re-check the store this often
+DEFAULT_RECHECK_INTERVAL = 0.5
+# long polls hold a server thread, above this many waiters callers poll instead
+MAX_LONG_POLL_WAITERS = 32
+
+
+class ChangeNotifier:
+    """Wakes up threads that wait for objects to be written in this process.
+
+    Stashes call `notify` after writing an object. `wait_until` blocks until
+    a predicate over the store holds, re-evaluating it on every notification
+    for one of the given uids and at least every `recheck_interval` seconds,
+    which covers writes done by other processes, like consumers running in
+    their own container.
+    """
+
+    def __init__(self, max_waiters: int = MAX_LONG_POLL_WAITERS) -> None:
+        self._lock = threading.Lock()
+        self._waiters: defaultdict[UID, list[threading.Event]] = defaultdict(list)
+        self._slots = threading.BoundedSemaphore(max_waiters)
+
+    def notify(self, uid: UID) -> None:
+        with self._lock:
+            events = self._waiters.pop(uid, [])
+        for event in events:
+            event.set()
+
+    def _register(self, uids: list[UID], event: threading.Event) -> None:
+        with self._lock:
+            for uid in uids:
+                self._waiters[uid].append(event)
+
+    def _unregister(self, uids: list[UID], event: threading.Event) -> None:
+        with self._lock:
+            for uid in uids:
+                events = self._waiters.get(uid)
+                if events is not None and event in events:
+                    events.remove(event)
+                    if not events:
+                        del self._waiters[uid]
+
+    def wait_until(
+        self,
+        uids: list[UID],
+        predicate: Callable[[], bool],
+        timeout: float,
+        recheck_interval: float = DEFAULT_RECHECK_INTERVAL,
+    ) -> bool:
+        timeout = min(timeout, MAX_LONG_POLL_TIMEOUT)
+        if not self._slots.acquire(blocking=False):
+            # too many waiting requests, let the caller fall back to polling
+            return predicate()
+
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                event = threading.Event()
+                # register before checking, so a write in between is not missed
+                self._register(uids, event)
+                try:
+                    if predicate():
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    event.wait(min(recheck_interval, remaining))
+                finally:
+                    self._unregister(uids, event)
+        finally:
+            self._slots.release()
+
+
+change_notifier = ChangeNotifier()
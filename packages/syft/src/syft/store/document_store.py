@@ -20,6 +20,7 @@ from ..serde.serializable import serializable
 from ..server.credentials import SyftSigningKey
 from ..server.credentials import SyftVerifyKey
 from ..service.action.action_permissions import ActionObjectPermission
+from ..service.action.action_permissions import ActionObjectREAD
 from ..service.action.action_permissions import StoragePermission
 from ..service.context import AuthedServiceContext
 from ..service.response import SyftSuccess
@@ -33,6 +34,8 @@ from ..util.telemetry import instrument
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
+from .search_index import SearchFields
+from .search_index import SearchIndex
 
 
 @serializable(canonical_name="BasePartitionSettings", version=1)
@@ -308,6 +311,9 @@ class StorePartition:
             Backend specific configuration
     """
 
+    # text index of the objects, shared by the stashes of the partition
+    search_index: SearchIndex | None = None
+
     def __init__(
         self,
         server_uid: UID,
@@ -440,6 +446,82 @@ class StorePartition:
             has_permission=has_permission,
         )
 
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        updates: list[tuple[QueryKey, SyftObject]],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        """Update several objects, taking the lock once for all of them."""
+        return self._thread_safe_cbk(
+            self._update_many,
+            credentials=credentials,
+            updates=updates,
+            has_permission=has_permission,
+        )
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        updates: list[tuple[QueryKey, SyftObject]],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        return Ok(
+            [
+                self._update(
+                    credentials=credentials,
+                    qk=qk,
+                    obj=obj,
+                    has_permission=has_permission,
+                )
+                for qk, obj in updates
+            ]
+        )
+
+    def update_with(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        update: Callable[[SyftObject | None], SyftObject],
+        has_permission: bool = False,
+    ) -> Result[SyftObject, str]:
+        """Read the object `uid`, and write back `update` of it, without another
+        write to the partition in between.
+
+        `update` gets None if there is no object `uid` yet, and the object it
+        returns is created then.
+        """
+        return self._thread_safe_cbk(
+            self._update_with,
+            credentials=credentials,
+            uid=uid,
+            update=update,
+            has_permission=has_permission,
+        )
+
+    def _update_with(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        update: Callable[[SyftObject | None], SyftObject],
+        has_permission: bool = False,
+    ) -> Result[SyftObject, str]:
+        try:
+            current = self._get(
+                uid=uid, credentials=credentials, has_permission=has_permission
+            )
+        except (KeyError, IndexError):
+            current = Err(f"No object with uid {uid}")
+        obj = update(current.ok() if current.is_ok() else None)
+        if current.is_err():
+            return self._set(credentials=credentials, obj=obj)
+        return self._update(
+            credentials=credentials,
+            qk=self.store_query_key(obj),
+            obj=obj,
+            has_permission=has_permission,
+        )
+
     def get_all_from_store(
         self,
         credentials: SyftVerifyKey,
@@ -558,6 +640,9 @@ class StorePartition:
     def get_all_storage_permissions(self) -> Result[dict[UID, set[UID]], str]:
         raise NotImplementedError
 
+    def changes_since(self, seq: int) -> Result[dict[UID, str], str]:
+        return Err(f"{type(self).__name__} does not keep a change log")
+
     def _migrate_data(
         self,
         to_klass: SyftObject,
@@ -645,10 +730,65 @@ class BaseStash:
     object_type: type[SyftObject]
     settings: PartitionSettings
     partition: StorePartition
+    # stashes searchable by text set this and implement `search_fields`
+    search_index_type: type[SearchIndex] | None = None
 
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.partition = store.partition(type(self).settings)
+        if self.search_index_type is not None and self.partition.search_index is None:
+            self.partition.search_index = self.search_index_type()
+
+    def search_fields(self, obj: SyftObject) -> SearchFields | None:
+        """Text of `obj` to search by, None to leave it out of search results."""
+        return None
+
+    def _index_for_search(self, obj: SyftObject) -> None:
+        index = self.partition.search_index
+        if index is None:
+            return
+        fields = self.search_fields(obj)
+        if fields is None:
+            index.remove(obj.id)
+        else:
+            index.add(obj.id, fields)
+
+    def search(
+        self, credentials: SyftVerifyKey, query: str, has_permission: bool = False
+    ) -> Result[list[UID], str]:
+        """UIDs of the objects matching a text query, best matches first.
+
+        Only the UIDs are returned, so callers can paginate the results before
+        loading any objects. Objects written by other server processes are found
+        once the index is rebuilt, see `SearchIndex`.
+        """
+        index = self.partition.search_index
+        if index is None:
+            return Err(f"{type(self).__name__} is not searchable")
+
+        if index.is_stale:
+            result = self.partition.all(
+                self.partition.root_verify_key, has_permission=True
+            )
+            if result.is_err():
+                return result
+            documents = []
+            for obj in result.ok():
+                fields = self.search_fields(obj)
+                if fields is not None:
+                    documents.append((obj.id, fields))
+            index.rebuild(documents)
+
+        uids = index.search(query)
+        if not has_permission:
+            uids = [
+                uid
+                for uid in uids
+                if self.partition.has_permission(
+                    ActionObjectREAD(uid=uid, credentials=credentials)
+                )
+            ]
+        return Ok(uids)
 
     def check_type(self, obj: Any, type_: type) -> Result[Any, str]:
         return (
@@ -683,6 +823,10 @@ class BaseStash:
     def __len__(self) -> int:
         return len(self.partition)
 
+    def changes_since(self, seq: int) -> Result[dict[UID, str], str]:
+        """Objects changed after change sequence number `seq`, uid -> op."""
+        return self.partition.changes_since(seq)
+
     def set(
         self,
         credentials: SyftVerifyKey,
@@ -702,6 +846,8 @@ class BaseStash:
             add_permissions=add_permissions,
             add_storage_permission=add_storage_permission,
         )
+        if res.is_ok():
+            self._index_for_search(res.ok())
 
         return res
 
@@ -794,9 +940,16 @@ class BaseStash:
     def delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
-        return self.partition.delete(
+        res = self.partition.delete(
             credentials=credentials, qk=qk, has_permission=has_permission
         )
+        index = self.partition.search_index
+        if res.is_ok() and index is not None:
+            if qk.key == self.partition.settings.store_key.key:
+                index.remove(qk.value)
+            else:
+                index.invalidate()
+        return res
 
     def update(
         self,
@@ -809,6 +962,29 @@ class BaseStash:
         res = self.partition.update(
             credentials=credentials, qk=qk, obj=obj, has_permission=has_permission
         )
+        if res.is_ok():
+            self._index_for_search(res.ok())
+        return res
+
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[BaseStash.object_type],
+        has_permission: bool = False,
+    ) -> Result[list[Result[BaseStash.object_type, str]], str]:
+        """Update several objects in one write to the partition, returns the
+        result of every update."""
+        updates = []
+        for obj in objs:
+            obj.updated_date = BaseDateTime.now()
+            updates.append((self.partition.store_query_key(obj), obj))
+        res = self.partition.update_many(
+            credentials=credentials, updates=updates, has_permission=has_permission
+        )
+        if res.is_ok():
+            for update_res in res.ok():
+                if update_res.is_ok():
+                    self._index_for_search(update_res.ok())
         return res
 
     def delete_by_uid(
@@ -25,7 +25,13 @@ from ..service.action.action_permissions import StoragePermission
 from ..service.context import AuthedServiceContext
 from ..service.response import SyftSuccess
 from ..types.syft_object import SyftObject
+from ..types.syncable_object import SyncableSyftObject
 from ..types.uid import UID
+from .change_log import CHANGE_DELETE
+from .change_log import CHANGE_PERMISSIONS
+from .change_log import CHANGE_SET
+from .change_log import CHANGE_UPDATE
+from .change_log import ChangeLog
 from .document_store import BaseStash
 from .document_store import PartitionKey
 from .document_store import PartitionKeys
@@ -33,6 +39,8 @@ from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StorePartition
 
+_MISSING = object()
+
 
 @serializable(canonical_name="UniqueKeyCheck", version=1)
 class UniqueKeyCheck(Enum):
@@ -86,6 +94,10 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def get_many(self, keys: list[Any]) -> dict[Any, Any]:
+        """Values of the `keys` in the store, keys not in the store are left out."""
+        return {key: self[key] for key in keys if key in self}
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -127,6 +139,18 @@ class KeyValueStorePartition(StorePartition):
                 )
             )
 
+            # uid -> (sequence number, op), for syncing changes only
+            self.change_log: ChangeLog | None = None
+            object_type = getattr(self.settings, "object_type", None)
+            if isinstance(object_type, type) and issubclass(
+                object_type, SyncableSyftObject
+            ):
+                self.change_log = ChangeLog(
+                    self.store_config.backing_store(
+                        "change_log", self.settings, self.store_config
+                    )
+                )
+
             for partition_key in self.unique_cks:
                 pk_key = partition_key.key
                 if pk_key not in self.unique_keys:
@@ -217,20 +241,21 @@ class KeyValueStorePartition(StorePartition):
                 # Add default permissions
                 if uid not in self.permissions:
                     self.permissions[uid] = set()
-                self.add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
-                if add_permissions is not None:
-                    self.add_permissions(add_permissions)
+                self._add_permission(ActionObjectREAD(uid=uid, credentials=credentials))
+                for permission in add_permissions or []:
+                    self._add_permission(permission)
 
                 if uid not in self.storage_permissions:
                     self.storage_permissions[uid] = set()
                 if add_storage_permission:
-                    self.add_storage_permission(
+                    self._add_storage_permission(
                         StoragePermission(
                             uid=uid,
                             server_uid=self.server_uid,
                         )
                     )
 
+                self._record_change(uid, CHANGE_SET)
                 return Ok(obj)
             else:
                 return Err(f"Permission: {write_permission} denied")
@@ -253,19 +278,40 @@ class KeyValueStorePartition(StorePartition):
             return Ok(SyftSuccess(message=f"Ownership of ID: {uid} taken."))
         return Err(f"UID: {uid} already owned.")
 
-    def add_permission(self, permission: ActionObjectPermission) -> None:
+    def _record_change(self, uid: UID, op: str) -> None:
+        if self.change_log is not None:
+            self.change_log.record(uid, op)
+
+    def _record_permission_change(self, uid: UID) -> None:
+        # permissions of objects that are not stored yet are logged with the object
+        if self.change_log is not None and uid in self.data:
+            self.change_log.record(uid, CHANGE_PERMISSIONS)
+
+    def changes_since(self, seq: int) -> Result[dict[UID, str], str]:
+        if self.change_log is None:
+            return Err(f"Partition {self.settings.name} does not keep a change log")
+        return Ok(self.change_log.changes_since(seq))
+
+    def _add_permission(self, permission: ActionObjectPermission) -> None:
         permissions = self.permissions[permission.uid]
         permissions.add(permission.permission_string)
         self.permissions[permission.uid] = permissions
 
+    def add_permission(self, permission: ActionObjectPermission) -> None:
+        self._add_permission(permission)
+        self._record_permission_change(permission.uid)
+
     def remove_permission(self, permission: ActionObjectPermission) -> None:
         permissions = self.permissions[permission.uid]
         permissions.remove(permission.permission_string)
         self.permissions[permission.uid] = permissions
+        self._record_permission_change(permission.uid)
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
         for permission in permissions:
-            self.add_permission(permission)
+            self._add_permission(permission)
+        for uid in {permission.uid for permission in permissions}:
+            self._record_permission_change(uid)
 
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         if not isinstance(permission.permission, ActionPermission):
@@ -317,19 +363,26 @@ class KeyValueStorePartition(StorePartition):
     def get_all_permissions(self) -> Result[dict[UID, set[str]], str]:
         return Ok(dict(self.permissions.items()))
 
-    def add_storage_permission(self, permission: StoragePermission) -> None:
+    def _add_storage_permission(self, permission: StoragePermission) -> None:
         permissions = self.storage_permissions[permission.uid]
         permissions.add(permission.server_uid)
         self.storage_permissions[permission.uid] = permissions
 
+    def add_storage_permission(self, permission: StoragePermission) -> None:
+        self._add_storage_permission(permission)
+        self._record_permission_change(permission.uid)
+
     def add_storage_permissions(self, permissions: list[StoragePermission]) -> None:
         for permission in permissions:
-            self.add_storage_permission(permission)
+            self._add_storage_permission(permission)
+        for uid in {permission.uid for permission in permissions}:
+            self._record_permission_change(uid)
 
     def remove_storage_permission(self, permission: StoragePermission) -> None:
         permissions = self.storage_permissions[permission.uid]
         permissions.remove(permission.server_uid)
         self.storage_permissions[permission.uid] = permissions
+        self._record_permission_change(permission.uid)
 
     def has_storage_permission(self, permission: StoragePermission | UID) -> bool:
         if isinstance(permission, UID):
@@ -389,6 +442,67 @@ class KeyValueStorePartition(StorePartition):
                     ck_col[pk_value].remove(store_key.value)
             self.searchable_keys[pk_key] = ck_col
 
+    def _update_keys(
+        self,
+        store_key: QueryKey,
+        old_unique_query_keys: QueryKeys,
+        old_searchable_query_keys: QueryKeys,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        """Replace the old keys of an object with the new ones.
+
+        Same result as `_remove_keys` followed by `_set_data_and_keys`, but every
+        key column is written at most once, and not at all when it didn't change.
+        Columns hold the keys of all objects in the partition, for the SQLite
+        store every write is a full column serialization and a commit.
+        """
+        uid = store_key.value
+
+        old_uqks = {qk.key: qk for qk in old_unique_query_keys.all}
+        for qk in unique_query_keys.all:
+            ck_col = self.unique_keys[qk.key]
+            touched = (uid, qk.value)
+            before = [ck_col.get(key, _MISSING) for key in touched]
+            if qk.key in old_uqks:
+                ck_col.pop(uid, None)
+            ck_col[qk.value] = uid
+            if before != [ck_col.get(key, _MISSING) for key in touched]:
+                self.unique_keys[qk.key] = ck_col
+
+        self.unique_keys[store_key.key][store_key.value] = store_key.value
+
+        old_sqks = {qk.key: qk for qk in old_searchable_query_keys.all}
+        for qk in searchable_query_keys.all:
+            ck_col = self.searchable_keys[qk.key]
+            changed = False
+
+            old_qk = old_sqks.get(qk.key)
+            if old_qk is not None and old_qk.value != qk.value:
+                old_values = (
+                    [str(item) for item in old_qk.value]
+                    if isinstance(old_qk.value, list)
+                    else [old_qk.value]
+                )
+                for old_value in old_values:
+                    if uid in ck_col.get(old_value, []):
+                        ck_col[old_value].remove(uid)
+                        changed = True
+
+            pk_value = qk.value
+            if qk.type_list:
+                # coerce the list of objects to strings for a single key
+                pk_value = " ".join([str(obj) for obj in pk_value])
+            if pk_value not in ck_col:
+                ck_col[pk_value] = [uid]
+                changed = True
+            elif uid not in ck_col[pk_value]:
+                ck_col[pk_value].append(uid)
+                changed = True
+
+            if changed:
+                self.searchable_keys[qk.key] = ck_col
+
     def _find_index_or_search_keys(
         self,
         credentials: SyftVerifyKey,
@@ -467,13 +581,6 @@ class KeyValueStorePartition(StorePartition):
 
                 store_query_key = self.settings.store_key.with_obj(_original_obj)
 
-                # remove old keys
-                self._remove_keys(
-                    store_key=store_query_key,
-                    unique_query_keys=_original_unique_keys,
-                    searchable_query_keys=_original_searchable_keys,
-                )
-
                 # update the object with new data
                 if overwrite:
                     # Overwrite existing object and their values
@@ -485,16 +592,18 @@ class KeyValueStorePartition(StorePartition):
                             continue
                         setattr(_original_obj, key, value)
 
-                # update data and keys
-                self._set_data_and_keys(
-                    store_query_key=store_query_key,
+                # update keys and data
+                self._update_keys(
+                    store_key=store_query_key,
+                    old_unique_query_keys=_original_unique_keys,
+                    old_searchable_query_keys=_original_searchable_keys,
                     unique_query_keys=self.settings.unique_keys.with_obj(_original_obj),
                     searchable_query_keys=self.settings.searchable_keys.with_obj(
                         _original_obj
                     ),
-                    # has been updated
-                    obj=_original_obj,
                 )
+                self.data[store_query_key.value] = _original_obj
+                self._record_change(store_query_key.value, CHANGE_UPDATE)
 
                 # 🟡 TODO 28: Add locking in this transaction
 
@@ -537,6 +646,7 @@ class KeyValueStorePartition(StorePartition):
                 self.storage_permissions.pop(qk.value)
                 self._delete_unique_keys_for(_obj)
                 self._delete_search_keys_for(_obj)
+                self._record_change(qk.value, CHANGE_DELETE)
                 return Ok(SyftSuccess(message="Deleted"))
             else:
                 return Err(
@@ -557,11 +667,16 @@ class KeyValueStorePartition(StorePartition):
         for _search_ck in self.searchable_cks:
             qk: QueryKey = _search_ck.with_obj(obj)
             search_keys: defaultdict = self.searchable_keys[qk.key]
-            if isinstance(qk.value, list):
-                for qk_value in qk.value:
-                    search_keys.pop(qk_value, None)
-            else:
-                search_keys.pop(qk.value, None)
+            pk_value = qk.value
+            if qk.type_list:
+                # stored as a single key, see _set
+                pk_value = " ".join([str(item) for item in pk_value])
+            # other objects may be stored under the same value
+            uids = search_keys.get(pk_value, [])
+            if obj.id in uids:
+                uids.remove(obj.id)
+            if not uids:
+                search_keys.pop(pk_value, None)
             self.searchable_keys[qk.key] = search_keys
         return Ok(SyftSuccess(message="Deleted"))
 
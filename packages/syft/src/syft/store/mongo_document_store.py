@@ -1012,6 +1012,16 @@ class MongoBackingStore(KeyValueBackingStore):
     def __contains__(self, key: Any) -> bool:
         return self._exist(key)
 
+    def get_many(self, keys: list[Any]) -> dict[Any, Any]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+        return {
+            row["_id"]: _deserialize(row[f"{row['_id']}"], from_bytes=True)
+            for row in collection.find({"_id": {"$in": keys}})
+        }
+
     def __iter__(self) -> Any:
         return iter(self.keys())
 
@@ -0,0 +1,214 @@
+# stdlib
+from abc import ABC
+from abc import abstractmethod
+from bisect import bisect_left
+from bisect import insort
+from collections import defaultdict
+from collections.abc import Iterable
+import math
+import re
+import threading
+import time
+
+# relative
+from ..types.uid import UID
+from ..util.util import get_env
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# seconds after which an index is rebuilt from its partition, to pick up writes
+# other processes sharing the store made
+DEFAULT_SEARCH_INDEX_REBUILD_INTERVAL = float(
+    get_env("SEARCH_INDEX_REBUILD_INTERVAL") or 300
+)
+
+# tokens matched only by prefix count less than whole tokens
+PREFIX_MATCH_WEIGHT = 0.5
+
+# field name -> text of an object to index
+SearchFields = dict[str, str]
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex(ABC):
+    """Text index over the objects of a store partition.
+
+    Stashes keep the index of their partition up to date when they write, and
+    rebuild it from the partition when it is stale, e.g. after a restart.
+    Writes done by other server processes sharing the store are only seen
+    after the index is rebuilt, so searches may miss them for up to
+    `SEARCH_INDEX_REBUILD_INTERVAL` seconds.
+    """
+
+    @abstractmethod
+    def add(self, uid: UID, fields: SearchFields) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, uid: UID) -> None:
+        pass
+
+    @abstractmethod
+    def search(self, query: str) -> list[UID]:
+        """UIDs of the objects matching `query`, best matches first."""
+        pass
+
+    @abstractmethod
+    def rebuild(self, documents: Iterable[tuple[UID, SearchFields]]) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Rebuild the index before the next search."""
+        pass
+
+    @property
+    @abstractmethod
+    def is_stale(self) -> bool:
+        pass
+
+
+class InMemorySearchIndex(SearchIndex):
+    """Inverted index from tokens to the objects containing them.
+
+    Every token of the query has to match a token of the object, the last one
+    may match as a prefix, so results can be shown while typing. Matches are
+    ranked by tf-idf, weighted by the field the tokens are in. When no token
+    matches, objects whose name contains the query are returned instead, like
+    the substring search this replaces.
+    """
+
+    def __init__(
+        self,
+        field_weights: dict[str, float] | None = None,
+        substring_fields: tuple[str, ...] = ("name",),
+        rebuild_interval: float = DEFAULT_SEARCH_INDEX_REBUILD_INTERVAL,
+    ) -> None:
+        self.field_weights = field_weights if field_weights is not None else {}
+        self.substring_fields = substring_fields
+        self.rebuild_interval = rebuild_interval
+
+        self._lock = threading.RLock()
+        # token -> uid -> weighted number of occurrences
+        self._postings: dict[str, dict[UID, float]] = {}
+        # sorted tokens, for prefix lookups
+        self._tokens: list[str] = []
+        # uid -> (insertion position, tokens, lowercased substring fields)
+        self._documents: dict[UID, tuple[int, set[str], list[str]]] = {}
+        self._next_position = 0
+        self._built_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._built_at is None
+            or time.monotonic() - self._built_at > self.rebuild_interval
+        )
+
+    def invalidate(self) -> None:
+        self._built_at = None
+
+    def add(self, uid: UID, fields: SearchFields) -> None:
+        frequencies: defaultdict[str, float] = defaultdict(float)
+        for field, text in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        with self._lock:
+            self._remove(uid)
+            for token, frequency in frequencies.items():
+                if token not in self._postings:
+                    self._postings[token] = {}
+                    insort(self._tokens, token)
+                self._postings[token][uid] = frequency
+            self._documents[uid] = (
+                self._next_position,
+                set(frequencies),
+                [fields.get(field, "").lower() for field in self.substring_fields],
+            )
+            self._next_position += 1
+
+    def remove(self, uid: UID) -> None:
+        with self._lock:
+            self._remove(uid)
+
+    def _remove(self, uid: UID) -> None:
+        document = self._documents.pop(uid, None)
+        if document is None:
+            return
+        for token in document[1]:
+            postings = self._postings[token]
+            postings.pop(uid, None)
+            if not postings:
+                del self._postings[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+
+    def rebuild(self, documents: Iterable[tuple[UID, SearchFields]]) -> None:
+        with self._lock:
+            self._postings = {}
+            self._tokens = []
+            self._documents = {}
+            self._next_position = 0
+            for uid, fields in documents:
+                self.add(uid, fields)
+            self._built_at = time.monotonic()
+
+    def _tokens_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect_left(self._tokens, prefix)
+        end = start
+        while end < len(self._tokens) and self._tokens[end].startswith(prefix):
+            end += 1
+        return self._tokens[start:end]
+
+    def _idf(self, token: str) -> float:
+        return math.log(1 + len(self._documents) / len(self._postings[token]))
+
+    def search(self, query: str) -> list[UID]:
+        terms = tokenize(query)
+        with self._lock:
+            if not terms:
+                return list(self._documents)
+
+            scores: dict[UID, float] | None = None
+            for i, term in enumerate(terms):
+                is_last = i == len(terms) - 1
+                tokens = self._tokens_with_prefix(term) if is_last else [term]
+                term_scores: dict[UID, float] = {}
+                for token in tokens:
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        continue
+                    weight = self._idf(token)
+                    if token != term:
+                        weight *= PREFIX_MATCH_WEIGHT
+                    for uid, frequency in postings.items():
+                        term_scores[uid] = term_scores.get(uid, 0.0) + (
+                            weight * frequency
+                        )
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        uid: score + term_scores[uid]
+                        for uid, score in scores.items()
+                        if uid in term_scores
+                    }
+
+            if not scores:
+                # scans every object, but only for queries no token matches
+                needle = query.lower()
+                scores = {
+                    uid: 0.0
+                    for uid, (_, _, texts) in self._documents.items()
+                    if any(needle in text for text in texts)
+                }
+
+            documents = self._documents
+            return sorted(scores, key=lambda uid: (-scores[uid], documents[uid][0]))
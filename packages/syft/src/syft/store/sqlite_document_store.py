@@ -44,6 +44,8 @@ logger = logging.getLogger(__name__)
 SQLITE_CONNECTION_POOL_DB: dict[str, sqlite3.Connection] = {}
 SQLITE_CONNECTION_POOL_CUR: dict[str, sqlite3.Cursor] = {}
 REF_COUNTS: dict[str, int] = defaultdict(int)
+# keys per query of get_many, sqlite before 3.32 allows at most 999 parameters
+SQLITE_GET_MANY_BATCH_SIZE = 500
 
 
 def cache_key(db_name: str) -> str:
@@ -243,6 +245,21 @@ class SQLiteBackingStore(KeyValueBackingStore):
         data = row[2]
         return _deserialize(data, from_bytes=True)
 
+    def _get_many(self, keys: list[UID]) -> dict[UID, Any]:
+        result: dict[UID, Any] = {}
+        for i in range(0, len(keys), SQLITE_GET_MANY_BATCH_SIZE):
+            batch = [str(key) for key in keys[i : i + SQLITE_GET_MANY_BATCH_SIZE]]
+            params = ", ".join("?" * len(batch))
+            select_sql = f"select uid, value from {self.table_name} where uid in ({params}) order by sqltime"  # nosec
+            res = self._execute(select_sql, batch)
+            if res.is_err():
+                raise KeyError(f"Query {select_sql} failed")
+            for uid, data in res.ok().fetchall():
+                # the first row of a key, like _get
+                if (key := UID(uid)) not in result:
+                    result[key] = _deserialize(data, from_bytes=True)
+        return result
+
     def _exists(self, key: UID) -> bool:
         select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
 
@@ -323,6 +340,9 @@ class SQLiteBackingStore(KeyValueBackingStore):
                 return self._ddtype()
             raise e
 
+    def get_many(self, keys: list[Any]) -> dict[Any, Any]:
+        return self._get_many(keys)
+
     def __repr__(self) -> str:
         return repr(self._get_all())
 
@@ -42,12 +42,14 @@ from .uid import UID
 
 if TYPE_CHECKING:
     # relative
+    from ..store.blob_storage import BlobRangeReader
     from ..store.blob_storage import BlobRetrievalByURL
     from ..store.blob_storage import BlobStorageConnection
 
 
 READ_EXPIRATION_TIME = 1800  # seconds
 DEFAULT_CHUNK_SIZE = 10000 * 1024
+PARQUET_MAGIC = b"PAR1"
 
 
 @serializable()
@@ -81,6 +83,107 @@ class BlobFile(SyftObject):
         else:
             return None
 
+    def read_range(self, offset: int, length: int | None = None) -> bytes | SyftError:
+        """Read `length` bytes starting at `offset`, without fetching the rest of the file."""
+        read_method = from_api_or_context(
+            "blob_storage.read", self.syft_server_location, self.syft_client_verify_key
+        )
+        if read_method is None:
+            return SyftError(message="Could not read BlobFile, no read method")
+        blob_retrieval_object = read_method(
+            self.syft_blob_storage_entry_id, offset=offset, length=length
+        )
+        if isinstance(blob_retrieval_object, SyftError):
+            return blob_retrieval_object
+        if self.file_size is None:
+            self.file_size = blob_retrieval_object.file_size
+        return blob_retrieval_object._read_data(
+            _deserialize=False, offset=offset, length=length
+        )
+
+    def _range_reader(self, offset: int, length: int) -> bytes:
+        data = self.read_range(offset, length)
+        if isinstance(data, SyftError):
+            raise SyftException(data.message)
+        return data
+
+    def open(self) -> "BlobRangeReader":
+        """Open the file as a read-only, seekable file object that only downloads
+        the byte ranges that are read."""
+        if self.file_size is None:
+            # an empty range read only fetches the blob storage entry metadata
+            self._range_reader(0, 0)
+        if self.file_size is None:
+            raise SyftException(f"Could not determine the size of {self.file_name}")
+        # relative
+        from ..store.blob_storage import BlobRangeReader
+
+        return BlobRangeReader(self._range_reader, self.file_size)
+
+    def _is_parquet(self, f: "BlobRangeReader") -> bool:
+        is_parquet = f.read(len(PARQUET_MAGIC)) == PARQUET_MAGIC
+        f.seek(0)
+        return is_parquet
+
+    def _iter_table_chunks(
+        self, f: "BlobRangeReader", columns: list[str] | None = None
+    ) -> Iterator[Any]:
+        # third party
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._is_parquet(f):
+            parquet_file = pq.ParquetFile(f)
+            for i in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(i, columns=columns)
+        else:
+            reader = pa.ipc.open_file(f)
+            for i in range(reader.num_record_batches):
+                table = pa.Table.from_batches([reader.get_batch(i)])
+                yield table if columns is None else table.select(columns)
+
+    def read_table(
+        self, chunks: list[int] | None = None, columns: list[str] | None = None
+    ) -> Any:
+        """Read a parquet or Arrow IPC file as a pyarrow Table. Only the footer
+        and the requested row groups (parquet) or record batches (Arrow IPC)
+        are downloaded, all of them when `chunks` is None."""
+        # third party
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with self.open() as f:
+            if self._is_parquet(f):
+                parquet_file = pq.ParquetFile(f)
+                if chunks is None:
+                    chunks = list(range(parquet_file.num_row_groups))
+                return parquet_file.read_row_groups(chunks, columns=columns)
+
+            reader = pa.ipc.open_file(f)
+            if chunks is None:
+                chunks = list(range(reader.num_record_batches))
+            table = pa.Table.from_batches(
+                [reader.get_batch(i) for i in chunks], schema=reader.schema
+            )
+            return table if columns is None else table.select(columns)
+
+    def head(self, n: int = 5, columns: list[str] | None = None) -> Any:
+        """First `n` rows of a parquet or Arrow IPC file as a DataFrame,
+        only downloading the chunks that contain them."""
+        # third party
+        import pyarrow as pa
+
+        tables, n_rows = [], 0
+        with self.open() as f:
+            for table in self._iter_table_chunks(f, columns=columns):
+                tables.append(table)
+                n_rows += table.num_rows
+                if n_rows >= n:
+                    break
+        if not tables:
+            return None
+        return pa.concat_tables(tables).slice(0, n).to_pandas()
+
     @classmethod
     def upload_from_path(cls, path: str | Path, client: SyftClient) -> Any:
         # syft absolute
@@ -10,7 +10,6 @@ from collections.abc import Set
 from datetime import datetime
 from functools import cache
 from functools import total_ordering
-from hashlib import sha256
 import inspect
 from inspect import Signature
 import logging
@@ -40,7 +39,7 @@ from typing_extensions import Self
 
 # relative
 from ..serde.serializable import serializable
-from ..serde.serialize import _serialize as serialize
+from ..serde.serialize import _serialize_sha256
 from ..server.credentials import SyftVerifyKey
 from ..service.response import SyftError
 from ..util.autoreload import autoreload_enabled
@@ -115,15 +114,14 @@ def _get_optional_inner_type(x: Any) -> Any:
 
 
 class SyftHashableObject:
+    # DYNAMIC_SYFT_ATTRIBUTES are never hashed, see rs_object2proto
     __hash_exclude_attrs__: list = []
 
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
-        _bytes = serialize(self, to_bytes=True, for_hashing=True)
-        return sha256(_bytes).digest()
+        return _serialize_sha256(self, for_hashing=True).digest()
 
     def hash(self) -> str:
         return self.__sha256__().hex()
@@ -5,8 +5,11 @@ from collections import deque
 from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
@@ -161,10 +164,83 @@ def get_mb_size(data: Any, handlers: dict | None = None) -> float:
     return sizeof(data) / (1024.0 * 1024.0)
 
 
-def get_mb_serialized_size(data: Any) -> Ok[float] | Err[str]:
+def get_mb_size_of_serialized(serialized_data: bytes) -> float:
+    return sys.getsizeof(serialized_data) / (1024 * 1024)
+
+
+class InFlightBudget:
+    """Blocks callers until the requested amount of MB fits into the budget.
+    An item larger than the whole budget is let through when nothing else
+    is in flight."""
+
+    def __init__(self, max_mb: float) -> None:
+        self.max_mb = max_mb
+        self.in_flight_mb = 0.0
+        # counted separately, as the float sum of MB may not return to exactly 0
+        self.in_flight_items = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, mb: float) -> None:
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self.in_flight_items == 0
+                or self.in_flight_mb + mb <= self.max_mb
+            )
+            self.in_flight_mb += mb
+            self.in_flight_items += 1
+
+    def release(self, mb: float) -> None:
+        with self._cond:
+            self.in_flight_items -= 1
+            self.in_flight_mb = self.in_flight_mb - mb if self.in_flight_items else 0.0
+            self._cond.notify_all()
+
+
+def run_with_deadlines(
+    executor: ThreadPoolExecutor,
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    timeout: float,
+    max_wait: float,
+) -> list[Future]:
+    """Run `func` for every item on `executor`, and wait until every call either
+    finished or ran for `timeout` seconds, counted from when the call started.
+
+    Calls still queued after `max_wait` seconds are cancelled. Callers tell the
+    outcomes apart by the futures: cancelled ones never started, the ones not
+    done timed out and are left to finish on their own.
+    """
+    started: dict[int, float] = {}
+
+    def run(i: int, item: Any) -> Any:
+        started[i] = time.monotonic()
+        return func(item)
+
+    pending = [executor.submit(run, i, item) for i, item in enumerate(items)]
+    wait_until = time.monotonic() + max_wait
+    while True:
+        now = time.monotonic()
+        not_done = [i for i, future in enumerate(pending) if not future.done()]
+        waiting = [i for i in not_done if now - started.get(i, now) < timeout]
+        if not waiting or now >= wait_until:
+            break
+        deadlines = [started[i] + timeout for i in waiting if i in started]
+        wait(
+            [pending[i] for i in not_done],
+            timeout=min([*deadlines, wait_until]) - now,
+            return_when=FIRST_COMPLETED,
+        )
+    for future in pending:
+        future.cancel()
+    return pending
+
+
+def get_serialized_with_mb_size(data: Any) -> Ok[tuple[bytes, float]] | Err[str]:
+    """Serialize data once and return the bytes together with their size in MB,
+    so callers can both measure and upload the same buffer."""
     try:
         serialized_data = serialize(data, to_bytes=True)
-        return Ok(sys.getsizeof(serialized_data) / (1024 * 1024))
+        return Ok((serialized_data, get_mb_size_of_serialized(serialized_data)))
     except Exception as e:
         data_type = type(data)
         return Err(
@@ -173,6 +249,14 @@ def get_mb_serialized_size(data: Any) -> Ok[float] | Err[str]:
         )
 
 
+def get_mb_serialized_size(data: Any) -> Ok[float] | Err[str]:
+    result = get_serialized_with_mb_size(data)
+    if result.is_err():
+        return Err(result.err())
+    _, size = result.ok()
+    return Ok(size)
+
+
 def extract_name(klass: type) -> str:
     name_regex = r".+class.+?([\w\._]+).+"
     regex2 = r"([\w\.]+)"
@@ -1,9 +1,13 @@
 # stdlib
 import io
 import random
+from unittest import mock
 
 # third party
 import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 # syft absolute
@@ -12,6 +16,8 @@ from syft import ActionObject
 from syft import Dataset
 from syft import Worker
 from syft.client.datasite_client import DatasiteClient
+from syft.service.blob_storage import util as blob_storage_util
+from syft.service.blob_storage.util import can_upload_serialized_to_blob_storage
 from syft.service.blob_storage.util import can_upload_to_blob_storage
 from syft.service.blob_storage.util import min_size_for_blob_storage_upload
 from syft.service.context import AuthedServiceContext
@@ -19,6 +25,7 @@ from syft.service.response import SyftSuccess
 from syft.service.user.user import UserCreate
 from syft.store.blob_storage import BlobDeposit
 from syft.store.blob_storage import SyftObjectRetrieval
+from syft.types.blob_storage import BlobFile
 from syft.types.blob_storage import CreateBlobStorageEntry
 
 raw_data = {"test": "test"}
@@ -99,6 +106,51 @@ def test_blob_storage_read():
     worker.cleanup()
 
 
+def test_blob_storage_read_range(authed_context, blob_storage):
+    blob_data = CreateBlobStorageEntry.from_obj(data)
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    blob_deposit.write(io.BytesIO(data))
+
+    retrieval = blob_storage.read(
+        authed_context, blob_deposit.blob_storage_entry_id, offset=2, length=5
+    )
+
+    assert isinstance(retrieval, SyftObjectRetrieval)
+    assert retrieval._read_data(_deserialize=False) == data[2:7]
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_blob_file_partial_table_read(worker, tmp_path, file_format):
+    df = pd.DataFrame({"a": np.arange(100_000), "b": np.random.rand(100_000)})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    path = tmp_path / "data.bin"
+    if file_format == "parquet":
+        pq.write_table(table, path, row_group_size=10_000)
+    else:
+        with pa.ipc.new_file(path, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=10_000):
+                writer.write_batch(batch)
+
+    root_client: DatasiteClient = worker.root_client
+    blob_file = BlobFile(path=path, file_name=path.name)
+    assert blob_file.upload_to_blobstorage(root_client) is None
+
+    bytes_read = []
+    read_range = BlobFile.read_range
+
+    def spy(self, offset, length=None):
+        bytes_read.append(length)
+        return read_range(self, offset, length)
+
+    with mock.patch.object(BlobFile, "read_range", spy):
+        head = blob_file.head(3)
+    pd.testing.assert_frame_equal(head, df.head(3))
+    assert sum(bytes_read) < path.stat().st_size
+
+    second_chunk = blob_file.read_table(chunks=[1], columns=["b"]).to_pandas()
+    assert list(second_chunk["b"]) == list(df["b"][10_000:20_000])
+
+
 def test_blob_storage_delete(authed_context, blob_storage):
     blob_data = CreateBlobStorageEntry.from_obj(data)
     blob_deposit = blob_storage.allocate(authed_context, blob_data)
@@ -137,6 +189,24 @@ def test_action_obj_send_save_to_blob_storage(worker):
     assert all(syft_retrieved_data.read() == data_big)
 
 
+def test_action_obj_save_to_blob_storage_serializes_once(worker):
+    root_client: DatasiteClient = worker.root_client
+    data_big = np.random.randint(0, 100, size=20 * 1024 * 1024)
+    serialized = sy.serialize(data_big, to_bytes=True)
+    assert can_upload_serialized_to_blob_storage(serialized, root_client.api.metadata)
+
+    action_obj = ActionObject.from_obj(data_big)
+    with mock.patch.object(
+        blob_storage_util,
+        "get_serialized_with_mb_size",
+        wraps=blob_storage_util.get_serialized_with_mb_size,
+    ) as serialize_spy:
+        action_obj.send(root_client)
+
+    assert serialize_spy.call_count == 1
+    assert isinstance(action_obj.syft_blob_storage_entry_id, sy.UID)
+
+
 def test_upload_dataset_save_to_blob_storage(
     worker: Worker, big_dataset: Dataset, small_dataset: Dataset
 ) -> None:
@@ -5,7 +5,9 @@ import pytest
 from typeguard import TypeCheckError
 
 # syft absolute
+from syft.server.credentials import SyftSigningKey
 from syft.service.dataset.dataset import Dataset
+from syft.service.dataset.dataset import DatasetUpdate
 from syft.service.dataset.dataset_stash import ActionIDsPartitionKey
 from syft.service.dataset.dataset_stash import NamePartitionKey
 from syft.store.document_store import QueryKey
@@ -109,3 +111,39 @@ def test_dataset_search_action_ids(root_verify_key, mock_dataset_stash, mock_dat
     random_obj = object()
     with pytest.raises(AttributeError):
         result = mock_dataset_stash.search_action_ids(root_verify_key, uid=random_obj)
+
+
+def test_dataset_search(root_verify_key, mock_dataset_stash, mock_dataset) -> None:
+    # datasets stored before the index was built are found
+    result = mock_dataset_stash.search(root_verify_key, "test")
+    assert result.is_ok()
+    assert result.ok() == [mock_dataset.id]
+
+    other = Dataset(
+        id=UID(),
+        name="census",
+        summary="test population data",
+        uploader=mock_dataset.uploader,
+    )
+    assert mock_dataset_stash.set(root_verify_key, other).is_ok()
+    assert mock_dataset_stash.search(root_verify_key, "mock_asset").ok() == [
+        mock_dataset.id
+    ]
+    assert mock_dataset_stash.search(root_verify_key, "popul").ok() == [other.id]
+    # matches in the name rank before matches in the summary
+    assert mock_dataset_stash.search(root_verify_key, "test").ok() == [
+        mock_dataset.id,
+        other.id,
+    ]
+
+    # without read permission the dataset is not found
+    guest_key = SyftSigningKey.generate().verify_key
+    assert mock_dataset_stash.search(guest_key, "test").ok() == []
+
+    # soft deleted datasets are not found
+    update = DatasetUpdate(id=other.id, to_be_deleted=True)
+    assert mock_dataset_stash.update(root_verify_key, update).is_ok()
+    assert mock_dataset_stash.search(root_verify_key, "census").ok() == []
+
+    assert mock_dataset_stash.delete_by_uid(root_verify_key, mock_dataset.id).is_ok()
+    assert mock_dataset_stash.search(root_verify_key, "test").ok() == []
@@ -1,8 +1,11 @@
 # stdlib
+import hashlib
 from uuid import uuid4
 
 # syft absolute
 from syft.serde.serializable import serializable
+from syft.serde.serialize import _serialize
+from syft.service.sync.diff_state import has_same_content
 from syft.types.syft_object import SYFT_OBJECT_VERSION_1
 from syft.types.syft_object import SyftBaseObject
 from syft.types.syft_object import SyftHashableObject
@@ -56,3 +59,47 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hash_matches_serialized_bytes():
+    obj = MockWrapper(id="id", data=MockObject(key="key", value="value" * 10**5))
+    hash_bytes = _serialize(obj, to_bytes=True, for_hashing=True)
+
+    assert obj.__sha256__() == hashlib.sha256(hash_bytes).digest()
+
+
+def test_hash_follows_changes():
+    obj = MockWrapper(id="id", data=MockObject(key="key", value="value"))
+    first_hash = obj.hash()
+    assert obj.hash() == first_hash
+
+    obj.id = "other_id"
+    assert obj.hash() != first_hash
+    assert obj.hash() == MockWrapper(id="other_id", data=obj.data).hash()
+
+    # changes inside attributes are seen too
+    other_id_hash = obj.hash()
+    obj.data.value = "other_value"
+    assert obj.hash() != other_id_hash
+
+    # dynamic attributes are not hashed
+    other_value_hash = obj.hash()
+    obj.syft_server_location = None
+    assert obj.hash() == other_value_hash
+
+
+def test_hash_exclude_attrs_do_not_grow():
+    n_exclude_attrs = len(MockWrapper.__hash_exclude_attrs__)
+    for i in range(3):
+        MockWrapper(id=str(i), data=None).hash()
+
+    assert len(MockWrapper.__hash_exclude_attrs__) == n_exclude_attrs
+
+
+def test_has_same_content_sees_nested_changes():
+    low = MockWrapper(id="id", data=MockObject(key="key", value="value"))
+    high = MockWrapper(id="id", data=MockObject(key="key", value="value"))
+    assert has_same_content(low, high)
+
+    high.data.value = "other_value"
+    assert not has_same_content(low, high)
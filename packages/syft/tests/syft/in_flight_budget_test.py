@@ -0,0 +1,40 @@
+# stdlib
+import threading
+
+# syft absolute
+from syft.util.util import InFlightBudget
+
+
+def test_in_flight_budget_lets_oversized_item_through() -> None:
+    budget = InFlightBudget(max_mb=1)
+    # 0.3 + 0.6 - 0.3 - 0.6 is not exactly 0 as a float
+    for mb in (0.3, 0.6):
+        budget.acquire(mb)
+    for mb in (0.3, 0.6):
+        budget.release(mb)
+
+    acquired = threading.Event()
+
+    def acquire_oversized() -> None:
+        budget.acquire(5)
+        acquired.set()
+
+    threading.Thread(target=acquire_oversized, daemon=True).start()
+    assert acquired.wait(timeout=5)
+    budget.release(5)
+    assert budget.in_flight_mb == 0
+
+
+def test_in_flight_budget_blocks_when_full() -> None:
+    budget = InFlightBudget(max_mb=1)
+    budget.acquire(0.8)
+    acquired = threading.Event()
+
+    def acquire() -> None:
+        budget.acquire(0.5)
+        acquired.set()
+
+    threading.Thread(target=acquire, daemon=True).start()
+    assert not acquired.wait(timeout=0.2)
+    budget.release(0.8)
+    assert acquired.wait(timeout=5)
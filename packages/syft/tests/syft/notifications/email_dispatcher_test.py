@@ -0,0 +1,153 @@
+# stdlib
+from collections.abc import Iterator
+import socketserver
+import threading
+import time
+
+# third party
+import pytest
+from result import Ok
+
+# syft absolute
+from syft.server.worker import Worker
+from syft.service.context import AuthedServiceContext
+from syft.service.notifier.email_dispatcher import EmailDispatcher
+from syft.service.notifier.email_dispatcher import QueuedEmail
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    """SMTP server keeping the emails it receives, failing `fail_next` of them."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("localhost", 0), StubSMTPHandler)
+        self.connections = 0
+        self.messages: list[bytes] = []
+        self.fail_next = 0
+
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    server: StubSMTPServer
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        self.server.connections += 1
+        self.reply("220 localhost")
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN")
+            elif command.startswith("AUTH"):
+                self.reply("235 Authenticated")
+            elif command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = b""
+                while (chunk := self.rfile.readline()) != b".\r\n":
+                    data += chunk
+                if self.server.fail_next:
+                    self.server.fail_next -= 1
+                    self.reply("451 Try again later")
+                else:
+                    self.server.messages.append(data)
+                    self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[StubSMTPServer]:
+    server = StubSMTPServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def context(worker: Worker, smtp_server: StubSMTPServer) -> AuthedServiceContext:
+    stash = worker.get_service("notifierservice").stash
+    settings = stash.get(worker.verify_key).ok()
+    settings.active = True
+    settings.email_server = "localhost"
+    settings.email_port = smtp_server.server_address[1]
+    settings.email_username = "user"
+    settings.email_password = "password"
+    settings.email_sender = "info@openmined.org"
+    assert stash.update(worker.verify_key, settings).is_ok()
+    return AuthedServiceContext(server=worker, credentials=worker.verify_key)
+
+
+def queued_email(i: int) -> QueuedEmail:
+    return QueuedEmail(
+        sender="info@openmined.org",
+        receiver=[f"user{i}@openmined.org"],
+        subject=f"Email {i}",
+        body="<p>Hello</p>",
+    )
+
+
+def test_emails_are_sent_in_background(
+    context: AuthedServiceContext, smtp_server: StubSMTPServer
+) -> None:
+    dispatcher = context.server.email_dispatcher
+    stash = context.server.get_service("notifierservice").email_queue_stash
+    for i in range(3):
+        assert dispatcher.enqueue(context, queued_email(i)).is_ok()
+
+    for _ in range(100):
+        if len(stash) == 0:
+            break
+        time.sleep(0.05)
+    assert len(stash) == 0
+    assert len(smtp_server.messages) == 3
+    # all emails were sent over one connection
+    assert smtp_server.connections == 1
+
+
+def test_failed_emails_are_retried(
+    context: AuthedServiceContext, smtp_server: StubSMTPServer
+) -> None:
+    dispatcher = EmailDispatcher(send_rate=0)
+    stash = context.server.get_service("notifierservice").email_queue_stash
+    for i in range(2):
+        assert stash.set(context.credentials, queued_email(i)).is_ok()
+
+    smtp_server.fail_next = 1
+    assert dispatcher.dispatch(context) == 1
+    (failed,) = stash.get_all(context.credentials).ok()
+    assert failed.attempts == 1
+    assert "Try again later" in failed.last_error
+    # not retried before its backoff passed
+    assert failed.send_after > time.time()
+    assert dispatcher.dispatch(context) == 0
+
+    failed.send_after = time.time()
+    assert stash.update(context.credentials, failed).is_ok()
+    assert dispatcher.dispatch(context) == 1
+    assert len(stash) == 0
+    assert len(smtp_server.messages) == 2
+
+
+def test_emails_reserved_by_another_dispatcher_are_skipped(
+    context: AuthedServiceContext, smtp_server: StubSMTPServer, monkeypatch
+) -> None:
+    stash = context.server.get_service("notifierservice").email_queue_stash
+    assert stash.set(context.credentials, queued_email(0)).is_ok()
+    (email,) = stash.get_due(context.credentials, 10).ok()
+    stale = email.model_copy()
+
+    assert stash.reserve(context.credentials, email, time.time() + 60).is_ok()
+    # a dispatcher that read the email before it was reserved doesn't send it
+    assert stash.reserve(context.credentials, stale, time.time() + 60).is_err()
+    monkeypatch.setattr(stash, "get_due", lambda *args, **kwargs: Ok([stale]))
+    assert EmailDispatcher(send_rate=0).dispatch(context) == 0
+    assert smtp_server.messages == []
+    assert len(stash) == 1
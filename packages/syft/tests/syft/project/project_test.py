@@ -5,6 +5,8 @@ import pytest
 # syft absolute
 import syft as sy
 from syft.service.project.project import Project
+from syft.service.project.project import ProjectMessage
+from syft.service.project.project import ProjectMultipleChoicePoll
 
 
 def test_project_creation(worker):
@@ -108,3 +110,41 @@ def test_project_serde(worker):
     deser_data = sy.deserialize(ser_data, from_bytes=True)
     assert isinstance(deser_data, type(project))
     assert deser_data == project
+
+
+def test_project_events(worker):
+    root_client = worker.root_client
+
+    root_client.register(
+        name="sheldon",
+        email="sheldon@caltech.edu",
+        password="bazinga",
+        password_verify="bazinga",
+    )
+
+    ds_client = sy.login(server=worker, email="sheldon@caltech.edu", password="bazinga")
+
+    new_project = sy.Project(
+        name="My Cool Project", description="My Cool Description", members=[ds_client]
+    )
+    project = new_project.send()
+
+    assert project.send_message("hello")
+    message = project.get_events(types=ProjectMessage)[0]
+    assert project.reply_message("hi", message)
+    assert project.create_poll(question="yes?", choices=["yes", "no"])
+
+    assert project.validate_events()
+    assert project.event_index.n_validated == 3
+
+    assert project.get_events(ids=message.id) == [message]
+    assert [e.message for e in project.get_children(message)] == ["hi"]
+    assert len(project.get_events()) == 2
+    assert len(project.get_messages()) == 2
+    assert project.get_events(types=ProjectMultipleChoicePoll)[0].question == "yes?"
+
+    # only the events added since the last validation are checked
+    assert project.send_message("bye")
+    project.events[-1].signature = b"0" * 64
+    assert not project.validate_events()
+    assert project.event_index.n_validated == 3
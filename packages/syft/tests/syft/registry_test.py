@@ -0,0 +1,147 @@
+# stdlib
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+import time
+
+# third party
+import pytest
+
+# syft absolute
+from syft.abstract_server import ServerType
+from syft.client.registry import NetworksOfDatasitesRegistry
+from syft.client.registry_cache import RegistryCache
+from syft.server.credentials import SyftSigningKey
+from syft.service.metadata.server_metadata import ServerMetadataJSON
+from syft.service.network.routes import HTTPServerRoute
+from syft.service.network.server_peer import ServerPeer
+from syft.service.network.server_peer import ServerPeerConnectionStatus
+from syft.types.uid import UID
+
+
+def stub_server(name: str, delay: float = 0) -> ThreadingHTTPServer:
+    """Local server answering like a gateway and a datasite after `delay` seconds."""
+    metadata = ServerMetadataJSON(
+        metadata_version=1,
+        name=name,
+        id=UID().to_string(),
+        verify_key=str(SyftSigningKey.generate().verify_key),
+        syft_version="0.9.0",
+        server_side_type="high",
+        show_warnings=False,
+        min_size_blob_storage_mb=16,
+    ).model_dump_json()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(delay)
+            if self.path == "/api/v2/metadata":
+                body = metadata.encode()
+            else:
+                body = b"This is a Syft Gateway server."
+            try:
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def stub_servers() -> Iterator[tuple[ThreadingHTTPServer, ThreadingHTTPServer]]:
+    fast, slow = stub_server("fast"), stub_server("slow", delay=3)
+    yield fast, slow
+    for server in (fast, slow):
+        server.shutdown()
+        server.server_close()
+
+
+def network(server: ThreadingHTTPServer) -> dict:
+    return {
+        "name": f"network-{server.server_port}",
+        "host_or_ip": "localhost",
+        "port": server.server_port,
+        "protocol": "http",
+        "version": "0.9.0",
+    }
+
+
+def datasite_peer(server: ThreadingHTTPServer) -> ServerPeer:
+    return ServerPeer(
+        id=UID(),
+        name=f"datasite-{server.server_port}",
+        verify_key=SyftSigningKey.generate().verify_key,
+        server_routes=[
+            HTTPServerRoute(host_or_ip="localhost", port=server.server_port)
+        ],
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+        ping_status=ServerPeerConnectionStatus.ACTIVE,
+    )
+
+
+def test_registry_cache(tmp_path: Path) -> None:
+    cache = RegistryCache(path=tmp_path)
+    calls = []
+
+    def fetch() -> dict:
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert cache.get_or_fetch("key", fetch) == {"value": 1}
+    assert cache.get_or_fetch("key", fetch) == {"value": 1}
+    assert len(calls) == 1
+
+    # stale entries are returned right away and refreshed in the background
+    cache.ttl = 0
+    assert cache.get_or_fetch("key", fetch) == {"value": 1}
+    for _ in range(100):
+        entry = cache.get("key")
+        if entry is not None and entry[0] == {"value": 2}:
+            break
+        time.sleep(0.05)
+    assert cache.get("key")[0] == {"value": 2}
+
+    # a fresh cache reads the entries of the previous one
+    assert RegistryCache(path=tmp_path).get("key")[0] == {"value": 2}
+
+
+def test_online_datasites(monkeypatch, tmp_path: Path, stub_servers) -> None:
+    fast, slow = stub_servers
+    networks = [network(fast), network(slow)]
+    monkeypatch.setenv(
+        "NETWORK_REGISTRY_JSON", json.dumps({"2.0.0": {"gateways": networks}})
+    )
+
+    # the datasites of the networks were retrieved before
+    cache = RegistryCache(path=tmp_path)
+    datasites = [datasite_peer(fast), datasite_peer(slow)]
+    cache.set(f"datasites:http://localhost:{fast.server_port}/", datasites)
+    cache.set(f"datasites:http://localhost:{slow.server_port}/", [])
+
+    start = time.monotonic()
+    registry = NetworksOfDatasitesRegistry(timeout=0.5, cache=cache)
+    assert len(registry.all_datasites) == 2
+
+    assert registry.online_networks == [networks[0]]
+    online = registry.online_datasites
+    assert [datasite.id for datasite, _ in online] == [d.id for d in datasites]
+    assert online[0][1].name == "fast"
+    # the slow datasite doesn't hold up discovery
+    assert online[1][1] is None
+    assert time.monotonic() - start < 5
+
+    # metadata is read from the cache the next time
+    fast.shutdown()
+    assert registry._get_metadata(datasites[0]).name == "fast"
@@ -0,0 +1,60 @@
+# syft absolute
+import syft
+from syft.client.client import SyftClient
+from syft.server.worker import Worker
+from syft.service.request.request import Request
+from syft.service.request.request import RequestInfo
+from syft.service.request.request import RequestInfoFilter
+
+
+@syft.syft_function_single_use()
+def func_1():
+    return 1
+
+
+@syft.syft_function_single_use()
+def func_2():
+    return 2
+
+
+@syft.syft_function_single_use()
+def func_3():
+    return 3
+
+
+def submit_requests(ds_client: SyftClient) -> None:
+    for func in (func_1, func_2, func_3):
+        assert isinstance(ds_client.code.request_code_execution(func), Request)
+
+
+def test_get_all_info(worker: Worker, ds_client: SyftClient) -> None:
+    submit_requests(ds_client)
+    ds_name = ds_client.account.name
+    request_api = worker.root_client.api.services.request
+
+    infos = request_api.get_all_info()
+    assert len(infos) == 3
+    assert all(isinstance(info, RequestInfo) for info in infos)
+    assert {info.user.name for info in infos} == {ds_name}
+    assert {info.message.linked_obj.object_uid for info in infos} == {
+        info.request.id for info in infos
+    }
+
+    # pages are built only for the requests they show
+    page = request_api.get_all_info(page_index=1, page_size=2)
+    assert [info.request.id for info in page] == [infos[2].request.id]
+    pages = request_api.get_all_info(page_size=2)
+    assert [len(page) for page in pages] == [2, 1]
+
+    matching = request_api.filter_all_info(
+        request_filter=RequestInfoFilter(name=ds_name[:3])
+    )
+    assert len(matching) == 3
+    first_page = request_api.filter_all_info(
+        request_filter=RequestInfoFilter(name=ds_name), page_index=0, page_size=2
+    )
+    assert len(first_page) == 2
+    assert (
+        request_api.filter_all_info(request_filter=RequestInfoFilter(name="#nobody"))
+        == []
+    )
@@ -0,0 +1,26 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+# syft absolute
+from syft.util.util import run_with_deadlines
+
+
+def test_deadline_counts_from_start_of_call() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # the second call waits for the first one, but still has its full timeout
+        pending = run_with_deadlines(
+            executor, time.sleep, [0.3, 0.3], timeout=0.5, max_wait=2
+        )
+        assert all(future.done() and not future.cancelled() for future in pending)
+
+
+def test_slow_calls_time_out_and_queued_calls_are_cancelled() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        start = time.monotonic()
+        slow, queued = run_with_deadlines(
+            executor, time.sleep, [2, 0], timeout=0.3, max_wait=0.5
+        )
+        assert time.monotonic() - start < 1
+        assert not slow.done()
+        assert queued.cancelled()
@@ -0,0 +1,81 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import NUMPY_MAGIC
+from syft.serde.arrow import arraytonumpyutf8
+from syft.serde.arrow import arrow_serialize
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import raw_numpy_serialize
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+ARRAYS = [
+    np.arange(10),
+    np.array(3.5),
+    np.zeros((3, 0)),
+    np.arange(12, dtype=np.float32).reshape(3, 4).T,
+    np.array([True, False]),
+    np.array(["2020-01-01"], dtype="datetime64[ns]"),
+    np.array([(1, 2.0)], dtype=[("x", "i4"), ("y", "f8")]),
+    np.array(["a", "bcd", "ünïcödé"]).reshape(3, 1),
+    np.array([], dtype=str),
+]
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+def test_numpy_roundtrip(array: np.ndarray) -> None:
+    serialized = sy.serialize(array, to_bytes=True)
+    result = sy.deserialize(serialized, from_bytes=True)
+
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+
+def test_numpy_deserialized_array_is_writable() -> None:
+    array = np.arange(10)
+    result = numpy_deserialize(numpy_serialize(array))
+    result[0] = 42
+    assert result[0] == 42
+
+
+def test_numpy_serialize_is_not_wrapped() -> None:
+    array = np.arange(1000, dtype=np.int64)
+    serialized = numpy_serialize(array)
+
+    assert serialized.startswith(NUMPY_MAGIC)
+    assert serialized.endswith(array.tobytes())
+
+
+def test_numpy_compression_is_adaptive() -> None:
+    compressible = np.zeros(1024 * 1024)
+    random = np.random.rand(1024 * 1024)
+
+    assert len(raw_numpy_serialize(compressible)) < compressible.nbytes // 10
+    assert len(raw_numpy_serialize(random)) > random.nbytes
+
+    flags.APACHE_ARROW_COMPRESSION = ApacheArrowCompression.NONE
+    try:
+        assert len(raw_numpy_serialize(compressible)) > compressible.nbytes
+    finally:
+        flags.APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+
+    result = numpy_deserialize(raw_numpy_serialize(compressible))
+    assert (result == compressible).all()
+
+
+@pytest.mark.parametrize(
+    "array,legacy_serialize",
+    [
+        (np.arange(10, dtype=np.float64), arrow_serialize),
+        (np.array(["a", "bcd"]), arraytonumpyutf8),
+    ],
+)
+def test_numpy_deserialize_legacy_format(array, legacy_serialize) -> None:
+    result = numpy_deserialize(legacy_serialize(array))
+    assert result.dtype == array.dtype
+    assert (result == array).all()
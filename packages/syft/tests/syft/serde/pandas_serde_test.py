@@ -0,0 +1,71 @@
+# third party
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.third_party import ARROW_IPC_MAGIC
+from syft.serde.third_party import PARQUET_MAGIC
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import deserialize_series
+from syft.serde.third_party import serialize_dataframe
+from syft.serde.third_party import serialize_dataframe_parquet
+from syft.serde.third_party import serialize_series
+from syft.util.experimental_flags import flags
+
+
+def roundtrip(obj):
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 2, 3]),
+        pd.Series(["a", "b"], name="letters", index=["x", "y"]),
+        pd.Series(pd.Categorical(["a", "b", "a"]), name=3),
+        pd.Series(pd.date_range("2020-01-01", periods=3)),
+        pd.Series([], dtype=float),
+    ],
+)
+def test_series_roundtrip(series: pd.Series) -> None:
+    pd.testing.assert_series_equal(roundtrip(series), series)
+
+
+def test_dataframe_roundtrip() -> None:
+    df = pd.DataFrame(
+        {"c": pd.Categorical(["a", "b", "a"]), "d": [1.0, 2.0, 3.0]},
+        index=pd.Index([3, 4, 5], name="idx"),
+    )
+
+    assert serialize_dataframe(df).startswith(ARROW_IPC_MAGIC)
+    result = roundtrip(df)
+    pd.testing.assert_frame_equal(result, df)
+
+    result.loc[3, "d"] = 7.0
+    assert result.loc[3, "d"] == 7.0
+
+
+def test_dataframe_parquet_opt_in() -> None:
+    df = pd.DataFrame({"a": [1, 2]})
+
+    flags.PANDAS_PARQUET_SERDE = True
+    try:
+        assert serialize_dataframe(df).startswith(PARQUET_MAGIC)
+        pd.testing.assert_frame_equal(roundtrip(df), df)
+    finally:
+        flags.PANDAS_PARQUET_SERDE = False
+
+
+def test_pandas_deserialize_legacy_format() -> None:
+    df = pd.DataFrame({"a": [1, 2]})
+    pd.testing.assert_frame_equal(
+        deserialize_dataframe(serialize_dataframe_parquet(df)), df
+    )
+
+    series = pd.Series([1, 2], name="a")
+    legacy_series = sy.serialize(pd.DataFrame(series).to_dict(), to_bytes=True)
+    pd.testing.assert_series_equal(deserialize_series(legacy_series), series)
+
+    mixed = pd.Series([1, "a", None], name="mixed")
+    pd.testing.assert_series_equal(deserialize_series(serialize_series(mixed)), mixed)
@@ -1,10 +1,21 @@
 # stdlib
+import threading
 
 # third party
+import numpy as np
+import pytest
 
 # syft absolute
+from syft.service.action.action_data_empty import ActionDataEmpty
+from syft.service.action.action_object import Action
 from syft.service.action.action_object import ActionObject
+from syft.service.action.action_service import TwinExecutionMode
+from syft.service.action.action_service import execute_twin_branches
+from syft.service.action.action_service import resolve_callable
+from syft.service.action.plan import Plan
 from syft.service.context import AuthedServiceContext
+from syft.types.uid import LineageID
+from syft.types.uid import UID
 
 # TODO: Improve ActionService testing
 
@@ -25,3 +36,89 @@ def test_action_service_sanity(worker):
     assert len(service.store.data) == 1
     res = pointer.capitalize()
     assert res[0] == "A"
+
+
+def test_action_service_get_many_loads_blobs(worker):
+    service = worker.get_service("actionservice")
+    root_datasite_client = worker.root_client
+    arrays = [np.random.rand(256 * 1024) for _ in range(3)]
+    uids = []
+    for data in arrays:
+        obj = ActionObject.from_obj(data)
+        obj.send(root_datasite_client)
+        assert obj.syft_blob_storage_entry_id is not None
+        uids.append(obj.id)
+
+    context = get_auth_ctx(worker)
+    objs = service._get_many(context, uids).ok()
+    assert [obj.id for obj in objs] == uids
+    assert all(isinstance(obj.syft_action_data_cache, ActionDataEmpty) for obj in objs)
+
+    service._load_action_data(context, objs)
+    for obj, data in zip(objs, arrays):
+        assert (obj.syft_action_data_cache == data).all()
+
+    assert service._get_many(context, [*uids, ActionObject.from_obj(1).id]).is_err()
+
+
+@pytest.mark.parametrize("mode", list(TwinExecutionMode))
+def test_execute_twin_branches(mode):
+    started = threading.Barrier(2, timeout=5)
+
+    def branch(result):
+        def run():
+            if mode == TwinExecutionMode.THREADS:
+                # only passes when both branches run at the same time
+                started.wait()
+            return result
+
+        return run
+
+    assert execute_twin_branches(branch("private"), branch("mock"), mode) == (
+        "private",
+        "mock",
+    )
+
+    def fail():
+        raise ValueError("private failed")
+
+    with pytest.raises(ValueError, match="private failed"):
+        execute_twin_branches(fail, lambda: "mock", mode)
+
+
+def test_execute_twin_branches_nested():
+    mode = TwinExecutionMode.THREADS
+
+    def nested_mock():
+        return execute_twin_branches(lambda: "private", lambda: "mock", mode)
+
+    assert execute_twin_branches(lambda: "outer", nested_mock, mode) == (
+        "outer",
+        ("private", "mock"),
+    )
+
+
+def test_resolve_callable():
+    assert resolve_callable("numpy", "sum") is np.sum
+    assert resolve_callable("numpy.linalg", "norm") is np.linalg.norm
+
+
+def test_plan_remap_actions_to_inputs():
+    x = ActionObject.from_obj(1)
+    other = LineageID(UID())
+    action = Action(
+        path="action",
+        op="__add__",
+        remote_self=LineageID(x.id),
+        args=[LineageID(x.id), other],
+        kwargs={"y": LineageID(x.id)},
+    )
+    plan = Plan(inputs={"x": x}, outputs=[], actions=[action], code="")
+
+    new_x = LineageID(UID())
+    (remapped,) = plan.remap_actions_to_inputs(x=new_x)
+    assert remapped.remote_self == new_x
+    assert remapped.args == [new_x, other]
+    assert remapped.kwargs == {"y": new_x}
+    # the plan keeps its traced inputs
+    assert plan.actions[0].args[0].id == x.id
@@ -1,6 +1,7 @@
 # stdlib
 import random
 from typing import Any
+from unittest import mock as mock_lib
 from uuid import uuid4
 
 # third party
@@ -12,6 +13,7 @@ import torch
 
 # syft absolute
 import syft as sy
+from syft.client.datasite_client import DatasiteClient
 from syft.server.worker import Worker
 from syft.service.action.action_object import ActionObject
 from syft.service.action.action_object import TwinMode
@@ -212,6 +214,57 @@ def test_guest_client_get_empty_mock_as_private_pointer(
     assert mock.syft_twin_type is TwinMode.MOCK
 
 
+def test_upload_dataset_with_many_assets(worker: Worker) -> None:
+    assets = [Asset(**make_asset_with_mock()) for _ in range(10)]
+    dataset = Dataset(name=random_hash(), asset_list=assets)
+
+    root_datasite_client = worker.root_client
+    res = root_datasite_client.upload_dataset(
+        dataset, max_workers=4, max_in_flight_mb=0.001
+    )
+    assert isinstance(res, SyftSuccess)
+
+    uploaded = root_datasite_client.api.services.dataset.get_all()[0]
+    assert [asset.name for asset in uploaded.asset_list] == [
+        asset.name for asset in assets
+    ]
+    for asset in uploaded.asset_list:
+        assert (asset.data == data()).all()
+
+
+def test_upload_dataset_resumes_after_failure(worker: Worker) -> None:
+    assets = [Asset(**make_asset_with_mock()) for _ in range(4)]
+    dataset = Dataset(name=random_hash(), asset_list=assets)
+    failing_asset = assets[2]
+
+    upload_asset = DatasiteClient._upload_asset
+    uploaded_names = []
+    failed = []
+
+    def fail_once(self, asset):
+        uploaded_names.append(asset.name)
+        if asset is failing_asset and not failed:
+            failed.append(asset.name)
+            return SyftError(message="upload failed")
+        return upload_asset(self, asset)
+
+    root_datasite_client = worker.root_client
+    with mock_lib.patch.object(DatasiteClient, "_upload_asset", fail_once):
+        res = root_datasite_client.upload_dataset(dataset, max_workers=1)
+        assert isinstance(res, SyftError)
+        assert "resume" in res.message
+        assert failing_asset.action_id is None
+
+        uploaded_names.clear()
+        res = root_datasite_client.upload_dataset(dataset, max_workers=1)
+        assert isinstance(res, SyftSuccess)
+
+    # only the assets that were not uploaded before are retried
+    assert failing_asset.name in uploaded_names
+    assert assets[0].name not in uploaded_names
+    assert all(asset.action_id is not None for asset in assets)
+
+
 def test_datasite_client_cannot_upload_dataset_with_non_mock(worker: Worker) -> None:
     assets = [Asset(**make_asset_with_mock()) for _ in range(10)]
     dataset = Dataset(name=random_hash(), asset_list=assets)
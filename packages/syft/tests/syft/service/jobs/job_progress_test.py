@@ -0,0 +1,59 @@
+# syft absolute
+from syft.service.context import AuthedServiceContext
+from syft.service.job.job_progress import JobProgressReporter
+from syft.service.job.job_stash import Job
+from syft.service.job.job_stash import JobStatus
+from syft.types.uid import UID
+
+
+def test_progress_reporter_buffers_writes() -> None:
+    writes = []
+    reporter = JobProgressReporter(
+        lambda *args: writes.append(args), flush_interval=3600, flush_delta=10
+    )
+
+    reporter.set_current_iter(0)
+    reporter.set_n_iters(100)
+    assert writes == [(100, 0, 0)]
+
+    for _ in range(25):
+        reporter.increase_current_iter(1)
+    assert writes[1:] == [(None, None, 10), (None, None, 10)]
+    assert reporter.current_iter == 25
+
+    reporter.set_current_iter(27)
+    reporter.increase_current_iter(2)
+    reporter.flush()
+    assert writes[3:] == [(None, 27, 2)]
+
+    reporter.flush()
+    assert len(writes) == 4
+
+
+def test_progress_reporter_flushes_after_interval() -> None:
+    writes = []
+    reporter = JobProgressReporter(lambda *args: writes.append(args), flush_interval=0)
+
+    reporter.increase_current_iter(1)
+    assert writes == [(None, None, 1)]
+
+
+def test_job_stash_update_progress(worker) -> None:
+    stash = worker.get_service("jobservice").stash
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    job = Job(id=UID(), server_uid=worker.id, status=JobStatus.PROCESSING)
+    stash.set(context.credentials, job)
+
+    # a concurrent status change is not overwritten by progress updates
+    job.status = JobStatus.TERMINATING
+    stash.update(context.credentials, job)
+
+    stash.update_progress(context.credentials, job.id, n_iters=10, current_iter=2)
+    res = stash.update_progress(context.credentials, job.id, increment=3)
+    job = res.ok()
+    assert (job.n_iters, job.current_iter) == (10, 5)
+    assert job.status == JobStatus.TERMINATING
+
+    assert stash.update_progress(context.credentials, UID(), increment=1).is_err()
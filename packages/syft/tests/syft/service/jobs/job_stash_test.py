@@ -2,12 +2,15 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+import threading
+import time
 
 # third party
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.service.context import AuthedServiceContext
 from syft.service.job.job_stash import Job
 from syft.service.job.job_stash import JobStatus
 from syft.types.uid import UID
@@ -58,3 +61,48 @@ def test_job_no_consumer(worker):
     job = client.code.process_all(blocking=False)
     res = job.wait()
     assert not res, "Should return error when no consumers are available"
+
+
+def test_job_wait_long_poll(worker):
+    job_service = worker.get_service("jobservice")
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    job = Job(id=UID(), server_uid=worker.id, status=JobStatus.PROCESSING)
+    job_service.stash.set(context.credentials, job)
+
+    res = job_service.wait(context, uid=job.id, timeout=0.1)
+    assert isinstance(res, Job) and not res.resolved
+
+    def resolve() -> None:
+        time.sleep(0.2)
+        job.resolved = True
+        job.status = JobStatus.COMPLETED
+        job_service.stash.update(context.credentials, job)
+
+    threading.Thread(target=resolve).start()
+    start = time.monotonic()
+    res = job_service.wait(context, uid=job.id, timeout=10)
+    assert res.resolved and res.status == JobStatus.COMPLETED
+    assert time.monotonic() - start < 5
+
+
+def test_job_set_processing(worker):
+    stash = worker.get_service("jobservice").stash
+    credentials = worker.signing_key.verify_key
+    job = Job(id=UID(), server_uid=worker.id)
+    stash.set(credentials, job)
+
+    worker_id = UID()
+    res = stash.set_processing(credentials, job.id, worker.id, worker_id, job_pid=42)
+    job = res.ok()
+    assert job.status == JobStatus.PROCESSING
+    assert (job.job_worker_id, job.job_pid) == (worker_id, 42)
+
+    # a job that was resolved in the meantime is not set back to processing
+    job.resolved = True
+    job.status = JobStatus.COMPLETED
+    stash.update(credentials, job)
+    res = stash.set_processing(credentials, job.id, worker.id, job_pid=43)
+    assert res.ok().status == JobStatus.COMPLETED
+    assert res.ok().job_pid == 42
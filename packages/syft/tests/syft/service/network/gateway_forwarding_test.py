@@ -0,0 +1,161 @@
+# stdlib
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import socket
+import threading
+import time
+
+# third party
+from fastapi import FastAPI
+import pytest
+import requests
+import uvicorn
+
+# syft absolute
+from syft.abstract_server import ServerType
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.client.client import API_PATH
+from syft.client.client import HTTPConnection
+from syft.serde.serialize import _serialize as serialize
+from syft.server.routes import make_routes
+from syft.server.worker import Worker
+from syft.service.metadata.server_metadata import ServerMetadata
+from syft.service.network.network_service import NetworkService
+from syft.service.network.routes import HTTPServerRoute
+from syft.service.network.server_peer import ServerPeer
+from syft.types.server_url import ServerURL
+from syft.types.uid import UID
+
+
+def serve(worker: Worker) -> tuple[uvicorn.Server, int]:
+    app = FastAPI()
+    app.include_router(make_routes(worker=worker), prefix=API_PATH)
+    sock = socket.socket()
+    sock.bind(("localhost", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+    threading.Thread(target=server.run, args=([sock],), daemon=True).start()
+    for _ in range(200):
+        if server.started:
+            break
+        time.sleep(0.05)
+    return server, sock.getsockname()[1]
+
+
+@pytest.fixture
+def gateway_and_datasite(
+    worker: Worker, second_worker: Worker
+) -> Iterator[tuple[int, Worker]]:
+    gateway, gateway_port = serve(worker)
+    datasite, datasite_port = serve(second_worker)
+
+    peer = ServerPeer(
+        id=second_worker.id,
+        name=second_worker.name,
+        verify_key=second_worker.verify_key,
+        server_routes=[HTTPServerRoute(host_or_ip="localhost", port=datasite_port)],
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+    )
+    stash = worker.get_service(NetworkService).stash
+    assert stash.set(worker.verify_key, peer).is_ok()
+
+    yield gateway_port, second_worker
+    for server in (gateway, datasite):
+        server.should_exit = True
+
+
+def test_gateway_passes_calls_through(gateway_and_datasite, monkeypatch) -> None:
+    gateway_port, datasite = gateway_and_datasite
+    connection = HTTPConnection(
+        url=ServerURL(host_or_ip="localhost", port=gateway_port),
+        proxy_target_uid=datasite.id,
+    )
+    api_call = SyftAPICall(
+        server_uid=datasite.id, path="metadata", args=[], kwargs={}
+    ).sign(datasite.signing_key)
+
+    # the gateway doesn't deserialize the signed message
+    def forward_message(*args, **kwargs):
+        raise AssertionError("call was not passed through")
+
+    monkeypatch.setattr(Worker, "forward_message", forward_message)
+
+    result = connection.make_call(api_call)
+    assert isinstance(result, SignedSyftAPICall)
+    # the result is the one the datasite signed
+    assert result.credentials == datasite.verify_key
+    assert result.is_valid
+    metadata = result.message.data
+    assert isinstance(metadata, ServerMetadata)
+    assert metadata.id == datasite.id
+
+
+def test_gateway_checks_signature_of_passed_through_calls(
+    worker: Worker, gateway_and_datasite
+) -> None:
+    _, datasite = gateway_and_datasite
+    api_call = SyftAPICall(
+        server_uid=datasite.id, path="metadata", args=[], kwargs={}
+    ).sign(datasite.signing_key)
+    assert worker.forward_raw_api_call(datasite.id, serialize(api_call, to_bytes=True))
+
+    # calls with an invalid signature are left to handle_api_call, which rejects them
+    tampered = api_call.model_copy(update={"signature": bytes(64)})
+    data = serialize(tampered, to_bytes=True)
+    assert worker.forward_raw_api_call(datasite.id, data) is None
+    unsigned = SyftAPICall(server_uid=datasite.id, path="metadata", args=[], kwargs={})
+    data = serialize(unsigned, to_bytes=True)
+    assert worker.forward_raw_api_call(datasite.id, data) is None
+
+
+class BlobStoreHandler(BaseHTTPRequestHandler):
+    uploads: list[tuple[dict[str, str], bytes]] = []
+
+    def do_PUT(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.uploads.append((dict(self.headers), body))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_gateway_streams_uploads_with_their_size(worker: Worker) -> None:
+    blob_store = ThreadingHTTPServer(("localhost", 0), BlobStoreHandler)
+    threading.Thread(target=blob_store.serve_forever, daemon=True).start()
+    gateway, gateway_port = serve(worker)
+
+    peer = ServerPeer(
+        id=UID(),
+        name="datasite",
+        verify_key=worker.verify_key,
+        server_routes=[
+            HTTPServerRoute(host_or_ip="localhost", port=blob_store.server_port)
+        ],
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+    )
+    stash = worker.get_service(NetworkService).stash
+    assert stash.set(worker.verify_key, peer).is_ok()
+
+    connection = HTTPConnection(
+        url=ServerURL(host_or_ip="localhost", port=gateway_port)
+    )
+    url = connection.stream_via(peer.id, "/bucket/blob?part=1")
+    data = bytes(range(256)) * 4096
+    try:
+        response = requests.put(str(url), data=data, timeout=10)
+    finally:
+        gateway.should_exit = True
+        blob_store.shutdown()
+        blob_store.server_close()
+
+    assert response.status_code == 200
+    [(headers, body)] = BlobStoreHandler.uploads
+    assert headers["Content-Length"] == str(len(data))
+    assert "Transfer-Encoding" not in headers
+    assert body == data
@@ -0,0 +1,81 @@
+# stdlib
+import time
+
+# syft absolute
+from syft.abstract_server import ServerType
+from syft.server.credentials import SyftSigningKey
+from syft.server.worker import Worker
+from syft.service.context import AuthedServiceContext
+from syft.service.network.network_service import NetworkService
+from syft.service.network.routes import HTTPServerRoute
+from syft.service.network.routes import PythonServerRoute
+from syft.service.network.server_peer import ServerPeer
+from syft.service.network.server_peer import ServerPeerConnectionStatus
+from syft.service.network.server_peer import ServerPeerUpdate
+from syft.service.network.utils import PeerHealthCheckTask
+from syft.types.uid import UID
+
+
+def add_peer(worker: Worker, name: str, route=None) -> ServerPeer:
+    peer = ServerPeer(
+        id=UID(),
+        name=name,
+        verify_key=SyftSigningKey.generate().verify_key,
+        server_routes=[route or HTTPServerRoute(host_or_ip=name, port=80)],
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+    )
+    stash = worker.get_service(NetworkService).stash
+    assert stash.set(worker.verify_key, peer).is_ok()
+    return peer
+
+
+def get_peer(worker: Worker, peer: ServerPeer) -> ServerPeer:
+    stash = worker.get_service(NetworkService).stash
+    return stash.get_by_uid(worker.verify_key, peer.id).ok()
+
+
+class StubPeerHealthCheckTask(PeerHealthCheckTask):
+    def check_peer(
+        self, context: AuthedServiceContext, peer: ServerPeer
+    ) -> ServerPeerUpdate:
+        if peer.name == "slow":
+            time.sleep(3)
+        return ServerPeerUpdate(
+            id=peer.id, ping_status=ServerPeerConnectionStatus.ACTIVE
+        )
+
+
+def test_slow_peer_does_not_delay_others(worker: Worker) -> None:
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    peers = [add_peer(worker, name) for name in ("fast", "slow", "other")]
+
+    task = StubPeerHealthCheckTask(peer_timeout=0.5)
+    start = time.monotonic()
+    assert task.peer_route_heathcheck(context) is None
+    assert time.monotonic() - start < 2
+
+    fast, slow, other = (get_peer(worker, peer) for peer in peers)
+    assert fast.ping_status == ServerPeerConnectionStatus.ACTIVE
+    assert other.ping_status == ServerPeerConnectionStatus.ACTIVE
+    assert slow.ping_status == ServerPeerConnectionStatus.TIMEOUT
+    assert slow.pinged_timestamp is not None
+
+
+def test_peer_clients_are_reused(worker: Worker, second_worker: Worker) -> None:
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    peer = add_peer(worker, "second", PythonServerRoute.with_server(second_worker))
+    unreachable = add_peer(worker, "unreachable.invalid")
+
+    task = PeerHealthCheckTask(peer_timeout=30)
+    task.peer_route_heathcheck(context)
+    # the peers don't know each other, but the peer answered
+    assert get_peer(worker, peer).ping_status == ServerPeerConnectionStatus.INACTIVE
+    assert (
+        get_peer(worker, unreachable).ping_status == ServerPeerConnectionStatus.TIMEOUT
+    )
+    client = task._clients[peer.id][1]
+    assert unreachable.id not in task._clients
+
+    task.peer_route_heathcheck(context)
+    assert task._clients[peer.id][1] is client
@@ -0,0 +1,81 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+
+# syft absolute
+from syft.server.worker import Worker
+from syft.service.output.output_service import ExecutionOutput
+from syft.service.output.output_service import OutputStash
+from syft.types.uid import UID
+
+
+def add_output(worker: Worker, stash: OutputStash, output_policy_id: UID) -> UID:
+    output = ExecutionOutput.from_ids(
+        output_ids=[UID()],
+        user_code_id=UID(),
+        executing_user_verify_key=worker.verify_key,
+        server_uid=worker.id,
+        output_policy_id=output_policy_id,
+    )
+    assert stash.set(worker.verify_key, output).is_ok()
+    return output.id
+
+
+def test_execution_count(worker: Worker) -> None:
+    stash = worker.get_service("outputservice").stash
+    credentials = worker.verify_key
+    policy_id, other_policy_id = UID(), UID()
+
+    output_ids = [add_output(worker, stash, policy_id) for _ in range(3)]
+    add_output(worker, stash, other_policy_id)
+    assert stash.get_execution_count(credentials, policy_id).ok() == 3
+    assert stash.get_execution_count(credentials, other_policy_id).ok() == 1
+    assert stash.get_execution_count(credentials, UID()).ok() == 0
+
+    # outputs stored again are not counted again
+    output = stash.get_by_uid(credentials, output_ids[0]).ok()
+    assert stash.set(credentials, output, ignore_duplicates=True).is_ok()
+    assert stash.get_execution_count(credentials, policy_id).ok() == 3
+
+    assert stash.delete_by_uid(credentials, output_ids[0]).is_ok()
+    assert stash.get_execution_count(credentials, policy_id).ok() == 2
+
+    # policies without a count are counted from their outputs
+    assert stash.execution_counts.delete_by_uid(credentials, policy_id).is_ok()
+    assert stash.get_execution_count(credentials, policy_id).ok() == 2
+    add_output(worker, stash, policy_id)
+    assert stash.get_execution_count(credentials, policy_id).ok() == 3
+
+
+def test_reconcile_execution_counts(worker: Worker) -> None:
+    stash = worker.get_service("outputservice").stash
+    credentials = worker.verify_key
+    policy_id = UID()
+    add_output(worker, stash, policy_id)
+    add_output(worker, stash, policy_id)
+
+    stash.execution_counts.set_count(credentials, policy_id, 10)
+    assert stash.reconcile_execution_counts(credentials).ok() == 1
+    assert stash.get_execution_count(credentials, policy_id).ok() == 2
+
+
+def test_execution_count_limit(worker: Worker) -> None:
+    stash = worker.get_service("outputservice").stash
+    credentials = worker.verify_key
+    policy_id = UID()
+
+    def set_output(_: int) -> bool:
+        output = ExecutionOutput.from_ids(
+            output_ids=[UID()],
+            user_code_id=UID(),
+            executing_user_verify_key=worker.verify_key,
+            server_uid=worker.id,
+            output_policy_id=policy_id,
+        )
+        return stash.set(credentials, output, output_policy_limit=2).is_ok()
+
+    # concurrent executions can't store more outputs than the limit
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(set_output, range(8)))
+    assert results.count(True) == 2
+    assert stash.get_execution_count(credentials, policy_id).ok() == 2
+    assert len(stash.get_by_output_policy_id(credentials, policy_id).ok()) == 2
@@ -11,11 +11,17 @@ from syft.client.sync_decision import SyncDecision
 from syft.client.syncing import compare_clients
 from syft.client.syncing import resolve
 from syft.server.worker import Worker
+from syft.service.code.user_code import UserCode
+from syft.service.context import AuthedServiceContext
 from syft.service.job.job_stash import Job
+from syft.service.request.request import Request
 from syft.service.request.request import RequestStatus
 from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
+from syft.service.sync.diff_state import ObjectDiff
+from syft.service.sync.diff_state import has_same_content
 from syft.service.sync.resolve_widget import ResolveWidget
+from syft.store.change_log import next_change_seq
 
 
 def handle_decision(
@@ -136,6 +142,91 @@ def test_diff_state(low_worker, high_worker):
     assert res == compute(syft_no_server=True)
 
 
+def test_get_sync_state_changes(low_worker):
+    low_client: DatasiteClient = low_worker.root_client
+    client_low_ds = get_ds_client(low_client)
+    _ = client_low_ds.code.request_code_execution(compute)
+
+    low_client.get_sync_state()
+    assert low_client._sync_state_delta.since is None
+
+    since = next_change_seq()
+    delta = low_client.api.services.sync._get_state_changes(since=since)
+    assert delta.since == since
+    assert len(delta.objects) == 0
+
+    @sy.syft_function_single_use()
+    def compute_twice() -> int:
+        return 84
+
+    _ = client_low_ds.code.request_code_execution(compute_twice)
+    delta = low_client.api.services.sync._get_state_changes(since=since)
+    assert {type(obj) for obj in delta.objects.values()} == {Request, UserCode}
+
+    # changes merged into the earlier state are the same as the full state
+    state = low_client.get_sync_state()
+    assert low_client._sync_state_delta.since is None
+    full_state = low_client.api.services.sync._get_state()
+    assert state.objects.keys() == full_state.objects.keys()
+    assert state.dependencies == full_state.dependencies
+    assert state.permissions == full_state.permissions
+
+
+def test_sync_dependency_graph(low_worker):
+    low_client: DatasiteClient = low_worker.root_client
+    client_low_ds = get_ds_client(low_client)
+    _ = client_low_ds.code.request_code_execution(compute)
+
+    sync_service = low_worker.get_service("syncservice")
+    state = low_client.api.services.sync._get_state()
+    graph = dict(sync_service.stash.dependency_graph)
+    assert set(state.objects) <= set(graph)
+    # skip the grace period of the change log
+    sync_service.stash.dependency_graph_seq = next_change_seq()
+
+    @sy.syft_function_single_use()
+    def compute_twice() -> int:
+        return 84
+
+    _ = client_low_ds.code.request_code_execution(compute_twice)
+    context = AuthedServiceContext(server=low_worker, credentials=low_worker.verify_key)
+    changed_ids = sync_service.get_changed_dependency_ids(context)
+    assert changed_ids is not None
+    assert not changed_ids & set(graph)
+
+    # dependencies from the graph are the same as the ones computed from scratch
+    state = low_client.api.services.sync._get_state()
+    sync_service.stash.dependency_graph_seq = None
+    full_state = low_client.api.services.sync._get_state()
+    assert state.objects.keys() == full_state.objects.keys()
+    assert state.dependencies == full_state.dependencies
+
+
+def test_diff_same_content(low_worker):
+    low_client: DatasiteClient = low_worker.root_client
+    client_low_ds = get_ds_client(low_client)
+    _ = client_low_ds.code.request_code_execution(compute)
+
+    code = low_client.code.get_all()[0]
+    copy = code.model_copy()
+    assert has_same_content(code, copy)
+    assert not has_same_content(code, copy.model_copy(update={"raw_code": ""}))
+
+    diff = ObjectDiff.from_objects(
+        low_obj=code,
+        high_obj=copy,
+        low_status="NEW",
+        high_status="NEW",
+        low_permissions=set(),
+        high_permissions=set(),
+        low_storage_permissions=set(),
+        high_storage_permissions=set(),
+        low_server_uid=low_worker.id,
+        high_server_uid=low_worker.id,
+    )
+    assert diff.status == "SAME"
+
+
 def test_skip_deletion(low_worker, high_worker):
     low_client: DatasiteClient = low_worker.root_client
     high_client: DatasiteClient = high_worker.root_client
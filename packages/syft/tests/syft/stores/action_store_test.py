@@ -150,3 +150,32 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_action_store"),
+        pytest.lazy_fixture("sqlite_action_store"),
+        pytest.lazy_fixture("mongo_action_store"),
+    ],
+)
+@pytest.mark.flaky(reruns=3, reruns_delay=3)
+def test_action_store_test_data_get_many(store: Any):
+    client_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_CLIENT)
+    root_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_ROOT)
+    hacker_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_HACKER)
+
+    objs = {UID(): MockSyftObject(data=i) for i in range(3)}
+    for uid, obj in objs.items():
+        res = store.set(uid, client_key, obj, has_result_read_permission=True)
+        assert res.is_ok()
+    missing_uid = UID()
+    uids = [*objs, missing_uid]
+
+    res = store.get_many(uids, client_key)
+    assert res.is_ok()
+    assert res.ok() == objs
+    assert store.get_many(uids, root_key).ok() == objs
+    assert store.get_many(uids, hacker_key).ok() == {}
+    assert store.get_many(uids, hacker_key, has_permission=True).ok() == objs
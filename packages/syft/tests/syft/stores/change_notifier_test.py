@@ -0,0 +1,48 @@
+# stdlib
+import threading
+import time
+
+# syft absolute
+from syft.store.change_notifier import ChangeNotifier
+from syft.types.uid import UID
+
+
+def test_wait_until_wakes_up_on_notify() -> None:
+    notifier = ChangeNotifier()
+    uid = UID()
+    done = threading.Event()
+
+    def write() -> None:
+        time.sleep(0.1)
+        done.set()
+        notifier.notify(uid)
+
+    threading.Thread(target=write).start()
+    start = time.monotonic()
+    # a long recheck interval, so only the notification can wake the waiter up
+    assert notifier.wait_until([uid], done.is_set, timeout=5, recheck_interval=5)
+    assert time.monotonic() - start < 2
+    assert not notifier._waiters
+
+
+def test_wait_until_timeout_and_recheck() -> None:
+    notifier = ChangeNotifier()
+    uid = UID()
+
+    start = time.monotonic()
+    assert not notifier.wait_until([uid], lambda: False, timeout=0.2)
+    assert 0.2 <= time.monotonic() - start < 2
+
+    # writes from other processes are picked up by re-checking the predicate
+    deadline = time.monotonic() + 0.2
+    assert notifier.wait_until(
+        [uid], lambda: time.monotonic() > deadline, timeout=5, recheck_interval=0.05
+    )
+
+
+def test_wait_until_falls_back_when_too_many_waiters() -> None:
+    notifier = ChangeNotifier(max_waiters=0)
+
+    start = time.monotonic()
+    assert not notifier.wait_until([UID()], lambda: False, timeout=5)
+    assert time.monotonic() - start < 1
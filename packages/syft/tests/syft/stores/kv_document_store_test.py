@@ -6,12 +6,24 @@ from threading import Thread
 import pytest
 
 # syft absolute
+from syft.serde.serializable import serializable
+from syft.server.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.store.change_log import CHANGE_DELETE
+from syft.store.change_log import CHANGE_PERMISSIONS
+from syft.store.change_log import CHANGE_SET
+from syft.store.change_log import CHANGE_UPDATE
+from syft.store.change_log import next_change_seq
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
 from syft.store.kv_document_store import KeyValueStorePartition
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.syncable_object import SyncableSyftObject
 from syft.types.uid import UID
 
 # relative
+from .store_mocks_test import MockKeyValueBackingStore
 from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockStoreConfig
 from .store_mocks_test import MockSyftObject
@@ -186,6 +198,104 @@ def test_kv_store_partition_update(
         assert stored.ok()[0].data == v
 
 
+@serializable()
+class MockSearchableObject(SyftObject):
+    __canonical_name__ = f"MockSearchableObject_{UID()}"
+    __version__ = SYFT_OBJECT_VERSION_1
+    __attr_searchable__ = ["status", "owner"]
+
+    status: str
+    owner: str
+    data: int = 0
+
+
+def test_kv_store_partition_update_writes_changed_keys(
+    root_verify_key, worker, monkeypatch
+) -> None:
+    settings = PartitionSettings(name="test", object_type=MockSearchableObject)
+    store = KeyValueStorePartition(
+        server_uid=worker.id,
+        root_verify_key=root_verify_key,
+        settings=settings,
+        store_config=MockStoreConfig(),
+    )
+    assert store.init_store().is_ok()
+
+    obj = MockSearchableObject(status="created", owner="alice")
+    store.set(root_verify_key, obj, ignore_duplicates=False)
+
+    writes = []
+    setitem = MockKeyValueBackingStore.__setitem__
+
+    def counting_setitem(self, key, value):
+        writes.append(key)
+        return setitem(self, key, value)
+
+    monkeypatch.setattr(MockKeyValueBackingStore, "__setitem__", counting_setitem)
+
+    key = settings.store_key.with_obj(obj)
+    new_obj = MockSearchableObject(id=obj.id, status="created", owner="alice", data=1)
+    assert store.update(root_verify_key, key, new_obj).is_ok()
+    # only the object itself is written, no key column changed
+    assert writes == [obj.id]
+
+    writes.clear()
+    new_obj = MockSearchableObject(id=obj.id, status="done", owner="alice", data=2)
+    assert store.update(root_verify_key, key, new_obj).is_ok()
+    assert writes == ["status", obj.id]
+
+    assert store.searchable_keys["status"] == {"created": [], "done": [obj.id]}
+    assert store.searchable_keys["owner"] == {"alice": [obj.id]}
+
+
+@serializable()
+class MockSyncableObject(SyncableSyftObject):
+    __canonical_name__ = "MockSyncableObject"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    data: int = 0
+
+
+def test_kv_store_partition_change_log(
+    root_verify_key, worker, kv_store_partition: KeyValueStorePartition
+) -> None:
+    settings = PartitionSettings(name="test", object_type=MockSyncableObject)
+    store = KeyValueStorePartition(
+        server_uid=worker.id,
+        root_verify_key=root_verify_key,
+        settings=settings,
+        store_config=MockStoreConfig(),
+    )
+    assert store.init_store().is_ok()
+
+    start = next_change_seq()
+    obj = MockSyncableObject()
+    other = MockSyncableObject()
+    store.set(root_verify_key, obj, ignore_duplicates=False)
+    store.set(root_verify_key, other, ignore_duplicates=False)
+    assert store.changes_since(start).ok() == {
+        obj.id: CHANGE_SET,
+        other.id: CHANGE_SET,
+    }
+
+    seq = next_change_seq()
+    key = settings.store_key.with_obj(obj)
+    store.update(root_verify_key, key, MockSyncableObject(id=obj.id, data=1))
+    guest_key = SyftSigningKey.generate().verify_key
+    store.add_permission(ActionObjectREAD(uid=other.id, credentials=guest_key))
+    assert store.changes_since(seq).ok() == {
+        obj.id: CHANGE_UPDATE,
+        other.id: CHANGE_PERMISSIONS,
+    }
+
+    seq = next_change_seq()
+    store.delete(root_verify_key, key)
+    assert store.changes_since(seq).ok() == {obj.id: CHANGE_DELETE}
+
+    # only partitions of syncable objects keep a change log
+    assert kv_store_partition.changes_since(start).is_err()
+
+
 def test_kv_store_partition_set_multithreaded(
     root_verify_key,
     kv_store_partition: KeyValueStorePartition,
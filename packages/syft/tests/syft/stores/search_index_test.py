@@ -0,0 +1,59 @@
+# syft absolute
+from syft.store.search_index import InMemorySearchIndex
+from syft.store.search_index import tokenize
+from syft.types.uid import UID
+
+
+def test_tokenize() -> None:
+    assert tokenize("Census-2020 data, by_state") == [
+        "census",
+        "2020",
+        "data",
+        "by_state",
+    ]
+
+
+def test_in_memory_search_index() -> None:
+    index = InMemorySearchIndex(field_weights={"name": 4.0})
+    census, income, notes = UID(), UID(), UID()
+    index.add(census, {"name": "Census", "description": "population by state"})
+    index.add(income, {"name": "Income", "description": "census income survey"})
+    index.add(notes, {"name": "Notes", "description": "Meeting notes"})
+
+    # matches in the name rank first
+    assert index.search("census") == [census, income]
+    # the last token matches as a prefix, all tokens have to match
+    assert index.search("census inc") == [income]
+    assert index.search("popul") == [census]
+    assert index.search("census meeting") == []
+    # names containing the query match when no token does, like the substring
+    # search did
+    assert index.search("ensu") == [census]
+    incensed = UID()
+    index.add(incensed, {"name": "Incensus"})
+    assert index.search("ensu") == [census, incensed]
+    assert index.search("census") == [census, income]
+    index.remove(incensed)
+    assert index.search("") == [census, income, notes]
+
+    index.add(census, {"name": "Census", "description": "households"})
+    assert index.search("popul") == []
+    assert index.search("house") == [census]
+
+    index.remove(income)
+    assert index.search("census") == [census]
+    assert "income" not in index._tokens
+    assert len(index) == 2
+
+
+def test_search_index_rebuild() -> None:
+    index = InMemorySearchIndex()
+    assert index.is_stale
+
+    uid = UID()
+    index.rebuild([(uid, {"name": "Census"})])
+    assert not index.is_stale
+    assert index.search("census") == [uid]
+
+    index.invalidate()
+    assert index.is_stale
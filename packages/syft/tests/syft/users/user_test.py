@@ -438,6 +438,26 @@ def test_user_search(
         assert getattr(user, k) == v
 
 
+def test_user_search_text(
+    root_client: DatasiteClient, ds_client: DatasiteClient
+) -> None:
+    user = ds_client.account
+    user.update(name="Ada Lovelace", institution="Analytical Engines")
+
+    users = root_client.api.services.user.search_text(query="lovel")
+    assert [u.id for u in users] == [user.id]
+    users = root_client.api.services.user.search_text(query="analytical")
+    assert [u.id for u in users] == [user.id]
+    users = root_client.api.services.user.search_text(query=ds_client.logged_in_user)
+    assert users[0].id == user.id
+
+    page = root_client.api.services.user.search_text(
+        query="", page_size=1, page_index=0
+    )
+    assert len(page.users) == 1
+    assert page.total == len(root_client.users.get_all())
+
+
 class M(pydantic.BaseModel):
     role: ServiceRole
 
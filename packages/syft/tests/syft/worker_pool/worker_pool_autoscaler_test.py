@@ -0,0 +1,146 @@
+# syft absolute
+from syft.server.worker import Worker
+from syft.service.context import AuthedServiceContext
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import Status
+from syft.service.response import SyftError
+from syft.service.response import SyftSuccess
+from syft.service.worker.utils import DEFAULT_WORKER_POOL_NAME
+from syft.service.worker.worker_pool_autoscaler import AutoscalePolicy
+from syft.service.worker.worker_pool_autoscaler import AutoscalerBackend
+from syft.service.worker.worker_pool_autoscaler import PoolMetrics
+from syft.service.worker.worker_pool_autoscaler import WorkerPoolAutoscaler
+from syft.service.worker.worker_pool_autoscaler import desired_workers
+from syft.service.worker.worker_pool_service import SyftWorkerPoolService
+from syft.store.linked_obj import LinkedObject
+from syft.types.uid import UID
+
+
+class FakeOrchestrator(AutoscalerBackend):
+    def __init__(self, workers: dict[str, int]) -> None:
+        self.workers = workers
+        self.calls: list[tuple[str, int]] = []
+
+    def current_workers(self, context: AuthedServiceContext, pool_name: str) -> int:
+        return self.workers[pool_name]
+
+    def scale(
+        self, context: AuthedServiceContext, pool_name: str, number: int
+    ) -> SyftSuccess | SyftError:
+        self.calls.append((pool_name, number))
+        self.workers[pool_name] = number
+        return SyftSuccess(message="scaled")
+
+
+def test_desired_workers() -> None:
+    policy = AutoscalePolicy(
+        min_workers=1, max_workers=5, target_queue_per_worker=2, max_wait_seconds=10
+    )
+
+    assert desired_workers(policy, PoolMetrics(), current=3) == 1
+    assert desired_workers(policy, PoolMetrics(queued=3, processing=1), 1) == 3
+    assert desired_workers(policy, PoolMetrics(queued=100), current=1) == 5
+    # jobs waiting too long add a worker, even if the queue is short
+    metrics = PoolMetrics(queued=1, processing=2, wait_p90_seconds=11)
+    assert desired_workers(policy, metrics, current=3) == 4
+    # busy pools are not scaled down
+    metrics = PoolMetrics(processing=1, workers=4, busy_workers=3)
+    assert desired_workers(policy, metrics, current=4) == 4
+
+
+def add_queue_items(worker: Worker, n: int, status: Status) -> None:
+    pool = worker.get_service("SyftWorkerPoolService").stash.get_by_name(
+        worker.verify_key, pool_name=DEFAULT_WORKER_POOL_NAME
+    )
+    worker_pool_ref = LinkedObject.from_obj(
+        pool.ok(), server_uid=worker.id, service_type=SyftWorkerPoolService
+    )
+    for _ in range(n):
+        item = QueueItem(
+            id=UID(),
+            server_uid=worker.id,
+            method="dummy_method",
+            service="dummy_service",
+            args=[],
+            kwargs={},
+            worker_pool=worker_pool_ref,
+            status=status,
+        )
+        worker.queue_stash.set_placeholder(worker.verify_key, item)
+
+
+def test_autoscaler_step(worker: Worker) -> None:
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    backend = FakeOrchestrator({DEFAULT_WORKER_POOL_NAME: 1})
+    autoscaler = WorkerPoolAutoscaler(backend=backend)
+
+    # pools without a policy are left alone
+    add_queue_items(worker, 4, Status.CREATED)
+    assert autoscaler.step(context) == {}
+
+    autoscaler.set_policy(
+        DEFAULT_WORKER_POOL_NAME,
+        AutoscalePolicy(
+            min_workers=1,
+            max_workers=3,
+            scale_up_cooldown_seconds=3600,
+            scale_down_cooldown_seconds=0,
+        ),
+    )
+    assert autoscaler.step(context) == {DEFAULT_WORKER_POOL_NAME: 3}
+    metrics = autoscaler.last_metrics[DEFAULT_WORKER_POOL_NAME]
+    assert metrics.queued == 4 and metrics.processing == 0
+
+    # no scaling up again within the cooldown
+    backend.workers[DEFAULT_WORKER_POOL_NAME] = 2
+    assert autoscaler.step(context) == {}
+
+    for item in worker.queue_stash.get_all(worker.verify_key).ok():
+        item = item.model_copy(update={"status": Status.COMPLETED, "resolved": True})
+        worker.queue_stash.set_result(worker.verify_key, item)
+    assert autoscaler.step(context) == {DEFAULT_WORKER_POOL_NAME: 1}
+    assert backend.calls == [
+        (DEFAULT_WORKER_POOL_NAME, 3),
+        (DEFAULT_WORKER_POOL_NAME, 1),
+    ]
+
+
+class GrowOnlyOrchestrator(FakeOrchestrator):
+    def can_scale_down(self) -> bool:
+        return False
+
+
+def test_autoscaler_does_not_scale_down_grow_only_pools(worker: Worker) -> None:
+    context = AuthedServiceContext(server=worker, credentials=worker.verify_key)
+    backend = GrowOnlyOrchestrator({DEFAULT_WORKER_POOL_NAME: 3})
+    autoscaler = WorkerPoolAutoscaler(backend=backend)
+    autoscaler.set_policy(
+        DEFAULT_WORKER_POOL_NAME,
+        AutoscalePolicy(min_workers=1, max_workers=3, scale_down_cooldown_seconds=0),
+    )
+
+    assert autoscaler.step(context) == {}
+    assert backend.calls == []
+
+
+def test_enable_autoscaling(worker: Worker) -> None:
+    root_client = worker.root_client
+
+    res = root_client.api.services.worker_pool.enable_autoscaling(
+        pool_name=DEFAULT_WORKER_POOL_NAME, min_workers=3, max_workers=2
+    )
+    assert isinstance(res, SyftError)
+
+    res = root_client.api.services.worker_pool.enable_autoscaling(
+        pool_name=DEFAULT_WORKER_POOL_NAME, max_workers=2
+    )
+    assert isinstance(res, SyftSuccess)
+    policy = worker.worker_pool_autoscaler.policies[DEFAULT_WORKER_POOL_NAME]
+    assert policy.max_workers == 2
+
+    res = root_client.api.services.worker_pool.disable_autoscaling(
+        pool_name=DEFAULT_WORKER_POOL_NAME
+    )
+    assert isinstance(res, SyftSuccess)
+    assert not worker.worker_pool_autoscaler.policies
+    worker.worker_pool_autoscaler.stop()
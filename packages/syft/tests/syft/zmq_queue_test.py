@@ -1,18 +1,24 @@
 # stdlib
 from collections import defaultdict
+import heapq
 from secrets import token_hex
 import sys
 from time import sleep
+from types import SimpleNamespace
 
 # third party
 from faker import Faker
 import pytest
+from result import Ok
 from zmq import Socket
 
 # syft absolute
 import syft
 from syft.service.queue.base_queue import AbstractMessageHandler
 from syft.service.queue.queue import QueueManager
+from syft.service.queue.zmq_queue import QueueDependencyIndex
+from syft.service.queue.zmq_queue import Service
+from syft.service.queue.zmq_queue import Timeout
 from syft.service.queue.zmq_queue import ZMQClient
 from syft.service.queue.zmq_queue import ZMQClientConfig
 from syft.service.queue.zmq_queue import ZMQConsumer
@@ -20,6 +26,7 @@ from syft.service.queue.zmq_queue import ZMQProducer
 from syft.service.queue.zmq_queue import ZMQQueueConfig
 from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 from syft.util.util import get_random_available_port
 
@@ -276,3 +283,106 @@ def test_zmq_client_serde():
     deser = syft.deserialize(bytes_data, from_bytes=True)
 
     assert type(deser) == type(client)
+
+
+class MockWorkerStash:
+    def __init__(self, to_be_deleted=()):
+        self.to_be_deleted = list(to_be_deleted)
+        self.lookups = 0
+
+    def get_by_uid(self, credentials, uid):
+        self.lookups += 1
+        return Ok(SimpleNamespace(id=uid, to_be_deleted=False))
+
+    def get_to_be_deleted(self, credentials):
+        return Ok(self.to_be_deleted)
+
+    def update_consumer_state(self, credentials, worker_uid, consumer_state):
+        return Ok("")
+
+
+def test_zmq_producer_purge_workers(producer, monkeypatch) -> None:
+    purged = []
+    monkeypatch.setattr(
+        producer, "_purge_worker", lambda worker, _: purged.append(worker)
+    )
+    producer.auth_context = SimpleNamespace(credentials=None)
+    producer.worker_stash = MockWorkerStash()
+    producer.worker_stash.partition = SimpleNamespace(root_verify_key=None)
+
+    service = Service("service")
+    workers = []
+    for i in range(3):
+        worker = producer.require_worker(f"worker-{i}".encode())
+        worker.service = service
+        worker.syft_worker_id = UID()
+        producer.worker_waiting(worker)
+        workers.append(worker)
+    assert len({id(worker.expiry_t) for worker in workers}) == 3
+    producer.worker_stash.lookups = 0
+
+    # nothing expired, no worker is loaded from the stash
+    producer.purge_workers()
+    assert purged == [] and producer.worker_stash.lookups == 0
+
+    # the first worker misses its heartbeats, the second one sends one in time
+    producer.worker_stash.lookups = 0
+    for worker in workers[:2]:
+        worker.expiry_t._Timeout__next_ts = Timeout.now() - 1
+        heapq.heappush(producer.expiry_heap, (worker.get_expiry(), worker.identity))
+    producer.worker_waiting(workers[1])
+
+    producer.purge_workers()
+    assert purged == [workers[0]]
+    assert producer.worker_stash.lookups == 1
+
+    # workers marked for deletion are purged on the next deletion check
+    producer.worker_stash.to_be_deleted = [
+        SimpleNamespace(id=workers[2].syft_worker_id, to_be_deleted=True)
+    ]
+    producer.deletion_check_t._Timeout__next_ts = 0
+    producer.purge_workers()
+    assert purged == [workers[0], workers[2]]
+    assert producer.liveness["workers"] == 3
+
+
+def test_queue_dependency_index() -> None:
+    a, b, c = UID(), UID(), UID()
+    # input -> inputs that are still unresolved when looking it up
+    state = {a: {a}, b: {b}, c: {c}}
+    lookups = []
+
+    def unresolved(arg, missing_is_unresolved=False):
+        if isinstance(arg, UID):
+            lookups.append(arg)
+            return state[arg]
+        return set().union(*(state[uid] for uid in arg))
+
+    def item(*inputs):
+        action = SimpleNamespace(args=list(inputs), kwargs={})
+        return SimpleNamespace(id=UID(), kwargs={"action": action})
+
+    index = QueueDependencyIndex(unresolved)
+    first, second, independent = item(a), item(a, b), item()
+    assert not index.is_runnable(first)
+    assert not index.is_runnable(second)
+    assert index.is_runnable(independent)
+
+    # every pending input is looked up once, regardless of the waiting items
+    index.refresh()
+    assert sorted(lookups, key=str) == sorted([a, b], key=str)
+
+    # a resolves, but its data holds the unresolved c
+    state[a] = {c}
+    index.refresh()
+    assert not index.is_runnable(first)
+    assert index.pending[second.id] == {b, c}
+
+    state[c] = set()
+    index.refresh()
+    assert index.is_runnable(first)
+    assert not index.is_runnable(second)
+
+    index.retain({first.id})
+    assert set(index.pending) == {first.id}
+    assert not index.dependents